@@ -1,14 +1,16 @@
-from pipecaster.cross_validation import *
-
-"""
 from pipecaster.utils import *
 from pipecaster.parallel import *
 from pipecaster.cross_validation import *
-from pipecaster.transform_wrappers import *
 from pipecaster.multichannel_pipeline import *
+from pipecaster.multichannel_dataset import *
+from pipecaster.prediction_cache import *
+from pipecaster.linear_fusion import *
 from pipecaster.channel_scoring import *
 from pipecaster.score_selection import *
+from pipecaster.parameter_sampling import *
 from pipecaster.channel_selection import *
 from pipecaster.ensemble_learning import *
+from pipecaster.inference_bundle import *
+from pipecaster.distillation import *
 from pipecaster.testing_utils import *
-"""
+import pipecaster.transform_wrappers as transform_wrappers
@@ -0,0 +1,95 @@
+"""
+Early-exit cascade inference for soft voting ensembles.
+
+Users will not generally use this module directly.  Cascades are set up by
+calling fit_cascade() on a fitted Ensemble or ChannelEnsemble with a
+SoftVotingClassifier meta-predictor.
+"""
+
+import time
+import numpy as np
+
+__all__ = ['to_probs', 'calibrate_cascade', 'cascade_soft_vote',
+           'time_transforms']
+
+
+def to_probs(output, n_classes):
+    # restore the negative class probabilities dropped from binary outputs
+    if n_classes == 2 and output.shape[1] == 1:
+        return np.concatenate([1 - output, output], axis=1)
+    return output
+
+
+def calibrate_cascade(meta_X, widths, order, weights, n_classes, tolerance):
+    """
+    Find the lowest confidence threshold at which early exits from a soft
+    voting cascade change at most a tolerance fraction of the predictions
+    made by the full ensemble.
+    """
+    if len(order) < 2:
+        return np.inf
+    bounds = np.cumsum([0] + list(widths))
+    sums = np.zeros((meta_X.shape[0], n_classes))
+    weight_sum = 0
+    confidences, decisions = [], []
+    for i in order:
+        sums += weights[i] * to_probs(meta_X[:, bounds[i]:bounds[i + 1]],
+                                      n_classes)
+        weight_sum += weights[i]
+        confidences.append(np.max(sums, axis=1) / weight_sum)
+        decisions.append(np.argmax(sums, axis=1))
+    confidences = np.stack(confidences[:-1], axis=1)
+    disagreements = np.stack([d != decisions[-1] for d in decisions[:-1]],
+                             axis=1)
+
+    thresholds = np.unique(confidences)
+    if len(thresholds) > 256:
+        thresholds = np.unique(np.quantile(confidences,
+                                           np.linspace(0, 1, 256)))
+    for threshold in thresholds:
+        exits = confidences >= threshold
+        exit_stages = np.argmax(exits, axis=1)
+        has_exit = exits[np.arange(len(exits)), exit_stages]
+        changed = disagreements[np.arange(len(exits)), exit_stages] & has_exit
+        if np.mean(changed) <= tolerance:
+            return threshold
+    return np.inf
+
+
+def cascade_soft_vote(transform, order, weights, n_classes, threshold,
+                      n_samples):
+    """
+    Average class probabilities over the models in cascade order, dropping
+    each sample once its partial average is confident enough.
+
+    transform(i, rows) returns the probabilities of model i for the rows.
+    """
+    probs = np.zeros((n_samples, n_classes))
+    sums = np.zeros((n_samples, n_classes))
+    weight_sum = 0
+    rows = np.arange(n_samples)
+    for stage, i in enumerate(order):
+        sums[rows] += weights[i] * to_probs(transform(i, rows), n_classes)
+        weight_sum += weights[i]
+        partial = sums[rows] / weight_sum
+        if stage == len(order) - 1:
+            probs[rows] = partial
+            break
+        is_done = np.max(partial, axis=1) >= threshold
+        probs[rows[is_done]] = partial[is_done]
+        rows = rows[~is_done]
+        if len(rows) == 0:
+            break
+    return probs
+
+
+def time_transforms(models, Xs):
+    """
+    Transform with each model, recording the outputs and the elapsed times.
+    """
+    outputs, costs = [], []
+    for model, X in zip(models, Xs):
+        start = time.perf_counter()
+        outputs.append(model.transform(X))
+        costs.append(time.perf_counter() - start)
+    return outputs, costs
@@ -0,0 +1,134 @@
+"""
+Candidate screening for GridSearchEnsemble and SearchEnsemble.
+
+Users will not generally use this module directly.  It provides the lazily
+instantiated predictor grid, the bound on the number of models a score
+selector can keep, and successive halving on class-stratified subsamples.
+"""
+
+import numpy as np
+
+import pipecaster.utils as utils
+import pipecaster.parallel as parallel
+import pipecaster.cross_validation as cross_validation
+from pipecaster.multichannel_dataset import get_rows
+from pipecaster.score_selection import RankScoreSelector
+from pipecaster.score_selection import PctRankScoreSelector
+
+__all__ = ['PredictorGrid', 'get_selection_bound', 'successive_halving']
+
+
+class PredictorGrid:
+    """
+    Sequence of predictors instantiated on demand from a ParameterGrid.
+    """
+
+    def __init__(self, predictor_cls, param_grid):
+        self.predictor_cls = predictor_cls
+        self.param_grid = param_grid
+
+    def __len__(self):
+        return len(self.param_grid)
+
+    def __getitem__(self, index):
+        return self.predictor_cls(**self.param_grid[index])
+
+    def __iter__(self):
+        for params in self.param_grid:
+            yield self.predictor_cls(**params)
+
+
+def get_selection_bound(score_selector, n_items):
+    """
+    Get the most items a score selector can select, or None if the number
+    depends on the score values.
+    """
+    if type(score_selector) == RankScoreSelector:
+        return min(score_selector.k, n_items)
+    elif type(score_selector) == PctRankScoreSelector:
+        k = max(int(n_items * score_selector.pct / 100.0), 1)
+        return min(max(k, score_selector.n_min), n_items)
+    else:
+        return None
+
+
+def _halving_job(predictor, X, y, train_indices, test_indices, scorer,
+                 fit_params):
+    model = utils.get_clone(predictor)
+    model.fit(get_rows(X, train_indices), y[train_indices], **fit_params)
+    return scorer(y[test_indices], model.predict(get_rows(X, test_indices)))
+
+
+def _get_budget_order(y, is_classifier, random_state):
+    """
+    Get a random sample order whose prefixes are stratified by class.
+    """
+    order = random_state.permutation(len(y))
+    if is_classifier:
+        # rank samples by their relative position within their class so that
+        # the classes are interleaved in the final order
+        ranks = np.empty(len(y))
+        for label in np.unique(y):
+            members = order[y[order] == label]
+            ranks[members] = (np.arange(len(members)) + 0.5) / len(members)
+        order = order[np.argsort(ranks[order], kind='stable')]
+    return order
+
+
+def successive_halving(predictors, X, y, cv, scorer, factor, min_samples,
+                       is_classifier, n_processes, fit_params, random_state):
+    """
+    Screen predictors on geometrically increasing subsamples of the data.
+
+    Each rung scores the surviving candidates by cross validation on a
+    subsample of the training set and keeps the top 1/factor of them
+    (and at least factor candidates).  The sample budget is multiplied by
+    factor at each rung, and rungs are added until the final budget would
+    reach the full training set.  Subsamples are drawn with random_state
+    (a np.random.RandomState).
+
+    Returns
+    -------
+    (list, list)
+        Indices of the surviving predictors and a list of rung results, each
+        a dict with 'n_samples', 'candidates', and 'scores' entries.
+    """
+    cv = cross_validation._get_splitter(5 if cv is None else cv,
+                                        is_classifier)
+    n_samples = len(y)
+    n_candidates = len(predictors)
+    n_rungs = (int(np.ceil(np.log(n_candidates / factor) / np.log(factor)))
+               if n_candidates > factor else 0)
+    if min_samples is None:
+        n_classes = len(np.unique(y)) if is_classifier else 1
+        min_samples = 2 * cv.get_n_splits() * n_classes
+    budget = max(min_samples, n_samples // factor ** n_rungs)
+    order = _get_budget_order(y, is_classifier, random_state)
+
+    candidates = list(range(n_candidates))
+    rung_results = []
+    for rung in range(n_rungs):
+        if budget >= n_samples or len(candidates) <= factor:
+            break
+        sample_indices = np.sort(order[:budget])
+        X_rung, y_rung = get_rows(X, sample_indices), y[sample_indices]
+        splits = list(cv.split(X_rung, y_rung))
+        # all candidate-split fits of a rung are submitted as one batch
+        args_list = [(predictors[i], X_rung, y_rung, train_indices,
+                      test_indices, scorer, fit_params)
+                     for i in candidates
+                     for train_indices, test_indices in splits]
+        split_scores = parallel._starmap_jobs(
+                            _halving_job, args_list, n_processes,
+                            [X_rung, y_rung, scorer, fit_params])
+        scores = np.mean(np.reshape(split_scores, (len(candidates), -1)),
+                         axis=1)
+        rung_results.append({'n_samples': budget, 'candidates': candidates,
+                             'scores': list(scores)})
+        n_keep = max(factor, int(np.ceil(len(candidates) / factor)))
+        ranking = np.argsort(-np.nan_to_num(scores, nan=-np.inf),
+                             kind='stable')
+        candidates = [candidates[i] for i in sorted(ranking[:n_keep])]
+        budget *= factor
+
+    return candidates, rung_results
@@ -0,0 +1,132 @@
+"""
+Warm-start paths for GridSearchEnsemble.
+
+Users will not generally use this module directly.  Grid points that differ
+only in one path parameter (e.g. n_estimators) are fit by warm-starting a
+single model along the path of values instead of fitting each point from
+scratch.
+"""
+
+import copy
+import numpy as np
+
+import pipecaster.utils as utils
+import pipecaster.transform_wrappers as transform_wrappers
+import pipecaster.cross_validation as cross_validation
+from pipecaster.multichannel_dataset import get_rows
+
+__all__ = ['warm_start_path_params', 'get_warm_start_param', 'fit_path']
+
+# parameters that can be walked with warm_start, and the direction of the
+# walk (True: ascending values)
+warm_start_path_params = {'n_estimators': True, 'max_iter': True,
+                          'C': True, 'alpha': False}
+
+
+def get_warm_start_param(predictor, param_dict):
+    """
+    Find a grid axis that the predictor can walk with warm starts.
+    """
+    if 'warm_start' not in predictor.get_params():
+        return None
+    for param in warm_start_path_params:
+        if param in param_dict and len(param_dict[param]) > 1:
+            return param
+    return None
+
+
+def _walk_path(predictor, path_param, path_values, X, y, fit_params):
+    """
+    Yield a single model warm-started along a path of parameter values.
+    """
+    model = utils.get_clone(predictor)
+    model.set_params(warm_start=True)
+    previous = 0
+    for value in path_values:
+        # iterative solvers run max_iter more iterations from a warm start
+        step = value - previous if path_param == 'max_iter' else value
+        model.set_params(**{path_param: step})
+        model.fit(X, y, **fit_params)
+        model.set_params(**{path_param: value})
+        previous = value
+        yield model
+
+
+def _format_outputs(X_t, is_classifier):
+    # convert output arrays to matrices and drop redundant binary probs
+    if len(X_t.shape) == 1:
+        return X_t.reshape(-1, 1)
+    elif len(X_t.shape) == 2 and X_t.shape[1] == 2 and is_classifier:
+        return X_t[:, 1].reshape(-1, 1)
+    return X_t
+
+
+def fit_path(predictors, path_param, X, y, internal_cv, base_predict_method,
+             cv_processes, scorer, fit_params, transform):
+    """
+    Fit predictors that differ only in the value of path_param by
+    warm-starting one model per internal cv split (and one on the full
+    training set) along the path of values, in the order given.
+
+    Returns
+    -------
+    list
+        Tuples of (model, predictions, cv_predictions, score) like those
+        returned by Ensemble._fit_job(), one per predictor.
+    """
+    path_values = [p.get_params()[path_param] for p in predictors]
+    is_classifier = utils.is_classifier(predictors[0]) is True
+    if base_predict_method == 'auto':
+        transform_method = transform_wrappers.get_transform_method(
+                                                            predictors[0])
+    else:
+        transform_method = base_predict_method
+
+    cv_predictions = [None for v in path_values]
+    scores = [None for v in path_values]
+    if internal_cv is not None:
+        cv = cross_validation._get_splitter(internal_cv, is_classifier)
+        outputs = [None for v in path_values]
+        y_preds = [None for v in path_values]
+        splits = cross_validation._split_indices(cv, X, y)
+        for train_indices, test_indices in splits:
+            X_test = get_rows(X, test_indices)
+            for i, model in enumerate(_walk_path(
+                    predictors[0], path_param, path_values,
+                    get_rows(X, train_indices), y[train_indices],
+                    fit_params)):
+                X_t = getattr(model, transform_method)(X_test)
+                y_pred = model.predict(X_test)
+                if outputs[i] is None:
+                    outputs[i] = np.empty((len(y),) + X_t.shape[1:],
+                                          dtype=X_t.dtype)
+                    y_preds[i] = np.empty(len(y), dtype=y_pred.dtype)
+                outputs[i][test_indices] = X_t
+                y_preds[i][test_indices] = y_pred
+        cv_predictions = [_format_outputs(X_t, is_classifier)
+                          for X_t in outputs]
+        scores = [scorer(y, y_pred) for y_pred in y_preds]
+
+    results = []
+    for i, model in enumerate(_walk_path(predictors[0], path_param,
+                                         path_values, X, y, fit_params)):
+        fitted_model = copy.deepcopy(model)
+        fitted_model.set_params(
+            warm_start=predictors[i].get_params()['warm_start'])
+        if internal_cv is None:
+            wrapper = transform_wrappers.SingleChannel(predictors[i],
+                                                       base_predict_method)
+        else:
+            wrapper = transform_wrappers.SingleChannelCV(
+                                    predictors[i], base_predict_method,
+                                    internal_cv, cv_processes,
+                                    score_method='predict', scorer=scorer)
+            wrapper.score_ = scores[i]
+        wrapper.model = fitted_model
+        if is_classifier:
+            wrapper.classes_ = fitted_model.classes_
+        wrapper._set_predictor_interface(
+            utils.get_predict_methods(fitted_model))
+        predictions = wrapper.transform(X) if transform else None
+        results.append((wrapper, predictions, cv_predictions[i], scores[i]))
+    return results
@@ -11,8 +11,11 @@ from sklearn.metrics import explained_variance_score, balanced_accuracy_score
 from sklearn.feature_selection import f_classif
 from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.linear_model import LinearRegression, Ridge, RidgeClassifier
+from sklearn.preprocessing import LabelBinarizer
 
 from pipecaster.cross_validation import cross_val_score
+import pipecaster.cross_validation as cross_validation
 from pipecaster.utils import Cloneable, Saveable
 import pipecaster.utils as utils
 
@@ -63,6 +66,95 @@ class AggregateFeatureScorer(Cloneable, Saveable):
             return self.aggregator(scores)
 
 
+def _get_linear_probe_alpha(probe):
+    """
+    Get the ridge penalty of a probe with a closed-form solution (0 for
+    least squares), or None if the probe has no fast cv path.
+    """
+    params = probe.get_params()
+    if params.get('positive', False) is not False:
+        return None
+    if type(probe) == LinearRegression:
+        return 0.0
+    if type(probe) in (Ridge, RidgeClassifier):
+        if (params.get('class_weight', None) is not None
+                or np.ndim(params['alpha']) != 0):
+            return None
+        return float(params['alpha'])
+    return None
+
+
+def _linear_cv_predict(X, Y, splits, alpha, fit_intercept):
+    """
+    Get the out-of-fold outputs of ridge (alpha > 0) or least squares
+    (alpha = 0) models from sufficient statistics.
+
+    The Gram matrix XᵀX, the moments XᵀY, and the column sums are computed
+    once.  Each fold's training statistics are the totals minus the fold's
+    own statistics, so all fold solutions cost one pass over the data and a
+    batch of small solves.  Intercepts are fit by centering the training
+    statistics, as in scikit-learn.  Leave-one-out ridge cv uses the exact
+    hat matrix shortcut instead of per-sample solves.
+
+    Returns
+    -------
+    ndarray.shape(n_samples, n_targets)
+        Out-of-fold predictions.
+    """
+    X = np.asarray(X, dtype=float)
+    Y = np.asarray(Y, dtype=float).reshape(len(Y), -1)
+    n_samples, n_features = X.shape
+    penalty = alpha * np.eye(n_features)
+
+    if alpha > 0 and len(splits) == n_samples and all(
+            [len(test_indices) == 1 for _, test_indices in splits]):
+        X_mean, Y_mean = X.mean(axis=0), Y.mean(axis=0)
+        if fit_intercept is True:
+            X, Y = X - X_mean, Y - Y_mean
+        inverse = np.linalg.inv(X.T @ X + penalty)
+        residuals = Y - X @ (inverse @ (X.T @ Y))
+        leverages = np.einsum('ij,jk,ik->i', X, inverse, X)
+        if fit_intercept is True:
+            leverages += 1 / n_samples
+        return (Y - residuals / (1 - leverages)[:, np.newaxis]
+                + (Y_mean if fit_intercept is True else 0))
+
+    gram, moments = X.T @ X, X.T @ Y
+    X_sum, Y_sum = X.sum(axis=0), Y.sum(axis=0)
+    fold_grams, fold_moments, fold_offsets = [], [], []
+    for _, test_indices in splits:
+        X_test, Y_test = X[test_indices], Y[test_indices]
+        n_train = n_samples - len(test_indices)
+        train_gram = gram - X_test.T @ X_test
+        train_moments = moments - X_test.T @ Y_test
+        if fit_intercept is True:
+            X_mean = (X_sum - X_test.sum(axis=0)) / n_train
+            Y_mean = (Y_sum - Y_test.sum(axis=0)) / n_train
+            train_gram = train_gram - n_train * np.outer(X_mean, X_mean)
+            train_moments = (train_moments
+                             - n_train * np.outer(X_mean, Y_mean))
+            fold_offsets.append((X_mean, Y_mean))
+        fold_grams.append(train_gram + penalty)
+        fold_moments.append(train_moments)
+
+    if alpha > 0:
+        coefs = np.linalg.solve(np.array(fold_grams), np.array(fold_moments))
+    else:
+        # minimum norm solutions for rank deficient training sets
+        coefs = [np.linalg.lstsq(G, g, rcond=None)[0]
+                 for G, g in zip(fold_grams, fold_moments)]
+
+    predictions = np.empty(Y.shape)
+    for i, (_, test_indices) in enumerate(splits):
+        if fit_intercept is True:
+            X_mean, Y_mean = fold_offsets[i]
+            predictions[test_indices] = ((X[test_indices] - X_mean)
+                                         @ coefs[i] + Y_mean)
+        else:
+            predictions[test_indices] = X[test_indices] @ coefs[i]
+    return predictions
+
+
 class CvPerformanceScorer(Cloneable, Saveable):
     """
     Channel scorer that computes performance of a predictor probe using cross
@@ -97,8 +189,15 @@ class CvPerformanceScorer(Cloneable, Saveable):
           CPUs.
         - If int > 1: Run each split in a different process, using up to
           cv_processes number of CPUs.
+    fast_cv : bool, default=True
+        If True, LinearRegression, Ridge, and RidgeClassifier probes with
+        default-type settings are cross validated in closed form from the
+        Gram matrix of X, which gives the same fold models without
+        refitting.  Other probes, sparse inputs, and calls with fit_params
+        use standard cross validation.
     """
-    def __init__(self, predictor_probe, cv=5, scorer='auto', cv_processes=1):
+    def __init__(self, predictor_probe, cv=5, scorer='auto', cv_processes=1,
+                 fast_cv=True):
         self._params_to_attributes(CvPerformanceScorer.__init__, locals())
         if scorer == 'auto':
             if utils.is_classifier(predictor_probe):
@@ -125,9 +224,38 @@ class CvPerformanceScorer(Cloneable, Saveable):
         """
         if X is None:
             return None
+        alpha = (_get_linear_probe_alpha(self.predictor_probe)
+                 if self.fast_cv is True else None)
+        if (alpha is not None and isinstance(X, np.ndarray)
+                and len(fit_params) == 0):
+            return np.mean(self._fast_cv_scores(X, y, alpha))
         else:
             scores = cross_val_score(self.predictor_probe, X, y,
-                                     scorer=self.scorer, cv=self.cv,
+                                     scorers=self.scorer, cv=self.cv,
                                      n_processes=self.cv_processes,
                                      **fit_params)
             return np.mean(scores)
+
+    def _fast_cv_scores(self, X, y, alpha):
+        """
+        Score the cv splits of a linear probe with closed-form fold models.
+        """
+        y = np.asarray(y)
+        splits = cross_validation._get_splits(self.predictor_probe, X, y,
+                                              None, self.cv)
+        fit_intercept = self.predictor_probe.get_params()['fit_intercept']
+        if utils.is_classifier(self.predictor_probe):
+            binarizer = LabelBinarizer(pos_label=1, neg_label=-1)
+            Y = binarizer.fit_transform(y)
+            outputs = _linear_cv_predict(X, Y, splits, alpha, fit_intercept)
+            if outputs.shape[1] == 1:
+                indices = (outputs[:, 0] > 0).astype(int)
+            else:
+                indices = np.argmax(outputs, axis=1)
+            predictions = binarizer.classes_[indices]
+        else:
+            predictions = _linear_cv_predict(X, y, splits, alpha,
+                                             fit_intercept)
+            predictions = predictions.reshape(y.shape)
+        return [self.scorer(y[test_indices], predictions[test_indices])
+                for _, test_indices in splits]
@@ -162,11 +162,18 @@ class ChannelSelector(Cloneable, Saveable):
     def get_selection_indices(self):
         return self.selected_indices_
 
-    def get_clone(self):
+    def get_output_mask(self, Xs):
+        """
+        Get a list of bools indicating which channels output a matrix.
+        """
+        return [i in self.selected_indices_ and X is not None
+                for i, X in enumerate(Xs)]
+
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'selected_indices_'):
             clone.selected_indices_ = self.selected_indices_.copy()
         if hasattr(self, 'channel_scores_'):
@@ -3,6 +3,8 @@ Cross validation functions supporting both MultichannelPipeline and
 scikit-learn predictors.
 """
 
+from collections import OrderedDict
+import hashlib
 import numpy as np
 import scipy.sparse as sp
 
@@ -13,44 +15,249 @@ from sklearn.model_selection import KFold, StratifiedKFold, GroupKFold
 
 import pipecaster.utils as utils
 import pipecaster.parallel as parallel
+from pipecaster.multichannel_dataset import get_rows
 
-__all__ = ['cross_val_score', 'cross_val_predict']
+__all__ = ['cross_val_score', 'cross_val_predict', 'clear_split_cache']
+
+# (train_indices, test_indices) lists of recent cv splits, keyed on the
+# splitter parameters and the sample count, y, and groups fingerprints
+_split_cache = OrderedDict()
+_split_cache_size = 32
 
 
 def _fit_predict_split(predictor, Xs, y, train_indices, test_indices,
-                    predict_method_names, fit_params):
+                    predict_method_names, fit_params, return_model=False):
         """
         Clone, fit, and predict a single channel or multichannel pipe.
+
+        Row subsets are gathered inside the job, one split at a time, and are
+        views of the input matrices whenever the split indices are
+        contiguous (e.g. unshuffled KFold test splits).  MultichannelDataset
+        inputs are gathered in a single pass over the column-block store.
         """
-        model = utils.get_clone(predictor)
+        model = utils.get_clone(predictor, copy_on_write=True)
         fit_params = {} if fit_params is None else fit_params
 
-        if utils.is_multichannel(model):
-            X_trains = [X[train_indices] if X is not None else None
-                        for X in Xs]
-            model.fit(X_trains, y[train_indices], **fit_params)
-        else:
-            model.fit(Xs[train_indices], y[train_indices], **fit_params)
-
-        split_results = {}
-        for predict_method_name in predict_method_names:
-            predict_method = getattr(model, predict_method_name)
-            if utils.is_multichannel(model):
-                X_tests = [X[test_indices] if X is not None else None
-                           for X in Xs]
-                split_results[predict_method_name] = predict_method(X_tests)
-            else:
-                split_results[predict_method_name] = predict_method(
-                                                        Xs[test_indices])
+        X_trains = get_rows(Xs, train_indices)
+        y_train = y[train_indices] if y is not None else None
+        model.fit(X_trains, y_train, **fit_params)
+        # release the training set copies before gathering the test set
+        del X_trains
+
+        X_tests = get_rows(Xs, test_indices)
 
+        # upstream transforms are shared by all of the prediction methods
+        split_results = utils.predict_with_methods(model, X_tests,
+                                                   predict_method_names)
         split_results['indices'] = test_indices
+        if return_model is True:
+            split_results['model'] = model
 
         return split_results
 
 
+def clear_split_cache():
+    """
+    Release the cached cv split indices.
+    """
+    _split_cache.clear()
+
+
+def _fingerprint(a):
+    """
+    Get a hashable digest of an array, or None if the array is not hashable
+    by value.
+    """
+    if a is None:
+        return 'none'
+    a = np.asarray(a)
+    if a.dtype.hasobject:
+        return None
+    digest = hashlib.sha1(np.ascontiguousarray(a).tobytes()).hexdigest()
+    return (a.shape, a.dtype.str, digest)
+
+
+def _get_split_key(cv, n_samples, y, groups):
+    """
+    Get the split cache key for a splitter, or None if its splits can't be
+    reused (e.g. unseeded shuffles or splitters with unknown state).
+    """
+    if hasattr(cv, 'get_params'):
+        params = cv.get_params()
+    elif type(cv).__module__.startswith('sklearn.model_selection'):
+        params = vars(cv)
+    else:
+        return None
+    shuffles = (params.get('shuffle', False) is True
+                or 'test_size' in params or 'n_repeats' in params)
+    random_state = params.get('random_state', None)
+    if shuffles and isinstance(random_state, (int, np.integer)) is False:
+        return None
+    param_keys = []
+    for name in sorted(params):
+        value = params[name]
+        value = (_fingerprint(value) if isinstance(value, np.ndarray)
+                 else repr(value))
+        param_keys.append((name, value))
+    keys = [_fingerprint(y), _fingerprint(groups)] + param_keys
+    if any([k is None for k in keys]):
+        return None
+    return (type(cv).__module__, type(cv).__name__, n_samples, tuple(keys))
+
+
+def _split_indices(cv, X, y=None, groups=None):
+    """
+    Get the (train_indices, test_indices) of each split made by a splitter,
+    reusing the read-only index arrays of earlier calls with the same
+    splitter parameters, y, and groups.
+    """
+    n_samples = X.shape[0] if hasattr(X, 'shape') else len(X)
+    key = _get_split_key(cv, n_samples, y, groups)
+    if key is not None and key in _split_cache:
+        _split_cache.move_to_end(key)
+        return list(_split_cache[key])
+
+    splits = list(cv.split(X, y, groups))
+    if key is not None:
+        for indices in splits:
+            for a in indices:
+                a.setflags(write=False)
+        _split_cache[key] = tuple(splits)
+        while len(_split_cache) > _split_cache_size:
+            _split_cache.popitem(last=False)
+    return splits
+
+
+def _get_splitter(cv, is_classifier):
+    """
+    Convert an int cv parameter into a KFold or StratifiedKFold splitter.
+    """
+    if type(cv) == int:
+        return (StratifiedKFold(n_splits=cv) if is_classifier
+                else KFold(n_splits=cv))
+    return cv
+
+
+def _get_splits(predictor, Xs, y, groups, cv):
+    """
+    Get the (train_indices, test_indices) of each cv split.  Splits are
+    cached, so channels and base predictors with the same y and groups share
+    one set of index arrays.
+    """
+    cv = int(5) if cv is None else cv
+
+    if type(cv) == int:
+        if groups is not None:
+            cv = GroupKFold(n_splits=cv)
+        else:
+            if utils.is_classifier(predictor):
+                cv = StratifiedKFold(n_splits=cv)
+            else:
+                cv = KFold(n_splits=cv)
+
+    is_multichannel = utils.is_multichannel(predictor)
+    if is_multichannel:
+        live_Xs = [X for X in Xs if X is not None]
+        return _split_indices(cv, live_Xs[0], y, groups)
+    else:
+        return _split_indices(cv, Xs, y, groups)
+
+
+def _get_n_samples(predictor, Xs):
+    """
+    Get the number of samples in the input of cross_val_predict().
+    """
+    if utils.is_multichannel(predictor):
+        return [X for X in Xs if X is not None][0].shape[0]
+    else:
+        return Xs.shape[0] if hasattr(Xs, 'shape') else len(Xs)
+
+
+def _check_partition(splits, n_samples):
+    """
+    Raise a ValueError unless the test indices of the splits cover each
+    sample exactly once, as required to combine out-of-fold predictions.
+    """
+    counts = np.bincount(np.concatenate([test for _, test in splits]),
+                         minlength=n_samples)
+    if len(counts) != n_samples or np.any(counts != 1):
+        raise ValueError('combine_splits=True requires test splits that '
+                         'partition the samples (each sample in exactly one '
+                         'test split)')
+
+
+def _scatter_split(outputs, split_result, predict_methods, classes_,
+                   n_samples):
+    """
+    Write the predictions of one split into the out-of-fold output arrays
+    at its test indices, allocating the outputs on the first call.
+    """
+    test_indices = split_result['indices']
+    for method in predict_methods:
+        predictions = split_result[method]
+        if classes_ is not None and method == 'predict':
+            predictions = classes_[predictions]
+        if outputs.get(method) is None:
+            outputs[method] = np.empty(
+                (n_samples,) + predictions.shape[1:], dtype=predictions.dtype)
+        outputs[method][test_indices] = predictions
+
+
+def _combine_split_results(split_results, predict_methods, classes_,
+                           combine_splits, return_models, n_samples=None):
+    """
+    Assemble the results of _fit_predict_split() jobs into the outputs of
+    cross_val_predict().  classes_ decodes the class predictions of
+    classifiers (None for regressors).
+
+    When combining splits, split_results may be an iterator that yields
+    results as they complete.  Each result is scattered into preallocated
+    out-of-fold arrays and released, so peak memory is one output array per
+    prediction method plus one split.  n_samples sets the output length
+    (default: total number of test indices).  The test indices must
+    partition the samples (see _check_partition()).
+    """
+    if combine_splits is False:
+        split_results = list(split_results)
+        if return_models is True:
+            models = [res['model'] for res in split_results]
+        # reorganize so splits are in lists
+        predictions = {k:[res[k] for res in split_results]
+                       for k in predict_methods + ['indices']}
+        # decode classes where necessary
+        if classes_ is not None and 'predict' in predict_methods:
+            predictions['predict'] = [classes_[p]
+                                      for p in predictions['predict']]
+    else:
+        if isinstance(split_results, list):
+            if n_samples is None:
+                n_samples = sum([len(res['indices'])
+                                 for res in split_results])
+            # consume the list so each split is released once scattered
+            pending = split_results[::-1]
+            split_results = (pending.pop() for i in range(len(pending)))
+        outputs, models = {}, []
+        for split_result in split_results:
+            _scatter_split(outputs, split_result, predict_methods, classes_,
+                           n_samples)
+            if return_models is True:
+                models.append(split_result['model'])
+            del split_result
+        if len(predict_methods) == 1:
+            predictions = outputs[predict_methods[0]]
+        else:
+            predictions = {m:outputs[m] for m in predict_methods}
+
+    if return_models is True:
+        return predictions, models
+    else:
+        return predictions
+
+
 def cross_val_predict(predictor, Xs, y=None, groups=None,
                       predict_methods=['predict'], cv=None,
-                      combine_splits=True, n_processes=1, fit_params=None):
+                      combine_splits=True, n_processes=1, fit_params=None,
+                      return_models=False):
     """
     Analog of the scikit-learn cross_val_predict function that supports both
     single and multichannel cross validation.
@@ -76,7 +283,10 @@ def cross_val_predict(predictor, Xs, y=None, groups=None,
         - If None or 5: Use 5 splits with the default split generator.
         - If callable: Assumes interface like Kfold scikit-learn.
     combine_splits : bool, default=True
-        - If True: Concatenate results for splits into a single array.
+        - If True: Scatter results for splits into a single out-of-fold
+          array in sample order.  The test splits must partition the
+          samples (e.g. not RepeatedKFold or ShuffleSplit), otherwise a
+          ValueError is raised.
         - If False: Return results for separate splits.
     n_processes : int or 'max', default=1
         - If 1: Run all split computations in a single process.
@@ -86,6 +296,9 @@ def cross_val_predict(predictor, Xs, y=None, groups=None,
           n_processes number of CPUs.
     fit_params : dict, default={}
         Auxiliary parameters sent to pipe fit_transform and fit methods.
+    return_models : bool, default=False
+        - If True: Also return the models fit on the training splits.
+        - If False: Discard the split models.
 
     Returns
     -------
@@ -102,6 +315,9 @@ def cross_val_predict(predictor, Xs, y=None, groups=None,
           'indices' entry containing a list of the sample indices for each
           split relative to the order in which they were provided in the Xs
           parameter.
+        - If return_models is True:
+          Returns a tuple of the predictions described above and a list of the
+          fitted split models, one per split.
 
     Examples
     --------
@@ -118,33 +334,20 @@ def cross_val_predict(predictor, Xs, y=None, groups=None,
 
         predictions = pc.cross_val_predict(clf, Xs, y)
     """
-    is_classifier = utils.is_classifier(predictor)
-    if is_classifier and y is not None:
+    classes_ = None
+    if utils.is_classifier(predictor) and y is not None:
         classes_, y = np.unique(y, return_inverse=True)
 
     if isinstance(predict_methods, (tuple, list, np.ndarray)) is False:
         predict_methods = [predict_methods]
 
-    cv = int(5) if cv is None else cv
-
-    if type(cv) == int:
-        if groups is not None:
-            cv = GroupKFold(n_splits=cv)
-        else:
-            if utils.is_classifier(predictor):
-                cv = StratifiedKFold(n_splits=cv)
-            else:
-                cv = KFold(n_splits=cv)
-
-    is_multichannel = utils.is_multichannel(predictor)
-    if is_multichannel:
-        live_Xs = [X for X in Xs if X is not None]
-        splits = list(cv.split(live_Xs[0], y, groups))
-    else:
-        splits = list(cv.split(Xs, y, groups))
+    splits = _get_splits(predictor, Xs, y, groups, cv)
+    n_samples = _get_n_samples(predictor, Xs)
+    if combine_splits is True:
+        _check_partition(splits, n_samples)
 
     args_list = [(predictor, Xs, y, train_indices, test_indices,
-                  predict_methods, fit_params)
+                  predict_methods, fit_params, return_models)
                  for train_indices, test_indices in splits]
 
     n_jobs = len(args_list)
@@ -155,6 +358,7 @@ def cross_val_predict(predictor, Xs, y=None, groups=None,
     if n_processes == 'max' or n_processes > 1:
         try:
             shared_mem_objects = [Xs, y, fit_params]
+            shared_mem_objects += [a for split in splits for a in split]
             split_results = parallel.starmap_jobs(
                                 _fit_predict_split, args_list,
                                 n_cpus=n_processes,
@@ -165,29 +369,11 @@ def cross_val_predict(predictor, Xs, y=None, groups=None,
             print('defaulting to single processor')
             n_processes = 1
     if n_processes == 1:
-        # print('running a single process with {} jobs'.format(len(args_list)))
-        split_results = [_fit_predict_split(*args) for args in args_list]
-
-    # reorganize so splits are in lists
-    split_results = {k:[res[k] for res in split_results]
-                     for k in predict_methods + ['indices']}
+        # splits are fit as the results are consumed
+        split_results = (_fit_predict_split(*args) for args in args_list)
 
-    # decode classes where necessary
-    if is_classifier and 'predict' in predict_methods:
-        split_results['predict'] = [classes_[p]
-                                    for p in split_results['predict']]
-
-    if combine_splits is True:
-        predictions = []
-        sample_indices = np.concatenate(split_results['indices'])
-        predictions = [np.concatenate(split_results[m])[sample_indices]
-                       for m in  predict_methods]
-        if len(predictions) == 1:
-            return predictions[0]
-        else:
-            return {m:p for m, p in zip(predict_methods, predictions)}
-    else:
-        return split_results
+    return _combine_split_results(split_results, predict_methods, classes_,
+                                  combine_splits, return_models, n_samples)
 
 def score_splits(split_results, y=None, predict_methods=['predict'],
                  scorers='auto'):
@@ -0,0 +1,153 @@
+"""
+Distillation of fitted multichannel pipelines into single student models.
+
+Stacked MultichannelPipelines (e.g. a ChannelEnsemble with a meta-predictor)
+evaluate tens of models for every prediction.  :func:`distill` trains one
+compact student predictor on the concatenated live channels to reproduce the
+outputs of a fitted teacher pipeline, trading a small loss of accuracy for
+much faster inference.
+
+Examples
+--------
+::
+
+    from sklearn.ensemble import GradientBoostingClassifier
+    from sklearn.linear_model import LogisticRegression
+    import pipecaster as pc
+
+    Xs, y, _ = pc.make_multi_input_classification(n_informative_Xs=3,
+                                                  n_random_Xs=7)
+    teacher = pc.MultichannelPipeline(n_channels=10)
+    teacher.add_layer(pc.ChannelEnsemble(GradientBoostingClassifier(),
+                                         pc.SoftVotingClassifier()))
+    teacher.fit(Xs, y)
+    student, fidelity = pc.distill(teacher, Xs, LogisticRegression(),
+                                   n_perturbations=2, random_state=0)
+    student.predict(Xs)
+"""
+
+import numpy as np
+from sklearn.metrics import explained_variance_score
+
+import pipecaster.utils as utils
+from pipecaster.multichannel_pipeline import MultichannelPipeline
+from pipecaster.ensemble_learning import MultichannelPredictor
+
+__all__ = ['distill', 'get_fidelity']
+
+
+def _perturb(Xs, noise_scale, random_state):
+    """
+    Add Gaussian noise scaled by the per-feature standard deviations, drawn
+    from the RandomState random_state.
+    """
+    return [X + random_state.normal(loc=0, scale=noise_scale * np.std(X, axis=0),
+                                 size=X.shape)
+            if X is not None else None for X in Xs]
+
+
+def get_fidelity(teacher, student, Xs):
+    """
+    Measure how closely a student pipeline reproduces a teacher pipeline.
+
+    Parameters
+    ----------
+    teacher : fit pipe instance
+        Fitted pipeline that makes reference predictions.
+    student : fit pipe instance
+        Fitted pipeline that approximates the teacher.
+    Xs : list
+        List of feature matrices and None spaceholders.
+
+    Returns
+    -------
+    dict
+        - Classifiers: 'agreement', the fraction of samples with the same
+          predicted class, and (when both pipelines have predict_proba)
+          'proba_mae', the mean absolute difference between predicted
+          probabilities.
+        - Regressors: 'explained_variance' of the teacher predictions by the
+          student predictions, and 'mae', the mean absolute difference
+          between predictions.
+    """
+    y_teacher = teacher.predict(Xs)
+    y_student = student.predict(Xs)
+    if utils.is_classifier(teacher):
+        fidelity = {'agreement': np.mean(y_teacher == y_student)}
+        if (hasattr(teacher, 'predict_proba') and
+                hasattr(student, 'predict_proba')):
+            fidelity['proba_mae'] = np.mean(np.abs(
+                teacher.predict_proba(Xs) - student.predict_proba(Xs)))
+    else:
+        fidelity = {'explained_variance':
+                    explained_variance_score(y_teacher, y_student),
+                    'mae': np.mean(np.abs(y_teacher - y_student))}
+    return fidelity
+
+
+def distill(teacher, Xs, student, n_perturbations=0, noise_scale=0.1,
+            Xs_eval=None, random_state=None, **fit_params):
+    """
+    Train a single student predictor to reproduce a fitted pipeline.
+
+    The teacher's predictions on the training samples (plus optional
+    perturbed copies of the training samples) are used as targets to fit the
+    student predictor on the concatenation of the live input channels.
+
+    Parameters
+    ----------
+    teacher : MultichannelPipeline
+        Fitted pipeline to distill.
+    Xs : list
+        List of feature matrices and None spaceholders, typically the
+        teacher's training data.
+    student : predictor instance
+        Single channel scikit-learn conformant predictor of the same type
+        (classifier or regressor) as the teacher.  It is cloned before
+        fitting.
+    n_perturbations : int, default=0
+        Number of noisy copies of Xs to add to the distillation set.
+        Synthetic samples expose the student to more of the teacher's decision
+        surface than the training samples alone.
+    noise_scale : float, default=0.1
+        Standard deviation of the perturbations in units of each feature's
+        standard deviation.
+    Xs_eval : list or None, default=None
+        - If list : Samples used to measure fidelity (e.g. held out data).
+        - If None : Fidelity is measured on Xs.
+    random_state : int or None, default=None
+        Seed for the perturbations.  The global numpy random state is not
+        used.
+    fit_params : dict, default=None
+        Auxiliary parameters to pass to the fit method of the student.
+
+    Returns
+    -------
+    (MultichannelPipeline, dict)
+        Fitted student pipeline, which takes the same inputs and exposes the
+        same prediction interface as the teacher, and the fidelity metrics
+        returned by get_fidelity().
+    """
+    if ((utils.is_classifier(teacher) is True) !=
+            (utils.is_classifier(student) is True)):
+        raise TypeError('teacher and student must both be classifiers or '
+                        'both be regressors')
+    random_state = np.random.RandomState(random_state)
+
+    distill_Xs = [[X] if X is not None else None for X in Xs]
+    for i in range(n_perturbations):
+        perturbed_Xs = _perturb(Xs, noise_scale, random_state)
+        for channel_Xs, X in zip(distill_Xs, perturbed_Xs):
+            if channel_Xs is not None:
+                channel_Xs.append(X)
+    distill_Xs = [np.concatenate(channel_Xs) if channel_Xs is not None
+                  else None for channel_Xs in distill_Xs]
+    y_teacher = teacher.predict(distill_Xs)
+
+    student_pipeline = MultichannelPipeline(n_channels=len(Xs))
+    student_pipeline.add_layer(MultichannelPredictor(student))
+    student_pipeline.fit(distill_Xs, y_teacher, **fit_params)
+
+    Xs_eval = Xs if Xs_eval is None else Xs_eval
+    fidelity = get_fidelity(teacher, student_pipeline, Xs_eval)
+    return student_pipeline, fidelity
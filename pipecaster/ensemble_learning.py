@@ -5,21 +5,325 @@ Pipeline components for ensemble prediction.
 import numpy as np
 import pandas as pd
 import ray
-import scipy.stats
 import functools
+import heapq
+import itertools
+import time
 
 from sklearn.metrics import explained_variance_score, balanced_accuracy_score
 from sklearn.model_selection import ParameterGrid
+from sklearn.model_selection import train_test_split
 
 import pipecaster.utils as utils
 from pipecaster.utils import Cloneable, Saveable
 import pipecaster.transform_wrappers as transform_wrappers
+from pipecaster.multichannel_dataset import concatenate_channels, get_rows
 from pipecaster.score_selection import RankScoreSelector
 import pipecaster.parallel as parallel
+import pipecaster.linear_fusion as linear_fusion
+import pipecaster.cross_validation as cross_validation
+from pipecaster.parameter_sampling import TPESampler
+import pipecaster._cascade as _cascade
+import pipecaster._screening as _screening
+import pipecaster._warm_start as _warm_start
 
 __all__ = ['SoftVotingClassifier', 'HardVotingClassifier',
            'AggregatingRegressor', 'Ensemble', 'GridSearchEnsemble',
-           'MultichannelPredictor', 'ChannelEnsemble']
+           'SearchEnsemble', 'MultichannelPredictor', 'ChannelEnsemble']
+
+
+def _get_votes(meta_X, n_classes):
+    """
+    Get the base classifier outputs as an array of votes.
+
+    Returns a (n_samples, n_models) array of positive class probabilities for
+    binary classification, otherwise a zero-copy (n_samples, n_models,
+    n_classes) view of the meta-feature matrix when possible.
+    """
+    if n_classes == 2:
+        return meta_X
+    if meta_X.shape[1] % n_classes != 0:
+        raise ValueError(
+            '''Number of meta-features not divisible by number of classes.
+            This can happen if base classifiers were trained on different
+            subsamples with different number of classes.  Pipecaster uses
+            StratifiedKFold to prevent this, but GroupKFold can lead to
+            violations.  Someone need to make StratifiedGroupKFold''')
+    return meta_X.reshape(meta_X.shape[0], -1, n_classes)
+
+
+def _get_vote_weights(weights, n_models, dtype):
+    if weights is None:
+        return None
+    weights = np.asarray(weights, dtype=dtype)
+    if len(weights) != n_models:
+        raise ValueError('Number of voting weights ({}) did not match number '
+                         'of base classifiers ({})'
+                         .format(len(weights), n_models))
+    return weights / np.sum(weights)
+
+
+def _soft_vote(meta_X, n_classes, weights=None):
+    """
+    Average (or weighted average) class probabilities over the models.
+    """
+    votes = _get_votes(meta_X, n_classes)
+    weights = _get_vote_weights(weights, votes.shape[1], votes.dtype)
+    if weights is None:
+        mean_votes = votes.mean(axis=1)
+    else:
+        mean_votes = np.tensordot(votes, weights, axes=([1], [0]))
+    if n_classes == 2:
+        return np.stack([1 - mean_votes, mean_votes], axis=1)
+    return mean_votes
+
+
+def _hard_vote(meta_X, n_classes, weights=None):
+    """
+    Get the (weighted) modal class decision of the models.  Ties go to the
+    class with the lowest index.
+    """
+    votes = _get_votes(meta_X, n_classes)
+    if n_classes == 2:
+        decisions = (votes > 0.5).astype(np.intp)
+    else:
+        decisions = votes.argmax(axis=2)
+    n_samples, n_models = decisions.shape
+    weights = _get_vote_weights(weights, n_models, np.float64)
+    if weights is not None:
+        weights = np.broadcast_to(weights, decisions.shape).ravel()
+    # count the votes for all samples with one bincount
+    bins = decisions + n_classes * np.arange(n_samples)[:, np.newaxis]
+    counts = np.bincount(bins.ravel(), weights=weights,
+                         minlength=n_samples * n_classes)
+    return counts.reshape(n_samples, n_classes).argmax(axis=1)
+
+
+def _vote_in_chunks(vote, meta_X, n_classes, weights, chunk_size):
+    """
+    Apply a voting kernel to blocks of rows to bound temporary memory.
+    """
+    n_samples = meta_X.shape[0]
+    if chunk_size is None or n_samples <= chunk_size:
+        return vote(meta_X, n_classes, weights)
+    return np.concatenate([vote(meta_X[i:i + chunk_size], n_classes, weights)
+                           for i in range(0, n_samples, chunk_size)])
+
+
+def _get_cascade_weights(meta_model, n_models):
+    """
+    Get the soft voting weights used for cascade inference.
+    """
+    if isinstance(meta_model, SoftVotingClassifier) is False:
+        raise ValueError('cascade inference requires a SoftVotingClassifier '
+                         'meta-predictor')
+    if meta_model.weights is None:
+        return np.ones(n_models)
+    return _get_vote_weights(meta_model.weights, n_models, np.float64)
+
+
+def _build_meta_features(outputs, widths, dtype):
+    """
+    Write base model outputs into a preallocated meta-feature matrix.
+
+    Parameters
+    ----------
+    outputs : iterable of ndarray.shape(n_samples, width)
+        Base model outputs.  Generators are consumed one output at a time so
+        that only one output is held in memory alongside the meta-features.
+    widths : list of int
+        Number of columns output by each base model.
+    dtype : numpy dtype
+        Meta-feature dtype.
+
+    Returns
+    -------
+    ndarray.shape(n_samples, sum(widths))
+    """
+    meta_X = None
+    start = 0
+    for output, width in zip(outputs, widths):
+        if meta_X is None:
+            meta_X = np.empty((output.shape[0], sum(widths)), dtype=dtype)
+        meta_X[:, start:start + width] = output
+        start += width
+    return meta_X
+
+
+def _release_outputs(outputs):
+    """
+    Yield the outputs in a list, dropping the list references as they go.
+    """
+    for i in range(len(outputs)):
+        output, outputs[i] = outputs[i], None
+        yield output
+
+
+def _score_meta_predictor(meta_predictor, meta_X, y, cv, scorer):
+    return cross_validation.cross_val_score(meta_predictor, meta_X, y,
+                                            scorers=scorer, cv=cv)
+
+
+def _score_meta_predictors(meta_predictors, meta_X, y, cv, scorer,
+                           n_processes):
+    """
+    Cross validate candidate meta-predictors on cached meta-features.
+    """
+    args_list = [(p, meta_X, y, cv, scorer) for p in meta_predictors]
+    return parallel._starmap_jobs(_score_meta_predictor, args_list,
+                                  n_processes, [meta_X, y, cv, scorer])
+
+
+def _use_flat_cv(internal_cv, blend_split, base_processes):
+    """
+    Determine if base predictor fits and internal cv splits should be run as
+    one flat list of parallel jobs.
+    """
+    if blend_split is not None or internal_cv is None:
+        return False
+    if type(internal_cv) == int and internal_cv < 2:
+        return False
+    return base_processes == 'max' or (type(base_processes) == int and
+                                       base_processes > 1)
+
+
+def _flat_cv_job(wrapper, X, y, train_indices, test_indices,
+                 predict_methods, fit_params):
+    """
+    Fit a SingleChannelCV wrapper on the full training set (train_indices is
+    None) or fit and predict one of its internal cv splits.
+    """
+    if train_indices is None:
+        return wrapper.fit(X, y, **fit_params)
+    return cross_validation._fit_predict_split(
+                wrapper.predictor, X, y, train_indices, test_indices,
+                predict_methods, fit_params)
+
+
+def _fit_flat_cv(wrappers, Xs, y, fit_params, transform, n_processes):
+    """
+    Fit SingleChannelCV wrappers with a single flat list of parallel jobs.
+
+    Each wrapper contributes a full training set fit and a fit for each of
+    its internal cv splits, so that all of the fits share the available
+    processes instead of being spread over nested parallel calls.
+
+    Returns
+    -------
+    list
+        Tuples of (model, predictions, cv_predictions, score) like those
+        returned by Ensemble._fit_job(), or Nones for None inputs.
+    """
+    classes, y_encoded = None, y
+    if any([w._estimator_type == 'classifier' for w in wrappers]):
+        classes, y_encoded = np.unique(y, return_inverse=True)
+
+    args_list, plans = [], []
+    for wrapper, X in zip(wrappers, Xs):
+        if X is None:
+            plans.append(None)
+            continue
+        predict_methods, scorer = wrapper._get_cv_methods(wrapper.predictor)
+        is_classifier = wrapper._estimator_type == 'classifier'
+        y_split = y_encoded if is_classifier else y
+        splits = cross_validation._get_splits(wrapper.predictor, X, y_split,
+                                              None, wrapper.internal_cv)
+        cross_validation._check_partition(splits, len(y))
+        plans.append((len(args_list), len(splits), predict_methods, scorer,
+                      classes if is_classifier else None))
+        args_list.append((wrapper, X, y, None, None, predict_methods,
+                          fit_params))
+        args_list.extend([(wrapper, X, y_split, train_indices, test_indices,
+                           predict_methods, fit_params)
+                          for train_indices, test_indices in splits])
+
+    live_Xs = []
+    for X in Xs:
+        if X is not None and all([X is not X_ for X_ in live_Xs]):
+            live_Xs.append(X)
+    # base predictors with the same y share cached split index arrays
+    split_arrays = []
+    for args in args_list:
+        for a in args[3:5]:
+            if a is not None and all([a is not a_ for a_ in split_arrays]):
+                split_arrays.append(a)
+    results = parallel._starmap_jobs(_flat_cv_job, args_list, n_processes,
+                                     live_Xs + [y, y_encoded, fit_params]
+                                     + split_arrays)
+
+    fit_results = []
+    for X, plan in zip(Xs, plans):
+        if plan is None:
+            fit_results.append((None, None, None, None))
+            continue
+        start, n_splits, predict_methods, scorer, split_classes = plan
+        model = results[start]
+        split_results = results[start + 1:start + 1 + n_splits]
+        cv_predictions = cross_validation._combine_split_results(
+                            split_results, predict_methods, split_classes,
+                            combine_splits=True, return_models=False,
+                            n_samples=len(y))
+        cv_predictions = model._set_cv_outputs(y, cv_predictions,
+                                               predict_methods, scorer)
+        predictions = model.transform(X) if transform else None
+        fit_results.append((model, predictions, cv_predictions,
+                            model.score_))
+    return fit_results
+
+
+def _get_blend_split(y, blend_holdout, is_classifier, random_state=None):
+    """
+    Divide the training samples into sorted train and holdout indices.
+    """
+    stratify = y if is_classifier else None
+    train_indices, holdout_indices = train_test_split(
+        np.arange(len(y)), test_size=blend_holdout, stratify=stratify,
+        random_state=random_state)
+    return np.sort(train_indices), np.sort(holdout_indices)
+
+
+def _fit_blend_job(predictor, X, y, base_predict_method, scorer, fit_params,
+                   blend_split, blend_refit):
+    """
+    Fit a predictor once on the blend training samples, generate
+    meta-features and a score on the holdout samples, and optionally refit
+    on all samples.
+    """
+    train_indices, holdout_indices = blend_split
+    X_holdout = get_rows(X, holdout_indices)
+    model = transform_wrappers.SingleChannel(predictor, base_predict_method)
+    model.fit(get_rows(X, train_indices), y[train_indices], **fit_params)
+    holdout_predictions = model.transform(X_holdout)
+    score = scorer(y[holdout_indices], model.predict(X_holdout))
+    if blend_refit is True:
+        model.fit(X, y, **fit_params)
+    return model, None, holdout_predictions, score
+
+
+def _fit_path_job(predictor_cls, params_list, path_param, X, y,
+                  internal_cv, base_predict_method, cv_processes, scorer,
+                  fit_params, transform):
+    """
+    Fit the predictors for a list of parameter sets.
+
+    If path_param is not None, the parameter sets differ only in the value of
+    path_param and are fit along a warm-start path (see
+    _warm_start.fit_path()).
+
+    Returns
+    -------
+    list
+        Tuples of (model, predictions, cv_predictions, score) like those
+        returned by Ensemble._fit_job(), one per parameter set.
+    """
+    predictors = [predictor_cls(**params) for params in params_list]
+    if path_param is None:
+        return [Ensemble._fit_job(p, X, y, internal_cv, base_predict_method,
+                                  cv_processes, scorer, fit_params,
+                                  transform) for p in predictors]
+    return _warm_start.fit_path(predictors, path_param, X, y, internal_cv,
+                                base_predict_method, cv_processes, scorer,
+                                fit_params, transform)
 
 
 class SoftVotingClassifier(Cloneable, Saveable):
@@ -39,6 +343,22 @@ class SoftVotingClassifier(Cloneable, Saveable):
     classes for each sample so the dropped negative class probabilites can be
     inferred from the positive class.
 
+    Parameters
+    ----------
+    weights : list/array of floats or None, default=None
+        - If None : All base classifiers have equal weight.
+        - If list/array : Voting weight of each base classifier in the order
+          of the meta-feature matrix columns.
+    chunk_size : int or None, default=None
+        - If None : Average all rows at once.
+        - If int : Average blocks of chunk_size rows to bound the size of
+          temporary arrays.
+
+    Notes
+    -----
+    Votes are averaged over a zero-copy (n_samples, n_models, n_classes) view
+    of the meta-feature matrix, and float32 inputs give float32 outputs.
+
     Examples
     --------
     ::
@@ -79,7 +399,8 @@ class SoftVotingClassifier(Cloneable, Saveable):
         # output: [0.9117647058823529, 0.8180147058823529, 0.9117647058823529]
     """
 
-    def __init__(self):
+    def __init__(self, weights=None, chunk_size=None):
+        self._params_to_attributes(SoftVotingClassifier.__init__, locals())
         self._estimator_type = 'classifier'
 
     def fit(self, X, y, **fit_params):
@@ -89,31 +410,9 @@ class SoftVotingClassifier(Cloneable, Saveable):
         self.classes_, y = np.unique(y, return_inverse=True)
         return self
 
-    def _decatenate(self, meta_X):
-        n_classes = len(self.classes_)
-        if n_classes == 2:
-            # expand binary classification probs to 2 columns
-            n_rows, n_cols = meta_X.shape[0], 2 * meta_X.shape[1]
-            Xs_expanded = np.empty((n_rows, n_cols))
-            Xs_expanded[:, range(0, n_cols, 2)] =  1.0 - meta_X
-            Xs_expanded[:, range(1, n_cols + 1, 2)] =  meta_X
-            meta_X = Xs_expanded
-
-        if meta_X.shape[1] % n_classes != 0:
-            raise ValueError(
-                '''Number of meta-features not divisible by number of classes.
-                This can happen if base classifiers were trained on different
-                subsamples with different number of classes.  Pipecaster uses
-                StratifiedKFold to prevent this, but GroupKFold can lead to
-                violations.  Someone need to make StratifiedGroupKFold''')
-
-        Xs = [meta_X[:, i:i+n_classes]
-              for i in range(0, meta_X.shape[1], n_classes)]
-        return Xs
-
     def predict_proba(self, X):
-        Xs = self._decatenate(X)
-        return np.mean(Xs, axis=0)
+        return _vote_in_chunks(_soft_vote, np.asarray(X), len(self.classes_),
+                               self.weights, self.chunk_size)
 
     def predict(self, X):
         mean_probs = self.predict_proba(X)
@@ -121,11 +420,11 @@ class SoftVotingClassifier(Cloneable, Saveable):
         predictions = self.classes_[decisions]
         return predictions
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'classes_'):
             clone.classes_ = self.classes_.copy()
         return clone
@@ -150,6 +449,22 @@ class HardVotingClassifier(Cloneable, Saveable):
     classes for each sample so the dropped negative class probabilites can be
     inferred from the positive class.
 
+    Parameters
+    ----------
+    weights : list/array of floats or None, default=None
+        - If None : All base classifiers have one vote.
+        - If list/array : Voting weight of each base classifier in the order
+          of the meta-feature matrix columns.
+    chunk_size : int or None, default=None
+        - If None : Count votes for all rows at once.
+        - If int : Count votes in blocks of chunk_size rows to bound the size
+          of temporary arrays.
+
+    Notes
+    -----
+    Votes for all samples are counted with a single np.bincount call.  Ties
+    are resolved in favor of the class that comes first in classes_.
+
     Examples
     --------
     ::
@@ -189,7 +504,8 @@ class HardVotingClassifier(Cloneable, Saveable):
         # output: [0.8235294117647058, 0.8161764705882353, 0.6911764705882353]
     """
 
-    def __init__(self):
+    def __init__(self, weights=None, chunk_size=None):
+        self._params_to_attributes(HardVotingClassifier.__init__, locals())
         self._estimator_type = 'classifier'
 
     def fit(self, X, y, **fit_params):
@@ -199,43 +515,21 @@ class HardVotingClassifier(Cloneable, Saveable):
         self.classes_, y = np.unique(y, return_inverse=True)
         return self
 
-    def _decatenate(self, meta_X):
-        n_classes = len(self.classes_)
-        if n_classes == 2:
-            # expand binary classification probs to 2 columns
-            n_rows, n_cols = meta_X.shape[0], 2 * meta_X.shape[1]
-            Xs_expanded = np.empty((n_rows, n_cols))
-            Xs_expanded[:, range(0, n_cols, 2)] =  1.0 - meta_X
-            Xs_expanded[:, range(1, n_cols + 1, 2)] = meta_X
-            meta_X = Xs_expanded
-
-        if meta_X.shape[1] % n_classes != 0:
-            raise ValueError(
-                '''Number of meta-features not divisible by number of classes.
-                This can happen if base classifiers were trained on different
-                subsamples with different number of classes.  Pipecaster uses
-                StratifiedKFold to prevent this, but GroupKFold can lead to
-                violations.  Someone need to make StratifiedGroupKFold''')
-
-        Xs = [meta_X[:, i:i+n_classes]
-              for i in range(0, meta_X.shape[1], n_classes)]
-        return Xs
-
     def predict(self, X):
         """
         Return the modal class predicted by the base classifiers.
         """
-        Xs = self._decatenate(X)
-        input_decisions = np.stack([np.argmax(X, axis=1) for X in Xs])
-        decisions = scipy.stats.mode(input_decisions, axis=0)[0][0]
+        decisions = _vote_in_chunks(_hard_vote, np.asarray(X),
+                                    len(self.classes_), self.weights,
+                                    self.chunk_size)
         predictions = self.classes_[decisions]
         return predictions
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'classes_'):
             clone.classes_ = self.classes_.copy()
         return clone
@@ -330,7 +624,11 @@ class Ensemble(Cloneable, Saveable):
     validation training, set the internal_cv constructor argument of Ensemble
     (cross validation is only used to generate outputs for meta-predictor
     training; the whole training set is always used to train the final base
-    predictor models).
+    predictor models).  When base predictor fits are expensive, holdout
+    blending (blend_holdout constructor argument) trades some accuracy for
+    speed by fitting each base predictor once on a fraction of the training
+    set and training the meta-predictor on its predictions for the held out
+    samples.
 
     Ensemble also takes advantage of internal cross validation
     to enable in-pipeline screening of base predictors during model
@@ -387,11 +685,37 @@ class Ensemble(Cloneable, Saveable):
         - The number of parallel processes to run for base predictor fitting.
         - If int : Use up to base_processes number of processes.
         - If 'max' : Use all available CPUs.
+        - With internal cv, the full training set fits and the internal cv
+          split fits of all base predictors are run as one flat list of
+          jobs over these processes.
     cv_processes : int or 'max', default=1
         - The number of parallel processes to run for internal cross
-          validation.
+          validation when base predictors are fit in a single process.
         - If int : Use up to cv_processes number of processes.
         - If 'max' : Use all available CPUs.
+    cache_meta_features : bool, default=False
+        - If True : The meta-predictor training features and targets are
+          kept after fit (meta_X_ and meta_y_ attributes) so that
+          alternative meta-predictors can be evaluated with
+          score_meta_predictors() and swapped in with set_meta_predictor()
+          without refitting the base predictors.
+        - If False : Meta-features are discarded after fit.
+    blend_holdout : float or None, default=None
+        - Fraction of the training samples held out for blending, an
+          alternative to internal cv with one base predictor fit instead of
+          k + 1.
+        - If float : Each base predictor is fit on the remaining samples,
+          and its predictions on the holdout samples are used to score it
+          (for score_selector) and to train the meta-predictor.  Takes
+          precedence over internal_cv.
+        - If None : Blending is disabled.
+    blend_refit : bool, default=True
+        - If True : Base predictors are refit on all training samples after
+          blending.
+        - If False : Base predictors fit on the blend training samples are
+          used for inference.
+    random_state : int, RandomState instance, or None, default=None
+        Seed or random number generator for the blend holdout split.
 
     Examples
     --------
@@ -551,10 +875,13 @@ class Ensemble(Cloneable, Saveable):
                  score_selector=None,
                  disable_cv_train=False,
                  base_predict_methods='auto',
-                 base_processes=1, cv_processes=1):
+                 base_processes=1, cv_processes=1,
+                 cache_meta_features=False, blend_holdout=None,
+                 blend_refit=True, random_state=None):
         self._params_to_attributes(Ensemble.__init__, locals())
 
-        if internal_cv is None and score_selector is not None:
+        if (internal_cv is None and blend_holdout is None and
+                score_selector is not None):
             raise ValueError('Must choose an internal cv method when channel '
                              'selection is activated')
 
@@ -612,26 +939,38 @@ class Ensemble(Cloneable, Saveable):
 
     @staticmethod
     def _fit_job(predictor, X, y, internal_cv, base_predict_method,
-                 cv_processes, scorer, fit_params):
-        model = transform_wrappers.SingleChannel(predictor,
-                                                 base_predict_method)
-        model = utils.get_clone(model)
-        predictions = model.fit_transform(X, y, **fit_params)
-
-        cv_predictions, score = None, None
-        if internal_cv is not None:
-            model_cv = utils.get_clone(predictor)
-            model_cv = transform_wrappers.SingleChannelCV(
-                                                model_cv, base_predict_method,
-                                                internal_cv, cv_processes,
-                                                scorer)
-            cv_predictions = model_cv.fit_transform(X, y, **fit_params)
-            score = model_cv.score_
+                 cv_processes, scorer, fit_params, transform,
+                 blend_split=None, blend_refit=True):
+        if blend_split is not None:
+            return _fit_blend_job(predictor, X, y, base_predict_method,
+                                  scorer, fit_params, blend_split,
+                                  blend_refit)
+        predictions, cv_predictions, score = None, None, None
+        if internal_cv is None:
+            model = transform_wrappers.SingleChannel(predictor,
+                                                     base_predict_method)
+            if transform:
+                predictions = model.fit_transform(X, y, **fit_params)
+            else:
+                model.fit(X, y, **fit_params)
+        else:
+            # the full training set fit made by fit_transform() is reused for
+            # inference so that each predictor is fit only once on all samples
+            model = transform_wrappers.SingleChannelCV(
+                                    predictor, base_predict_method,
+                                    internal_cv, cv_processes,
+                                    score_method='predict', scorer=scorer)
+            cv_predictions = model.fit_transform(X, y, **fit_params)
+            if transform:
+                predictions = model.transform(X)
+            score = model.score_
 
         return model, predictions, cv_predictions, score
 
     def fit(self, X, y=None, **fit_params):
 
+        self.fused_linear_, self.cascade_ = None, None
+        self.meta_X_, self.meta_y_ = None, None
         if self._estimator_type == 'classifier' and y is not None:
             self.classes_, y = np.unique(y, return_inverse=True)
 
@@ -643,16 +982,39 @@ class Ensemble(Cloneable, Saveable):
         else:
             methods = [self.base_predict_methods for p in self.base_predictors]
 
+        blend_split = None
+        if self.blend_holdout is not None:
+            blend_split = _get_blend_split(
+                y, self.blend_holdout, self._estimator_type == 'classifier',
+                self.random_state)
+
+        # full training set predictions are only needed to train the
+        # meta-predictor when internal cv or holdout outputs are not used
+        transform = (self.meta_predictor is not None and
+                     blend_split is None and
+                     (self.internal_cv is None or
+                      self.disable_cv_train is True))
         args_list = [(p, X, y, self.internal_cv, m, self.cv_processes,
-                      self.scorer, fit_params)
+                      self.scorer, fit_params, transform, blend_split,
+                      self.blend_refit)
                      for p, m in zip(self.base_predictors, methods)]
 
+        fit_results = None
+        if _use_flat_cv(self.internal_cv, blend_split, self.base_processes):
+            wrappers = [transform_wrappers.SingleChannelCV(
+                                p, m, self.internal_cv, self.cv_processes,
+                                score_method='predict', scorer=self.scorer)
+                        for p, m in zip(self.base_predictors, methods)]
+            fit_results = _fit_flat_cv(wrappers, [X for w in wrappers], y,
+                                       fit_params, transform,
+                                       self.base_processes)
+
         n_jobs = len(args_list)
         n_processes = 1 if self.base_processes is None else self.base_processes
         n_processes = (n_jobs
                        if (type(n_processes) == int and n_jobs < n_processes)
                        else n_processes)
-        if n_processes == 'max' or n_processes > 1:
+        if fit_results is None and (n_processes == 'max' or n_processes > 1):
             try:
                 shared_mem_objects = [X, y, self.cv_processes, self.scorer,
                                       fit_params]
@@ -666,11 +1028,13 @@ class Ensemble(Cloneable, Saveable):
                 print('defaulting to single processor')
                 n_processes = 1
 
-        if type(n_processes) == int and n_processes <= 1:
+        if (fit_results is None and type(n_processes) == int and
+                n_processes <= 1):
             fit_results = [Ensemble._fit_job(*args)
                            for args in args_list]
 
         models, predictions, cv_predictions, scores = zip(*fit_results)
+        del fit_results
 
         if scores is not None:
             self.scores_ = list(scores)
@@ -681,32 +1045,56 @@ class Ensemble(Cloneable, Saveable):
             self.selected_indices_ = [
                 i for i, p in enumerate(self.base_predictors)]
 
-        if self.internal_cv is not None and self.disable_cv_train is False:
+        if blend_split is not None:
+            # the meta-predictor is trained on the holdout samples
+            predictions = cv_predictions
+            y = y[blend_split[1]]
+        elif self.internal_cv is not None and self.disable_cv_train is False:
             predictions = cv_predictions
+        cv_predictions = None
 
         self.base_models = [m for i, m in enumerate(models)
                             if i in self.selected_indices_]
         predictions = [p for i, p in enumerate(predictions)
                        if i in self.selected_indices_]
+        return self._fit_selected(predictions, y, fit_params)
 
-        if self.meta_predictor is None and len(self.selected_indices_) > 1:
+    def _fit_selected(self, predictions, y, fit_params):
+        """
+        Set up inference from the selected base models, fitting the
+        meta-predictor on their predictions when there is one.
+        """
+        if self.meta_predictor is None and len(self.base_models) > 1:
            raise utils.FitError('A meta_predictor is required when more than '
                                 'one base predictors is selected.')
-        elif self.meta_predictor is None and len(self.selected_indices_) == 1:
+        elif self.meta_predictor is None and len(self.base_models) == 1:
             if hasattr(self.base_models[0], 'classes_'):
                self.classes_ = self.base_models[0].classes_
             predict_methods = utils.get_predict_methods(self.base_models[0])
         elif self.meta_predictor is not None:
-            meta_X = np.concatenate(predictions, axis=1)
-            self.meta_model = utils.get_clone(self.meta_predictor)
-            self.meta_model.fit(meta_X, y, **fit_params)
-            if hasattr(self.meta_model, 'classes_'):
-                self.classes_ = self.meta_model.classes_
-            predict_methods = utils.get_predict_methods(self.meta_model)
+            self.meta_widths_ = [p.shape[1] for p in predictions]
+            self.meta_dtype_ = np.result_type(*predictions)
+            meta_X = _build_meta_features(_release_outputs(predictions),
+                                          self.meta_widths_, self.meta_dtype_)
+            if self.cache_meta_features is True:
+                self.meta_X_, self.meta_y_ = meta_X, y
+            predict_methods = self._fit_meta_model(meta_X, y, fit_params)
 
         self._set_predictor_interface(predict_methods)
         return self
 
+    def _fit_meta_model(self, meta_X, y, fit_params):
+        # cascades are calibrated for the previous meta-model's weights
+        self.cascade_ = None
+        if hasattr(self, 'cascade_costs_'):
+            del self.cascade_costs_
+        self.meta_model = utils.get_clone(self.meta_predictor,
+                                          copy_on_write=True)
+        self.meta_model.fit(meta_X, y, **fit_params)
+        if hasattr(self.meta_model, 'classes_'):
+            self.classes_ = self.meta_model.classes_
+        return utils.get_predict_methods(self.meta_model)
+
     def get_model_scores(self):
         if hasattr(self, 'scores_'):
             return self.scores_
@@ -728,6 +1116,136 @@ class Ensemble(Cloneable, Saveable):
         else:
             return self.base_models
 
+    def set_meta_predictor(self, meta_predictor, **fit_params):
+        """
+        Replace the meta-predictor without refitting the base predictors.
+
+        The new meta-predictor is fit on the meta-features cached during the
+        last call to fit() and the ensemble's prediction interface is updated
+        to match it.
+
+        Parameters
+        ----------
+        meta_predictor : predictor instance
+            Scikit-learn conformant classifier or regressor of the same type
+            as the base predictors.
+        fit_params : dict, default=None
+            Auxiliary parameters to pass to the fit method of the
+            meta-predictor.
+
+        Returns
+        -------
+        self
+        """
+        if getattr(self, 'meta_X_', None) is None:
+            raise utils.FitError('No cached meta-features found.  Fit with '
+                                 'cache_meta_features=True and a '
+                                 'meta_predictor first.')
+        if meta_predictor._estimator_type != self._estimator_type:
+            raise ValueError('Base- and meta- predictors must be the same '
+                             'type (e.g. classifier or regressor).')
+        self.meta_predictor = meta_predictor
+        predict_methods = self._fit_meta_model(self.meta_X_, self.meta_y_,
+                                               fit_params)
+        self._set_predictor_interface(predict_methods)
+        return self
+
+    def score_meta_predictors(self, meta_predictors, cv=None, scorer=None,
+                              n_processes=1):
+        """
+        Cross validate candidate meta-predictors on the cached meta-features.
+
+        Parameters
+        ----------
+        meta_predictors : list of predictor instances
+            Candidate meta-predictors.
+        cv : int, None, or callable, default=None
+            - If int : StratifiedKfold(n_splits=cv) if classifier or
+              KFold(n_splits=cv) if regressor.
+            - If None : default value of 5.
+            - If callable: Assumed to be split generator like scikit-learn
+              KFold.
+        scorer : callable or None, default=None
+            - If callable : Figure of merit with signature
+              score = scorer(y_true, y_pred).
+            - If None : The ensemble's scorer.
+        n_processes : int or 'max', default=1
+            - If int : Cross validate up to n_processes candidates in
+              parallel.
+            - If 'max' : Use all available CPUs.
+
+        Returns
+        -------
+        list
+            Lists of split scores, one per candidate meta-predictor.
+        """
+        if getattr(self, 'meta_X_', None) is None:
+            raise utils.FitError('No cached meta-features found.  Fit with '
+                                 'cache_meta_features=True and a '
+                                 'meta_predictor first.')
+        scorer = self.scorer if scorer is None else scorer
+        return _score_meta_predictors(meta_predictors, self.meta_X_,
+                                      self.meta_y_, cv, scorer, n_processes)
+
+    def fuse_linear_models(self):
+        """
+        Fuse linear base models for faster inference.
+
+        Base models that are scikit-learn linear models are compiled into a
+        single matrix product that feeds the meta-predictor.  Fusion is
+        discarded when the ensemble is refit.
+
+        Returns
+        -------
+        self
+        """
+        if hasattr(self, 'base_models') is False:
+            raise utils.FitError('fusion attempted before model fitting')
+        self.fused_linear_ = linear_fusion.fuse_models(self.base_models)
+        return self
+
+    def fit_cascade(self, X, tolerance=0.01):
+        """
+        Set up early-exit cascade inference.
+
+        Base models are timed on the calibration samples X and ordered from
+        cheapest to most expensive.  At inference, samples leave the cascade
+        as soon as the partial soft vote of the models evaluated so far
+        reaches a confidence threshold, so only ambiguous samples reach the
+        expensive models.  The threshold is the lowest one that changes at
+        most a tolerance fraction of the full ensemble's predictions on X.
+        Requires a SoftVotingClassifier meta-predictor.  The cascade is
+        discarded when the ensemble is refit.
+
+        Parameters
+        ----------
+        X: ndarray.shape(n_samples, n_features)
+            Calibration samples, preferably not used for training.
+        tolerance : float, default=0.01
+            Fraction of calibration samples whose prediction may differ from
+            the prediction of the full ensemble.
+
+        Returns
+        -------
+        self
+        """
+        if hasattr(self, 'base_models') is False:
+            raise utils.FitError('cascade fitting attempted before model '
+                                 'fitting')
+        weights = _get_cascade_weights(getattr(self, 'meta_model', None),
+                                       len(self.base_models))
+        outputs, costs = _cascade.time_transforms(
+                            self.base_models, [X for m in self.base_models])
+        meta_X = _build_meta_features(_release_outputs(outputs),
+                                      self.meta_widths_, self.meta_dtype_)
+        order = np.argsort(costs, kind='stable')
+        threshold = _cascade.calibrate_cascade(
+                        meta_X, self.meta_widths_, order, weights,
+                        len(self.meta_model.classes_), tolerance)
+        self.cascade_ = (order, threshold)
+        self.cascade_costs_ = costs
+        return self
+
     def predict_with_method(self, X, method_name):
         """
         Make ensemble predictions.
@@ -755,20 +1273,60 @@ class Ensemble(Cloneable, Saveable):
             - If method_name is 'predict_proba', or
               'predict_log_proba': ndarray(n_samples, n_classes)
         """
+        return self.predict_methods(X, [method_name])[method_name]
+
+    def predict_methods(self, X, method_names):
+        """
+        Make ensemble predictions with several methods.
+
+        Base model outputs are computed once and shared by all of the
+        meta-predictor prediction methods.
+
+        Parameters
+        ----------
+        X: ndarray.shape(n_samples, n_features)
+            Feature matrix.
+        method_names: list of str
+            Names of the meta-predictor prediction methods to invoke.
+
+        Returns
+        -------
+        dict
+            Predictions indexed by method name.
+        """
         if hasattr(self, 'base_models') is False:
             raise utils.FitError('prediction attempted before model fitting')
 
         if self.meta_predictor is None:
-            prediction_method = getattr(self.base_models[0], method_name)
-            predictions = prediction_method(X)
+            predictions = utils.predict_with_methods(self.base_models[0], X,
+                                                     method_names)
+        elif getattr(self, 'cascade_', None) is not None:
+            order, threshold = self.cascade_
+            probs = _cascade.cascade_soft_vote(
+                lambda i, rows: self.base_models[i].transform(
+                                                        get_rows(X, rows)),
+                order, _get_cascade_weights(self.meta_model, len(order)),
+                len(self.meta_model.classes_), threshold, X.shape[0])
+            predictions = {'predict_proba': probs,
+                           'predict': self.meta_model.classes_[
+                                                np.argmax(probs, axis=1)]}
+            predictions = {m: predictions[m] for m in method_names}
         else:
-            predictions_list = [m.transform(X) for m in self.base_models]
-            meta_X = np.concatenate(predictions_list, axis=1)
-            prediction_method = getattr(self.meta_model, method_name)
-            predictions = prediction_method(meta_X)
-
-        if self._estimator_type == 'classifier' and method_name == 'predict':
-            predictions = self.classes_[predictions]
+            fused_outputs = {}
+            if getattr(self, 'fused_linear_', None) is not None:
+                fused_transform, fused_indices = self.fused_linear_
+                fused_outputs = dict(zip(fused_indices,
+                                         fused_transform.transform_shared(X)))
+            outputs = (fused_outputs[i] if i in fused_outputs
+                       else m.transform(X)
+                       for i, m in enumerate(self.base_models))
+            meta_X = _build_meta_features(outputs, self.meta_widths_,
+                                          self.meta_dtype_)
+            predictions = utils.predict_with_methods(self.meta_model, meta_X,
+                                                     method_names)
+
+        if self._estimator_type == 'classifier' and 'predict' in predictions:
+            predictions['predict'] = self.classes_[predictions['predict']]
         return predictions
 
     def get_screen_results(self):
@@ -782,11 +1340,11 @@ class Ensemble(Cloneable, Saveable):
     def _more_tags(self):
         return {'multichannel': False}
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'classes_'):
             clone.classes_ = self.classes_.copy()
         if hasattr(self, 'scores_'):
@@ -794,14 +1352,151 @@ class Ensemble(Cloneable, Saveable):
         if hasattr(self, 'selected_indices_'):
             clone.selected_indices_ = self.selected_indices_.copy()
         if hasattr(self, 'base_models'):
-            clone.base_models = [utils.get_clone(m) if m is not None else None
+            clone.base_models = [utils.get_fitted_clone(m, copy_on_write)
                                  for m in self.base_models]
         if hasattr(self, 'meta_model'):
-            clone.meta_model = utils.get_clone(self.meta_model)
+            clone.meta_model = utils.get_fitted_clone(self.meta_model,
+                                                      copy_on_write)
+        if hasattr(self, 'fused_linear_'):
+            clone.fused_linear_ = self.fused_linear_
+        if getattr(self, 'cascade_', None) is not None:
+            clone.cascade_ = self.cascade_
+            clone.cascade_costs_ = self.cascade_costs_.copy()
+        if hasattr(self, 'meta_widths_'):
+            clone.meta_widths_ = self.meta_widths_.copy()
+            clone.meta_dtype_ = self.meta_dtype_
+        if hasattr(self, 'meta_X_'):
+            clone.meta_X_, clone.meta_y_ = self.meta_X_, self.meta_y_
         return clone
 
 
-class GridSearchEnsemble(Ensemble):
+class _ScreeningEnsemble(Ensemble):
+    """
+    Ensemble that screens parameter sets of a single predictor class.
+
+    Subclasses generate the candidate parameter sets and pass them to
+    _screen(), which fits them in parallel batches while retaining only the
+    models that the score_selector can select.
+    """
+
+    def _screen(self, X, y, propose, n_candidates, fit_params):
+        """
+        Fit and score candidates, then select models and fit the
+        meta-predictor.
+
+        Parameters
+        ----------
+        X : ndarray.shape(n_samples, n_features)
+            Training features.
+        y : ndarray.shape(n_samples,)
+            Training targets (encoded for classifiers).
+        propose : callable
+            Called before each batch with the number of jobs to submit and a
+            dict of the scores obtained so far indexed by candidate index.
+            Returns a list of jobs, each a tuple of (candidate indices,
+            parameter sets, warm-start path parameter or None, base predict
+            method), or an empty list to end the screen.
+        n_candidates : int
+            Largest number of candidates that will be proposed.
+        fit_params : dict
+            Auxiliary parameters to pass to the base predictor fit methods.
+
+        Returns
+        -------
+        dict
+            Scores indexed by candidate index.
+        """
+        # Only the top n_retained models and meta-features are kept between
+        # batches (all of them if the selector's output size depends on the
+        # scores).
+        n_retained = _screening.get_selection_bound(self.score_selector,
+                                                    n_candidates)
+        transform = self.meta_predictor is not None and (
+            self.internal_cv is None or self.disable_cv_train is True)
+        n_processes = 1 if self.base_processes is None else self.base_processes
+        batch_size = (parallel.count_cpus() if n_processes == 'max'
+                      else max(n_processes, 1))
+        shared_mem_objects = [X, y, self.cv_processes, self.scorer,
+                              fit_params]
+        scores, heap = {}, []
+        jobs = propose(batch_size, scores)
+        while len(jobs) > 0:
+            args_list = [(self.base_predictor_cls, params_list, path_param,
+                          X, y, self.internal_cv, method, self.cv_processes,
+                          self.scorer, fit_params, transform)
+                         for _, params_list, path_param, method in jobs]
+            fit_results = parallel._starmap_jobs(_fit_path_job, args_list,
+                                                 n_processes,
+                                                 shared_mem_objects)
+            for job, job_results in zip(jobs, fit_results):
+                for i, (model, predictions, cv_predictions, score) in zip(
+                        job[0], job_results):
+                    scores[i] = score
+                    if (self.internal_cv is not None and
+                            self.disable_cv_train is False):
+                        predictions = cv_predictions
+                    rank = (-np.inf if score is None or np.isnan(score)
+                            else score)
+                    heapq.heappush(heap, (rank, -i, model, predictions))
+                    if n_retained is not None and len(heap) > n_retained:
+                        heapq.heappop(heap)
+            del fit_results
+            jobs = propose(batch_size, scores)
+
+        n_selected = _screening.get_selection_bound(self.score_selector,
+                                                    len(scores))
+        if n_selected is not None:
+            ranked = sorted(heap, key=lambda entry: entry[:2], reverse=True)
+            selections = [-entry[1] for entry in ranked[:n_selected]]
+        elif self.score_selector is None:
+            selections = list(scores)
+        else:
+            evaluated = sorted(scores)
+            selections = [evaluated[i] for i in self.score_selector(
+                                    [scores[i] for i in evaluated])]
+        retained = {-entry[1]: entry[2:] for entry in heap}
+        del heap
+        self.selected_indices_ = sorted(selections)
+        self.base_models = [retained[i][0] for i in self.selected_indices_]
+        predictions = [retained[i][1] for i in self.selected_indices_]
+        del retained
+        self._fit_selected(predictions, y, fit_params)
+        return scores
+
+    def get_results(self):
+        """
+        Get the results of the screen.
+
+        Returns
+        -------
+        selections : list
+            List containing '+' for selected paramters and '-' for unselected
+            paramters in the order of params_list.
+        params_list : list
+            List of screened parameter sets.
+        scores : list
+            List of performance scores for each set of parameters set in the
+            order of params_list.
+        """
+        if hasattr(self, 'base_models') is True:
+            selected_indices = set(self.selected_indices_)
+            selections = [True if i in selected_indices else False
+                          for i in range(len(self.params_list_))]
+            return selections, list(self.params_list_), self.scores_
+
+    def get_screen_results(self):
+        """
+        Get pandas DataFrame with screen results.
+        """
+        selections, params_list, scores = self.get_results()
+        selections = ['+++' if s is True else '-' for s in selections]
+        df = pd.DataFrame({'selections':selections,
+                           'parameters':params_list, 'performance':scores})
+        df.sort_values('performance', ascending=False, inplace=True)
+        return df.set_index('parameters')
+
+
+class GridSearchEnsemble(_ScreeningEnsemble):
     """
     Model ensemble with in-pipeline hyperparameter screening.
 
@@ -824,6 +1519,12 @@ class GridSearchEnsemble(Ensemble):
     to generate outputs for meta-predictor training; the whole training set is
     always used to train the final base predictor models).
 
+    Parameter sets and base predictors are generated on demand during
+    fitting rather than held in memory, and when the score_selector selects a
+    fixed number of models (RankScoreSelector, PctRankScoreSelector) only the
+    current top-scoring models are retained as the screen proceeds, so very
+    large grids can be screened in bounded memory.
+
     (1) Wolpert, David H. "Stacked generalization."
     Neural networks 5.2 (1992): 241-259.
 
@@ -884,6 +1585,44 @@ class GridSearchEnsemble(Ensemble):
           validation.
         - If int : Use up to cv_processes number of processes.
         - If 'max' : Use all available CPUs.
+    cache_meta_features : bool, default=False
+        - If True : The meta-predictor training features and targets are
+          kept after fit (meta_X_ and meta_y_ attributes) so that
+          alternative meta-predictors can be evaluated with
+          score_meta_predictors() and swapped in with set_meta_predictor()
+          without refitting the base predictors.
+        - If False : Meta-features are discarded after fit.
+    halving_factor : int or None, default=None
+        - If None : Every parameter set is screened with internal cv on the
+          full training set.
+        - If int : Successive halving screen.  Candidates are first scored by
+          cross validation on a small stratified subsample of the training
+          set, the top 1/halving_factor are kept, and the subsample size is
+          multiplied by halving_factor until the survivors (at least
+          halving_factor of them) are screened on the full training set.
+          Scores of candidates eliminated early are NaN in get_results(), and
+          the subsample scores are stored in the halving_results_ attribute.
+    min_halving_samples : int or None, default=None
+        - Number of samples in the first halving rung.
+        - If None : The larger of twice the number of internal cv splits
+          times the number of classes (1 for regressors) and the number of
+          samples needed to reach the full training set at the last rung.
+    warm_start_param : str, 'auto', or None, default=None
+        - Grid axis to evaluate along a warm-start path.  Parameter sets that
+          differ only in this parameter share one model per internal cv split
+          (and one on the full training set) that is refit with
+          warm_start=True at each value, so the whole axis costs about as
+          much as fitting its most expensive value.  Requires a predictor
+          with a warm_start parameter.  n_estimators, max_iter, and C paths
+          are walked in ascending order and alpha paths in descending order.
+          Tree ensembles grown this way match cold fits, while iterative
+          solvers started from the previous solution may differ from cold
+          fits within the solver tolerance.
+        - If 'auto' : Use the first of n_estimators, max_iter, C, or alpha
+          found in param_dict with more than one value, if any.
+        - If None : Fit every parameter set from scratch.
+    random_state : int or None, default=None
+        Seed for the successive halving subsamples.
 
     Examples
     --------
@@ -921,63 +1660,267 @@ class GridSearchEnsemble(Ensemble):
                  score_selector=RankScoreSelector(k=3),
                  disable_cv_train=False,
                  base_transform_method='auto',
-                 base_processes=1, cv_processes=1):
+                 base_processes=1, cv_processes=1,
+                 cache_meta_features=False, halving_factor=None,
+                 min_halving_samples=None, warm_start_param=None,
+                 random_state=None):
         self._params_to_attributes(GridSearchEnsemble.__init__, locals())
-        self.params_list_ = list(ParameterGrid(self.param_dict))
-        base_predictors = [self.base_predictor_cls(**ps)
-                                   for ps in self.params_list_]
-        super().__init__(base_predictors, self.meta_predictor,
+        # parameter sets and base predictors are generated on demand
+        self.params_list_ = ParameterGrid(self.param_dict)
+        prototype = self.base_predictor_cls(**self.params_list_[0])
+        super().__init__(prototype, self.meta_predictor,
                          self.internal_cv, self.scorer,
                          self.score_selector, self.disable_cv_train,
                          self.base_transform_method,
-                         self.base_processes, self.cv_processes)
+                         self.base_processes, self.cv_processes,
+                         self.cache_meta_features,
+                         random_state=self.random_state)
+        self.base_predictors = _screening.PredictorGrid(
+                                    self.base_predictor_cls, self.params_list_)
 
     def fit(self, X, y=None, **fit_params):
 
-        super().fit(X, y, **fit_params)
+        self.fused_linear_, self.cascade_ = None, None
+        self.meta_X_, self.meta_y_ = None, None
+        if self._estimator_type == 'classifier' and y is not None:
+            self.classes_, y = np.unique(y, return_inverse=True)
 
-    def get_results(self):
+        n_params = len(self.params_list_)
+        if isinstance(self.base_predict_methods, (tuple, list, np.ndarray)):
+            if len(self.base_predict_methods) != n_params:
+                raise utils.FitError('Number of base predict methods did not '
+                                     'match number of parameter sets.')
+            methods = self.base_predict_methods
+        else:
+            methods = [self.base_predict_methods] * n_params
+
+        if self.halving_factor is None:
+            candidates = list(range(n_params))
+        else:
+            candidates, self.halving_results_ = _screening.successive_halving(
+                self.base_predictors, X, y, self.internal_cv, self.scorer,
+                self.halving_factor, self.min_halving_samples,
+                self._estimator_type == 'classifier', self.base_processes,
+                fit_params, np.random.RandomState(self.random_state))
+
+        groups, path_param = self._get_path_groups(candidates, methods)
+        jobs = ((group, [self.params_list_[i] for i in group],
+                 path_param if len(group) > 1 else None, methods[group[0]])
+                for group in groups)
+        scores = self._screen(
+            X, y, lambda n_jobs, scores: list(itertools.islice(jobs, n_jobs)),
+            len(candidates), fit_params)
+        self.scores_ = [scores.get(i, np.nan) for i in range(n_params)]
+        return self
+
+    def _get_path_groups(self, candidates, methods):
         """
-        Get the results of the screen.
+        Group candidate indices into warm-start paths.
 
         Returns
         -------
-        selections : list
-            List containing '+' for selected paramters and '-' for unselected
-            paramters in the order of params_list.
-        params_list : list
-            List of grid search parameter sets.
-        scores : list
-            List of performance scores for each set of parameters set in the
-            order of params_list.
-        """
-        if hasattr(self, 'base_models') is True:
-            selections = [True if i in self.selected_indices_ else False
-                          for i, p in enumerate(self.params_list_)]
-            return selections, self.params_list_, self.scores_
-
-    def get_screen_results(self):
+        (list, str or None)
+            List of lists of candidate indices ordered along their path, and
+            the name of the path parameter (None if warm starts are not used).
         """
-        Get pandas DataFrame with screen results.
-        """
-        selections, params_list, scores = self.get_results()
-        selections = ['+++' if s is True else '-' for s in selections]
-        df = pd.DataFrame({'selections':selections,
-                           'parameters':params_list, 'performance':scores})
-        df.sort_values('performance', ascending=False, inplace=True)
-        return df.set_index('parameters')
-
-    def get_clone(self):
+        if self.warm_start_param == 'auto':
+            path_param = _warm_start.get_warm_start_param(
+                                    self.base_predictors[0], self.param_dict)
+        else:
+            path_param = self.warm_start_param
+        if path_param is None:
+            return [[i] for i in candidates], None
+
+        groups = {}
+        for i in candidates:
+            params = self.params_list_[i]
+            key = (repr(sorted([(k, v) for k, v in params.items()
+                                if k != path_param])), methods[i])
+            groups.setdefault(key, []).append(i)
+        ascending = _warm_start.warm_start_path_params.get(path_param, True)
+        return [sorted(group, key=lambda i: self.params_list_[i][path_param],
+                       reverse=not ascending)
+                for group in groups.values()], path_param
+
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'params_list'):
             clone.params_list = self.params_list.copy()
+        if hasattr(self, 'halving_results_'):
+            clone.halving_results_ = self.halving_results_.copy()
 
         return clone
 
 
+class SearchEnsemble(_ScreeningEnsemble):
+    """
+    Model ensemble with in-pipeline budgeted hyperparameter search.
+
+    SearchEnsemble is like GridSearchEnsemble, but instead of screening an
+    exhaustive grid it fits a budgeted number of parameter sets proposed by a
+    sampler.  The default TPESampler is adaptive: after an initial set of
+    random proposals, new parameter sets are drawn from a density model of
+    the best scoring parameter sets seen so far, so good ensembles are
+    usually found with far fewer base predictor fits than a grid requires.
+    Parameter sets are proposed in batches of one per base process, with each
+    batch informed by the scores of all of the previous batches.  Model
+    selection and meta-prediction work as in :class:`Ensemble`.
+
+    Parameters
+    ----------
+    param_distributions : dict, default=None
+        Dict of parameters to search, with values that are either lists of
+        choices or frozen scipy.stats distributions.  E.g.:
+
+        {'learning_rate':scipy.stats.loguniform(0.01, 1),
+        'max_depth':[2, 3, 4]}
+    base_predictor_cls : class, default=None
+        Predictor class to be used for base prediction.  Must implement the
+        scikit-learn estimator and predictor interfaces.
+    meta_predictor : predictor instance, default=None
+        Scikit-learn conformant classifier or regressor that makes predictions
+        from the base predictor inferences.  This parameter is optional when
+        the internal_cv and score_selector parameters are set, in which case
+        predictions from the top performing model will be used in the absence
+        of a meta-predictor.
+    internal_cv : int, None, or callable, default=5
+        - Function for train/test subdivision of the training data.  Used to
+          score the parameter sets and ensure base predictors do not generate
+          predictions from their training samples during meta-predictor
+          training.
+        - If int : StratifiedKfold(n_splits=internal_cv) if classifier or
+          KFold(n_splits=internal_cv) if regressor.
+        - If None : default value of 5.
+        - If callable: Assumed to be split generator like scikit-learn KFold.
+    scorer : callable or 'auto', default='auto'
+        - Performance metric used for model selection.
+        - If callable : should return a scalar figure of merit with
+          signature: score = scorer(y_true, y_pred).
+        - If 'auto' : balanced_accuracy_score if classifier,
+          explained_variance_score if regressor.
+    score_selector : callable or None, default=RankScoreSelector(k=3)
+        - Method for selecting models from the ensemble.
+        - If callable : Selector with signature:
+          selected_indices = callable(scores).
+        - If None :  All models will be retained in the ensemble if there is
+          a meta-predictor, otherwise RankScoreSelector(k=1) is used.
+    disable_cv_train : bool, default=False
+        - If False : cv predictions will be used to train the meta-predictor.
+        - If True : cv predictions not used to train the meta-predictor.
+    base_transform_method : str, default='auto'
+        - Name of the base predictor method used to generate meta-features.
+        - If 'auto' : Use the precedence order specified in
+          :mod:`pipecaster.transform_wrappers` to select a predict method.
+    base_processes : int or 'max', default=1
+        - The number of parallel processes to run for base predictor fitting.
+        - If int : Use up to base_processes number of processes.
+        - If 'max' : Use all available CPUs.
+    cv_processes : int or 'max', default=1
+        - The number of parallel processes to run for internal cross
+          validation.
+        - If int : Use up to cv_processes number of processes.
+        - If 'max' : Use all available CPUs.
+    cache_meta_features : bool, default=False
+        - If True : The meta-predictor training features and targets are
+          kept after fit (see :class:`Ensemble`).
+        - If False : Meta-features are discarded after fit.
+    sampler : callable, default=TPESampler()
+        Callable that proposes parameter sets, e.g. those found in the
+        :mod:`pipecaster.parameter_sampling` module.
+    n_iter : int, default=50
+        Maximum number of parameter sets to fit.
+    time_budget : float or None, default=None
+        - If float : Wall-clock time in seconds after which no new batches
+          of parameter sets are started (the first batch always runs).
+        - If None : The search is limited by n_iter only.
+    random_state : int or None, default=None
+        Seed for the sampler.
+
+    Examples
+    --------
+    ::
+
+        import scipy.stats
+        from sklearn.datasets import make_classification
+        from sklearn.ensemble import GradientBoostingClassifier
+        import pipecaster as pc
+
+        X, y = make_classification()
+        clf = pc.SearchEnsemble(
+                    param_distributions={
+                        'learning_rate':scipy.stats.loguniform(0.01, 1),
+                        'n_estimators':scipy.stats.randint(5, 100)},
+                    base_predictor_cls=GradientBoostingClassifier,
+                    meta_predictor=pc.SoftVotingClassifier(),
+                    score_selector=pc.RankScoreSelector(k=3),
+                    n_iter=30, base_processes='max')
+        clf.fit(X, y)
+        clf.get_screen_results()
+    """
+
+    def __init__(self, param_distributions=None, base_predictor_cls=None,
+                 meta_predictor=None, internal_cv=5, scorer='auto',
+                 score_selector=RankScoreSelector(k=3),
+                 disable_cv_train=False,
+                 base_transform_method='auto',
+                 base_processes=1, cv_processes=1,
+                 cache_meta_features=False, sampler=TPESampler(),
+                 n_iter=50, time_budget=None, random_state=None):
+        self._params_to_attributes(SearchEnsemble.__init__, locals())
+        super().__init__(self.base_predictor_cls(), self.meta_predictor,
+                         self.internal_cv, self.scorer,
+                         self.score_selector, self.disable_cv_train,
+                         self.base_transform_method,
+                         self.base_processes, self.cv_processes,
+                         self.cache_meta_features,
+                         random_state=self.random_state)
+        self.params_list_ = []
+
+    def fit(self, X, y=None, **fit_params):
+
+        self.fused_linear_, self.cascade_ = None, None
+        self.meta_X_, self.meta_y_ = None, None
+        if self._estimator_type == 'classifier' and y is not None:
+            self.classes_, y = np.unique(y, return_inverse=True)
+
+        random_state = np.random.RandomState(self.random_state)
+        self.params_list_ = []
+        start_time = time.time()
+
+        def propose(n_jobs, scores):
+            # the first batch always runs so that there are models to select
+            if (self.time_budget is not None and len(scores) > 0 and
+                    time.time() - start_time >= self.time_budget):
+                return []
+            evaluated = sorted(scores)
+            evaluated_params = [self.params_list_[i] for i in evaluated]
+            evaluated_scores = [scores[i] for i in evaluated]
+            jobs = []
+            for j in range(min(n_jobs, self.n_iter - len(self.params_list_))):
+                params = self.sampler(self.param_distributions,
+                                      evaluated_params, evaluated_scores,
+                                      random_state)
+                jobs.append(([len(self.params_list_)], [params], None,
+                             self.base_predict_methods))
+                self.params_list_.append(params)
+            return jobs
+
+        scores = self._screen(X, y, propose, self.n_iter, fit_params)
+        self.scores_ = [scores[i] for i in range(len(self.params_list_))]
+        return self
+
+    def get_clone(self, copy_on_write=False):
+        """
+        Get a stateful clone.
+        """
+        clone = super().get_clone(copy_on_write)
+        clone.params_list_ = [params.copy() for params in self.params_list_]
+        return clone
+
+
 class MultichannelPredictor(Cloneable, Saveable):
     """
     Predict with mutliple intput channels.
@@ -1055,11 +1998,10 @@ class MultichannelPredictor(Cloneable, Saveable):
         return self
 
     def fit(self, Xs, y=None, **fit_params):
-        self.model = utils.get_clone(self.predictor)
-        live_Xs = [X for X in Xs if X is not None]
+        self.model = utils.get_clone(self.predictor, copy_on_write=True)
+        X = concatenate_channels(Xs)
 
-        if len(Xs) > 0:
-            X = np.concatenate(live_Xs, axis=1)
+        if X is not None:
             if y is None:
                 self.model.fit(X, **fit_params)
             else:
@@ -1071,29 +2013,41 @@ class MultichannelPredictor(Cloneable, Saveable):
         return self
 
     def predict_with_method(self, Xs, method_name):
-        if hasattr(self, 'model') is False:
-            raise FitError('prediction attempted before call to fit()')
-        live_Xs = [X for X in Xs if X is not None]
+        return self.predict_methods(Xs, [method_name])[method_name]
 
-        if len(live_Xs) > 0:
-            X = np.concatenate(live_Xs, axis=1)
-            prediction_method = getattr(self.model, method_name)
-            predictions = prediction_method(X)
+    def predict_methods(self, Xs, method_names):
+        """
+        Predict with several methods, concatenating the inputs once.
 
-        return predictions
+        Parameters
+        ----------
+        Xs: list
+            List of input feature matrices (or None spaceholders).
+        method_names: list of str
+            Names of the prediction methods to invoke.
+
+        Returns
+        -------
+        dict
+            Predictions indexed by method name.
+        """
+        if hasattr(self, 'model') is False:
+            raise utils.FitError('prediction attempted before call to fit()')
+        X = concatenate_channels(Xs)
+        return utils.predict_with_methods(self.model, X, method_names)
 
     def _more_tags(self):
         return {'multichannel': True}
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'classes_'):
             clone.classes_ = self.classes_.copy()
         if hasattr(self, 'model'):
-            clone.model = utils.get_clone(self.model)
+            clone.model = utils.get_fitted_clone(self.model, copy_on_write)
         return clone
 
     def get_descriptor(self, verbose=0, params=None):
@@ -1172,11 +2126,46 @@ class ChannelEnsemble(Cloneable, Saveable):
         - The number of parallel processes to run for base predictor fitting.
         - If int : Use up to base_processes number of processes.
         - If 'max' : Use all available CPUs.
+        - With internal cv, the full training set fits and the internal cv
+          split fits of all base predictors are run as one flat list of
+          jobs over these processes.
     cv_processes : int or 'max', default=1
         - The number of parallel processes to run for internal cross
-          validation.
+          validation when base predictors are fit in a single process.
         - If int : Use up to cv_processes number of processes.
         - If 'max' : Use all available CPUs.
+    cache_meta_features : bool, default=False
+        - If True : The meta-predictor training features and targets are
+          kept after fit (meta_X_ and meta_y_ attributes) so that
+          alternative meta-predictors can be evaluated with
+          score_meta_predictors() and swapped in with set_meta_predictor()
+          without refitting the base predictors.
+        - If False : Meta-features are discarded after fit.
+    blend_holdout : float or None, default=None
+        - Fraction of the training samples held out for blending, an
+          alternative to internal cv with one base predictor fit instead of
+          k + 1.
+        - If float : Each base predictor is fit on the remaining samples,
+          and its predictions on the holdout samples are used to score it
+          (for score_selector) and to train the meta-predictor.  Takes
+          precedence over internal_cv.
+        - If None : Blending is disabled.
+    blend_refit : bool, default=True
+        - If True : Base predictors are refit on all training samples after
+          blending.
+        - If False : Base predictors fit on the blend training samples are
+          used for inference.
+    kernel_cache : float or None, default=None
+        - Memory budget in MB for each channel's precomputed kernel (Gram)
+          matrix when base predictors are kernel methods like SVC and
+          internal cv is active (see :class:`SingleChannelCV`).
+        - If float : Each channel's Gram matrix is computed once and shared
+          by its internal cv fold models and its full training set model.
+          Channels whose matrix exceeds the budget compute kernels on the
+          fly.
+        - If None : Kernels are computed by the base predictors.
+    random_state : int, RandomState instance, or None, default=None
+        Seed or random number generator for the blend holdout split.
 
     Examples
     --------
@@ -1218,10 +2207,13 @@ class ChannelEnsemble(Cloneable, Saveable):
                  score_selector=None,
                  disable_cv_train=False,
                  base_predict_methods='auto',
-                 base_processes=1, cv_processes=1):
+                 base_processes=1, cv_processes=1,
+                 cache_meta_features=False, blend_holdout=None,
+                 blend_refit=True, kernel_cache=None, random_state=None):
         self._params_to_attributes(ChannelEnsemble.__init__, locals())
 
-        if internal_cv is None and score_selector is not None:
+        if (internal_cv is None and blend_holdout is None and
+                score_selector is not None):
             raise ValueError('Must choose an internal cv method when channel '
                              'selection is activated')
 
@@ -1279,28 +2271,41 @@ class ChannelEnsemble(Cloneable, Saveable):
 
     @staticmethod
     def _fit_job(predictor, X, y, internal_cv, base_predict_method,
-                 cv_processes, scorer, fit_params):
+                 cv_processes, scorer, fit_params, transform,
+                 blend_split=None, blend_refit=True, kernel_cache=None):
         if X is None:
             return None, None, None, None
-        model = transform_wrappers.SingleChannel(predictor,
-                                                 base_predict_method)
-        model = utils.get_clone(model)
-        predictions = model.fit_transform(X, y, **fit_params)
-
-        cv_predictions, score = None, None
-        if internal_cv is not None:
-            model_cv = utils.get_clone(predictor)
-            model_cv = transform_wrappers.SingleChannelCV(
-                                                model_cv, base_predict_method,
-                                                internal_cv, cv_processes,
-                                                scorer)
-            cv_predictions = model_cv.fit_transform(X, y, **fit_params)
-            score = model_cv.score_
+        if blend_split is not None:
+            return _fit_blend_job(predictor, X, y, base_predict_method,
+                                  scorer, fit_params, blend_split,
+                                  blend_refit)
+        predictions, cv_predictions, score = None, None, None
+        if internal_cv is None:
+            model = transform_wrappers.SingleChannel(predictor,
+                                                     base_predict_method)
+            if transform:
+                predictions = model.fit_transform(X, y, **fit_params)
+            else:
+                model.fit(X, y, **fit_params)
+        else:
+            # the full training set fit made by fit_transform() is reused for
+            # inference so that each predictor is fit only once on all samples
+            model = transform_wrappers.SingleChannelCV(
+                                    predictor, base_predict_method,
+                                    internal_cv, cv_processes,
+                                    score_method='predict', scorer=scorer,
+                                    kernel_cache=kernel_cache)
+            cv_predictions = model.fit_transform(X, y, **fit_params)
+            if transform:
+                predictions = model.transform(X)
+            score = model.score_
 
         return model, predictions, cv_predictions, score
 
     def fit(self, Xs, y=None, **fit_params):
 
+        self.fused_linear_, self.cascade_ = None, None
+        self.meta_X_, self.meta_y_ = None, None
         if self._estimator_type == 'classifier' and y is not None:
             self.classes_, y = np.unique(y, return_inverse=True)
 
@@ -1320,16 +2325,40 @@ class ChannelEnsemble(Cloneable, Saveable):
         else:
             methods = [self.base_predict_methods for X in Xs]
 
+        blend_split = None
+        if self.blend_holdout is not None:
+            blend_split = _get_blend_split(
+                y, self.blend_holdout, self._estimator_type == 'classifier',
+                self.random_state)
+
+        # full training set predictions are only needed to train the
+        # meta-predictor when internal cv or holdout outputs are not used
+        transform = (self.meta_predictor is not None and
+                     blend_split is None and
+                     (self.internal_cv is None or
+                      self.disable_cv_train is True))
         args_list = [(p, X, y, self.internal_cv, m, self.cv_processes,
-                      self.scorer, fit_params)
+                      self.scorer, fit_params, transform, blend_split,
+                      self.blend_refit, self.kernel_cache)
                      for p, X, m in zip(predictors, Xs, methods)]
 
+        # kernel caches are built inside each channel's fit job
+        fit_results = None
+        if (_use_flat_cv(self.internal_cv, blend_split, self.base_processes)
+                and self.kernel_cache is None):
+            wrappers = [transform_wrappers.SingleChannelCV(
+                                p, m, self.internal_cv, self.cv_processes,
+                                score_method='predict', scorer=self.scorer)
+                        for p, m in zip(predictors, methods)]
+            fit_results = _fit_flat_cv(wrappers, Xs, y, fit_params,
+                                       transform, self.base_processes)
+
         n_jobs = len(args_list)
         n_processes = 1 if self.base_processes is None else self.base_processes
         n_processes = (n_jobs
                        if (type(n_processes) == int and n_jobs < n_processes)
                        else n_processes)
-        if n_processes == 'max' or n_processes > 1:
+        if fit_results is None and (n_processes == 'max' or n_processes > 1):
             try:
                 shared_mem_objects = [y, self.internal_cv, self.cv_processes,
                                       self.scorer, fit_params]
@@ -1343,11 +2372,13 @@ class ChannelEnsemble(Cloneable, Saveable):
                 print('defaulting to single processor')
                 n_processes = 1
 
-        if type(n_processes) == int and n_processes <= 1:
+        if (fit_results is None and type(n_processes) == int and
+                n_processes <= 1):
             fit_results = [ChannelEnsemble._fit_job(*args)
                            for args in args_list]
 
         models, predictions, cv_predictions, scores = zip(*fit_results)
+        del fit_results
         self.base_models = models
         if scores is not None:
             self.scores_ = list(scores)
@@ -1358,8 +2389,13 @@ class ChannelEnsemble(Cloneable, Saveable):
             self.selected_indices_ = [i for i, X in enumerate(Xs)
                                       if X is not None]
 
-        if self.internal_cv is not None and self.disable_cv_train is False:
+        if blend_split is not None:
+            # the meta-predictor is trained on the holdout samples
             predictions = cv_predictions
+            y = y[blend_split[1]]
+        elif self.internal_cv is not None and self.disable_cv_train is False:
+            predictions = cv_predictions
+        cv_predictions = None
 
         self.base_models = [m if i in self.selected_indices_ else None
                             for i, m in enumerate(self.base_models)]
@@ -1375,16 +2411,29 @@ class ChannelEnsemble(Cloneable, Saveable):
                self.classes_ = model.classes_
             predict_methods = utils.get_predict_methods(model)
         elif self.meta_predictor is not None:
-            meta_X = np.concatenate(predictions, axis=1)
-            self.meta_model = utils.get_clone(self.meta_predictor)
-            self.meta_model.fit(meta_X, y, **fit_params)
-            if hasattr(self.meta_model, 'classes_'):
-                self.classes_ = self.meta_model.classes_
-            predict_methods = utils.get_predict_methods(self.meta_model)
+            self.meta_widths_ = [p.shape[1] for p in predictions]
+            self.meta_dtype_ = np.result_type(*predictions)
+            meta_X = _build_meta_features(_release_outputs(predictions),
+                                          self.meta_widths_, self.meta_dtype_)
+            if self.cache_meta_features is True:
+                self.meta_X_, self.meta_y_ = meta_X, y
+            predict_methods = self._fit_meta_model(meta_X, y, fit_params)
 
         self._set_predictor_interface(predict_methods)
         return self
 
+    def _fit_meta_model(self, meta_X, y, fit_params):
+        # cascades are calibrated for the previous meta-model's weights
+        self.cascade_ = None
+        if hasattr(self, 'cascade_costs_'):
+            del self.cascade_costs_
+        self.meta_model = utils.get_clone(self.meta_predictor,
+                                          copy_on_write=True)
+        self.meta_model.fit(meta_X, y, **fit_params)
+        if hasattr(self.meta_model, 'classes_'):
+            self.classes_ = self.meta_model.classes_
+        return utils.get_predict_methods(self.meta_model)
+
     def get_model_scores(self):
         if hasattr(self, 'scores_'):
             return self.scores_
@@ -1406,6 +2455,139 @@ class ChannelEnsemble(Cloneable, Saveable):
         else:
             return self.base_models
 
+    def set_meta_predictor(self, meta_predictor, **fit_params):
+        """
+        Replace the meta-predictor without refitting the base predictors.
+
+        The new meta-predictor is fit on the meta-features cached during the
+        last call to fit() and the ensemble's prediction interface is updated
+        to match it.
+
+        Parameters
+        ----------
+        meta_predictor : predictor instance
+            Scikit-learn conformant classifier or regressor of the same type
+            as the base predictors.
+        fit_params : dict, default=None
+            Auxiliary parameters to pass to the fit method of the
+            meta-predictor.
+
+        Returns
+        -------
+        self
+        """
+        if getattr(self, 'meta_X_', None) is None:
+            raise utils.FitError('No cached meta-features found.  Fit with '
+                                 'cache_meta_features=True and a '
+                                 'meta_predictor first.')
+        if meta_predictor._estimator_type != self._estimator_type:
+            raise ValueError('Base- and meta- predictors must be the same '
+                             'type (e.g. classifier or regressor).')
+        self.meta_predictor = meta_predictor
+        predict_methods = self._fit_meta_model(self.meta_X_, self.meta_y_,
+                                               fit_params)
+        self._set_predictor_interface(predict_methods)
+        return self
+
+    def score_meta_predictors(self, meta_predictors, cv=None, scorer=None,
+                              n_processes=1):
+        """
+        Cross validate candidate meta-predictors on the cached meta-features.
+
+        Parameters
+        ----------
+        meta_predictors : list of predictor instances
+            Candidate meta-predictors.
+        cv : int, None, or callable, default=None
+            - If int : StratifiedKfold(n_splits=cv) if classifier or
+              KFold(n_splits=cv) if regressor.
+            - If None : default value of 5.
+            - If callable: Assumed to be split generator like scikit-learn
+              KFold.
+        scorer : callable or None, default=None
+            - If callable : Figure of merit with signature
+              score = scorer(y_true, y_pred).
+            - If None : The ensemble's scorer.
+        n_processes : int or 'max', default=1
+            - If int : Cross validate up to n_processes candidates in
+              parallel.
+            - If 'max' : Use all available CPUs.
+
+        Returns
+        -------
+        list
+            Lists of split scores, one per candidate meta-predictor.
+        """
+        if getattr(self, 'meta_X_', None) is None:
+            raise utils.FitError('No cached meta-features found.  Fit with '
+                                 'cache_meta_features=True and a '
+                                 'meta_predictor first.')
+        scorer = self.scorer if scorer is None else scorer
+        return _score_meta_predictors(meta_predictors, self.meta_X_,
+                                      self.meta_y_, cv, scorer, n_processes)
+
+    def fuse_linear_models(self):
+        """
+        Fuse linear base models for faster inference.
+
+        Base models that are scikit-learn linear models are compiled into a
+        single batched matrix product that feeds the meta-predictor.  Fusion
+        is discarded when the ensemble is refit.
+
+        Returns
+        -------
+        self
+        """
+        if hasattr(self, 'base_models') is False:
+            raise utils.FitError('fusion attempted before model fitting')
+        self.fused_linear_ = linear_fusion.fuse_models(self.base_models)
+        return self
+
+    def fit_cascade(self, Xs, tolerance=0.01):
+        """
+        Set up early-exit cascade inference.
+
+        Selected base models are timed on the calibration samples Xs and
+        ordered from cheapest to most expensive.  At inference, samples leave
+        the cascade as soon as the partial soft vote of the models evaluated
+        so far reaches a confidence threshold, so only ambiguous samples
+        reach the expensive models.  The threshold is the lowest one that
+        changes at most a tolerance fraction of the full ensemble's
+        predictions on Xs.  Requires a SoftVotingClassifier meta-predictor.
+        The cascade is discarded when the ensemble is refit.
+
+        Parameters
+        ----------
+        Xs: list of (ndarray.shape(n_samples, n_features) or None)
+            Calibration samples, preferably not used for training.
+        tolerance : float, default=0.01
+            Fraction of calibration samples whose prediction may differ from
+            the prediction of the full ensemble.
+
+        Returns
+        -------
+        self
+        """
+        if hasattr(self, 'base_models') is False:
+            raise utils.FitError('cascade fitting attempted before model '
+                                 'fitting')
+        # meta-features and voting weights follow channel order
+        selected_indices = sorted(self.selected_indices_)
+        weights = _get_cascade_weights(getattr(self, 'meta_model', None),
+                                       len(selected_indices))
+        outputs, costs = _cascade.time_transforms(
+                            [self.base_models[i] for i in selected_indices],
+                            [Xs[i] for i in selected_indices])
+        meta_X = _build_meta_features(_release_outputs(outputs),
+                                      self.meta_widths_, self.meta_dtype_)
+        order = np.argsort(costs, kind='stable')
+        threshold = _cascade.calibrate_cascade(
+                        meta_X, self.meta_widths_, order, weights,
+                        len(self.meta_model.classes_), tolerance)
+        self.cascade_ = (order, threshold)
+        self.cascade_costs_ = costs
+        return self
+
     def predict_with_method(self, Xs, method_name):
         """
         Make channel ensemble predictions with specified method.
@@ -1432,23 +2614,67 @@ class ChannelEnsemble(Cloneable, Saveable):
             - If method_name is 'predict_proba', 'decision_function', or
               'predict_log_proba': ndarray(n_samples, n_classes)
         """
+        return self.predict_methods(Xs, [method_name])[method_name]
+
+    def predict_methods(self, Xs, method_names):
+        """
+        Make channel ensemble predictions with several methods.
+
+        Base model outputs are computed once and shared by all of the
+        meta-predictor prediction methods.
+
+        Parameters
+        ----------
+        Xs: list of (ndarray.shape(n_samples, n_features) or None)
+            List of input feature matrices (or None spaceholders).
+        method_names: list of str
+            Names of the meta-predictor prediction methods to invoke.
+
+        Returns
+        -------
+        dict
+            Predictions indexed by method name.
+        """
         if hasattr(self, 'base_models') is False:
             raise utils.FitError('prediction attempted before model fitting')
 
         if self.meta_predictor is None:
             sel_idx = self.selected_indices_[0]
-            prediction_method = getattr(self.base_models[sel_idx], method_name)
-            predictions = prediction_method(Xs[sel_idx])
+            predictions = utils.predict_with_methods(
+                self.base_models[sel_idx], Xs[sel_idx], method_names)
+        elif getattr(self, 'cascade_', None) is not None:
+            order, threshold = self.cascade_
+            selected_indices = sorted(self.selected_indices_)
+            probs = _cascade.cascade_soft_vote(
+                lambda i, rows: self.base_models[selected_indices[i]]
+                                    .transform(get_rows(
+                                        Xs[selected_indices[i]], rows)),
+                order, _get_cascade_weights(self.meta_model, len(order)),
+                len(self.meta_model.classes_), threshold,
+                Xs[selected_indices[0]].shape[0])
+            predictions = {'predict_proba': probs,
+                           'predict': self.meta_model.classes_[
+                                                np.argmax(probs, axis=1)]}
+            predictions = {m: predictions[m] for m in method_names}
         else:
-            predictions_list = [m.transform(X) for i, (m, X) in
-                                enumerate(zip(self.base_models, Xs))
-                                if i in self.selected_indices_]
-            meta_X = np.concatenate(predictions_list, axis=1)
-            prediction_method = getattr(self.meta_model, method_name)
-            predictions = prediction_method(meta_X)
-
-        if self._estimator_type == 'classifier' and method_name == 'predict':
-            predictions = self.classes_[predictions]
+            fused_outputs = {}
+            if getattr(self, 'fused_linear_', None) is not None:
+                fused_transform, fused_indices = self.fused_linear_
+                fused_Xs = [Xs[i] for i in fused_indices]
+                if all([X is not None for X in fused_Xs]):
+                    fused_outputs = dict(zip(
+                        fused_indices, fused_transform.transform(fused_Xs)))
+            outputs = (fused_outputs[i] if i in fused_outputs
+                       else m.transform(X) for i, (m, X) in
+                       enumerate(zip(self.base_models, Xs))
+                       if i in self.selected_indices_)
+            meta_X = _build_meta_features(outputs, self.meta_widths_,
+                                          self.meta_dtype_)
+            predictions = utils.predict_with_methods(self.meta_model, meta_X,
+                                                     method_names)
+
+        if self._estimator_type == 'classifier' and 'predict' in predictions:
+            predictions['predict'] = self.classes_[predictions['predict']]
         return predictions
 
     def get_screen_results(self):
@@ -1462,11 +2688,11 @@ class ChannelEnsemble(Cloneable, Saveable):
     def _more_tags(self):
         return {'multichannel': False}
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'classes_'):
             clone.classes_ = self.classes_.copy()
         if hasattr(self, 'scores_'):
@@ -1474,8 +2700,19 @@ class ChannelEnsemble(Cloneable, Saveable):
         if hasattr(self, 'selected_indices_'):
             clone.selected_indices_ = self.selected_indices_.copy()
         if hasattr(self, 'base_models'):
-            clone.base_models = [utils.get_clone(m) if m is not None else None
+            clone.base_models = [utils.get_fitted_clone(m, copy_on_write)
                                  for m in self.base_models]
         if hasattr(self, 'meta_model'):
-            clone.meta_model = utils.get_clone(self.meta_model)
+            clone.meta_model = utils.get_fitted_clone(self.meta_model,
+                                                      copy_on_write)
+        if hasattr(self, 'fused_linear_'):
+            clone.fused_linear_ = self.fused_linear_
+        if getattr(self, 'cascade_', None) is not None:
+            clone.cascade_ = self.cascade_
+            clone.cascade_costs_ = self.cascade_costs_.copy()
+        if hasattr(self, 'meta_widths_'):
+            clone.meta_widths_ = self.meta_widths_.copy()
+            clone.meta_dtype_ = self.meta_dtype_
+        if hasattr(self, 'meta_X_'):
+            clone.meta_X_, clone.meta_y_ = self.meta_X_, self.meta_y_
         return clone
@@ -0,0 +1,650 @@
+"""
+Export of fitted pipelines as standalone NumPy inference modules.
+
+Latency-critical services often can't afford to import scikit-learn, ray and
+pandas (or to unpickle a deep pipeline) just to make predictions.
+:func:`export_inference_bundle` writes a fitted MultichannelPipeline to disk
+as a generated Python module and a directory of .npy weight files.  The
+generated module depends only on NumPy and exposes the pipeline's prediction
+methods as functions that take the same list of input matrices as the
+pipeline.
+
+Supported pipes:
+    - StandardScaler, MinMaxScaler, and MaxAbsScaler
+    - scikit-learn linear classifiers and regressors (e.g.
+      LogisticRegression, LinearSVC, Ridge, LinearRegression)
+    - ChannelConcatenator
+    - SoftVotingClassifier, HardVotingClassifier, and AggregatingRegressor
+      (with np.mean, np.median, np.min, np.max, or np.sum aggregators)
+    - SingleChannel, SingleChannelCV, Multichannel, and MultichannelCV
+      wrappers, MultichannelPredictor, Ensemble, and ChannelEnsemble built
+      from the pipes above
+
+Export raises NotImplementedError with a list of the unsupported pipes when
+other pipes are present, in which case the pipeline itself should be used
+(or saved with pickle) for inference.
+
+Examples
+--------
+::
+
+    import numpy as np
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.linear_model import LogisticRegression
+    import pipecaster as pc
+    from pipecaster.inference_bundle import load_inference_bundle
+
+    Xs, y, _ = pc.make_multi_input_classification(n_informative_Xs=3,
+                                                  n_random_Xs=7)
+    clf = pc.MultichannelPipeline(n_channels=10)
+    clf.add_layer(StandardScaler())
+    clf.add_layer(pc.ChannelEnsemble(LogisticRegression(),
+                                     pc.SoftVotingClassifier()))
+    clf.fit(Xs, y)
+    clf.export_inference_bundle('bundle_dir', module_name='my_model')
+
+    # in the inference service (requires only NumPy):
+    #     import sys; sys.path.append('bundle_dir')
+    #     import my_model
+    #     my_model.predict(Xs)
+    bundle = load_inference_bundle('bundle_dir', module_name='my_model')
+    np.array_equal(bundle.predict(Xs), clf.predict(Xs))
+    # output: True
+"""
+
+import importlib.util
+import os
+import numpy as np
+
+from sklearn.preprocessing import StandardScaler, MinMaxScaler, MaxAbsScaler
+from sklearn.linear_model import LogisticRegression
+try:
+    from sklearn.linear_model._base import LinearModel, LinearClassifierMixin
+except ImportError:
+    LinearModel, LinearClassifierMixin = None, None
+
+import pipecaster.utils as utils
+import pipecaster.transform_wrappers as transform_wrappers
+from pipecaster.multichannel_pipeline import ChannelConcatenator
+from pipecaster.ensemble_learning import SoftVotingClassifier
+from pipecaster.ensemble_learning import HardVotingClassifier
+from pipecaster.ensemble_learning import AggregatingRegressor
+from pipecaster.ensemble_learning import Ensemble, ChannelEnsemble
+from pipecaster.ensemble_learning import MultichannelPredictor
+
+__all__ = ['export_inference_bundle', 'load_inference_bundle',
+           'get_unsupported_pipes']
+
+_aggregator_names = {np.mean: 'np.mean', np.median: 'np.median',
+                     np.min: 'np.min', np.max: 'np.max', np.sum: 'np.sum'}
+
+# NumPy kernels copied verbatim into each generated module
+_kernels = '''
+def _check_input(Xs):
+    return [np.asarray(X, dtype=float) if X is not None else None
+            for X in Xs]
+
+
+def _concatenate(Xs):
+    live_Xs = [X for X in Xs if X is not None]
+    if len(live_Xs) == 0:
+        return None
+    elif len(live_Xs) == 1:
+        return live_Xs[0]
+    else:
+        return np.concatenate(live_Xs, axis=1)
+
+
+def _standard_scale(X, mean, scale):
+    if mean is not None:
+        X = X - mean
+    if scale is not None:
+        X = X / scale
+    return X
+
+
+def _minmax_scale(X, scale, min_, clip_range):
+    X = X * scale
+    X += min_
+    if clip_range is not None:
+        np.clip(X, clip_range[0], clip_range[1], out=X)
+    return X
+
+
+def _decision_function(X, coef, intercept):
+    scores = X @ coef.T + intercept
+    return scores.ravel() if scores.shape[1] == 1 else scores
+
+
+def _classify(scores, classes):
+    if scores.ndim == 1:
+        indices = (scores > 0).astype(int)
+    else:
+        indices = scores.argmax(axis=1)
+    return classes[indices]
+
+
+def _proba_ovr(scores):
+    probs = 1.0 / (1.0 + np.exp(-scores))
+    if probs.ndim == 1:
+        return np.vstack([1 - probs, probs]).T
+    return probs / probs.sum(axis=1).reshape((probs.shape[0], -1))
+
+
+def _proba_softmax(scores):
+    if scores.ndim == 1:
+        scores = np.c_[-scores, scores]
+    scores = scores - scores.max(axis=1).reshape((-1, 1))
+    probs = np.exp(scores)
+    return probs / probs.sum(axis=1).reshape((-1, 1))
+
+
+def _transform_output(X_t, is_classifier):
+    if len(X_t.shape) == 1:
+        X_t = X_t.reshape(-1, 1)
+    elif len(X_t.shape) == 2 and X_t.shape[1] == 2 and is_classifier:
+        X_t = X_t[:, 1].reshape(-1, 1)
+    return X_t
+
+
+def _decatenate(meta_X, n_classes):
+    if n_classes == 2:
+        n_rows, n_cols = meta_X.shape[0], 2 * meta_X.shape[1]
+        expanded_X = np.empty((n_rows, n_cols))
+        expanded_X[:, range(0, n_cols, 2)] = 1.0 - meta_X
+        expanded_X[:, range(1, n_cols + 1, 2)] = meta_X
+        meta_X = expanded_X
+    return [meta_X[:, i:i + n_classes]
+            for i in range(0, meta_X.shape[1], n_classes)]
+
+
+def _soft_vote(meta_X, n_classes):
+    return np.mean(_decatenate(meta_X, n_classes), axis=0)
+
+
+def _hard_vote(meta_X, n_classes):
+    decisions = np.stack([np.argmax(X, axis=1)
+                          for X in _decatenate(meta_X, n_classes)])
+    counts = np.stack([np.sum(decisions == c, axis=0)
+                       for c in range(n_classes)])
+    return np.argmax(counts, axis=0)
+
+
+def _collect(predictions, classes):
+    if classes is not None:
+        predictions = [classes[p] if p is not None else None
+                       for p in predictions]
+    outputs = [p for p in predictions if p is not None]
+    return outputs[0] if len(outputs) == 1 else predictions
+'''
+
+
+class _BundleWriter:
+    """
+    Accumulate weights and unsupported pipes during export.
+    """
+
+    def __init__(self):
+        self.weights = {}
+        self.unsupported = []
+
+    def add_weight(self, name, value):
+        value = np.asarray(value)
+        if value.dtype.kind == 'O':
+            raise NotImplementedError('object arrays (e.g. class labels) '
+                                      'can not be exported')
+        self.weights[name] = value
+        return "W['{}']".format(name)
+
+
+def _is_linear_classifier(model, method_name):
+    if (LinearClassifierMixin is None or
+            isinstance(model, LinearClassifierMixin) is False):
+        return False
+    method = getattr(type(model), method_name, None)
+    if method_name == 'predict_proba':
+        return method is LogisticRegression.predict_proba
+    elif method_name == 'predict_log_proba':
+        return method is LogisticRegression.predict_log_proba
+    else:
+        return method is getattr(LinearClassifierMixin, method_name, None)
+
+
+def _is_linear_regressor(model):
+    return (LinearModel is not None and isinstance(model, LinearModel) and
+            utils.is_regressor(model) is True and
+            type(model).predict is LinearModel.predict)
+
+
+def _get_proba_kernel(model):
+    """
+    Reproduce LogisticRegression's choice of one-vs-rest or softmax probs.
+    """
+    multi_class = getattr(model, 'multi_class', 'auto')
+    is_ovr = multi_class in ['ovr', 'warn'] or (
+        multi_class in ['auto', 'deprecated'] and
+        (len(model.classes_) <= 2 or model.solver == 'liblinear'))
+    return '_proba_ovr' if is_ovr else '_proba_softmax'
+
+
+def _resolve_transform_method(wrapper):
+    if wrapper.transform_method == 'auto':
+        return transform_wrappers.get_transform_method(wrapper.model)
+    else:
+        return wrapper.transform_method
+
+
+def _predict_expr(writer, model, method_name, name, X):
+    """
+    Get an expression for a single channel prediction or None if the model
+    is not supported.
+    """
+    if isinstance(model, (transform_wrappers.SingleChannel,
+                          transform_wrappers.SingleChannelCV)):
+        return _predict_expr(writer, model.model, method_name, name, X)
+
+    elif _is_linear_classifier(model, method_name):
+        coef = writer.add_weight(name + '_coef', model.coef_)
+        intercept = writer.add_weight(name + '_intercept', model.intercept_)
+        scores = '_decision_function({}, {}, {})'.format(X, coef, intercept)
+        if method_name == 'decision_function':
+            return scores
+        elif method_name == 'predict':
+            classes = writer.add_weight(name + '_classes', model.classes_)
+            return '_classify({}, {})'.format(scores, classes)
+        elif method_name == 'predict_proba':
+            return '{}({})'.format(_get_proba_kernel(model), scores)
+        elif method_name == 'predict_log_proba':
+            return 'np.log({}({}))'.format(_get_proba_kernel(model), scores)
+
+    elif _is_linear_regressor(model) and method_name == 'predict':
+        coef = writer.add_weight(name + '_coef', model.coef_)
+        intercept = writer.add_weight(name + '_intercept', model.intercept_)
+        return '({} @ {}.T + {})'.format(X, coef, intercept)
+
+    elif (type(model) in [SoftVotingClassifier, HardVotingClassifier] and
+            model.weights is None):
+        classes = writer.add_weight(name + '_classes', model.classes_)
+        n_classes = len(model.classes_)
+        if type(model) == SoftVotingClassifier:
+            probs = '_soft_vote({}, {})'.format(X, n_classes)
+            if method_name == 'predict_proba':
+                return probs
+            elif method_name == 'predict':
+                return '{}[np.argmax({}, axis=1)]'.format(classes, probs)
+        elif method_name == 'predict':
+            return '{}[_hard_vote({}, {})]'.format(classes, X, n_classes)
+
+    elif (type(model) == AggregatingRegressor and method_name == 'predict'
+            and model.aggregator in _aggregator_names):
+        return '{}({}, axis=1)'.format(_aggregator_names[model.aggregator], X)
+
+    elif type(model) == Ensemble and hasattr(model, 'base_models'):
+        if model.meta_predictor is None:
+            predictions = _predict_expr(writer, model.base_models[0],
+                                        method_name, name + '_b0', X)
+        else:
+            transforms = [_transform_expr(writer, m, '{}_b{}'.format(name, i),
+                                          X)
+                          for i, m in enumerate(model.base_models)]
+            if None in transforms:
+                return None
+            meta_X = 'np.concatenate([{}], axis=1)'.format(
+                ', '.join(transforms))
+            predictions = _predict_expr(writer, model.meta_model,
+                                        method_name, name + '_meta', meta_X)
+        return _decode_expr(writer, model, method_name, name, predictions)
+
+    return None
+
+
+def _multichannel_predict_expr(writer, model, method_name, name, channels):
+    """
+    Get an expression for a multichannel prediction or None if the model is
+    not supported.  channels is a list of input channel expressions.
+    """
+    if isinstance(model, (transform_wrappers.Multichannel,
+                          transform_wrappers.MultichannelCV)):
+        return _multichannel_predict_expr(writer, model.model, method_name,
+                                          name, channels)
+
+    elif type(model) == MultichannelPredictor and hasattr(model, 'model'):
+        X = '_concatenate([{}])'.format(', '.join(channels))
+        return _predict_expr(writer, model.model, method_name, name, X)
+
+    elif type(model) == ChannelEnsemble and hasattr(model, 'base_models'):
+        selected_indices = model.selected_indices_
+        if model.meta_predictor is None:
+            i = selected_indices[0]
+            predictions = _predict_expr(writer, model.base_models[i],
+                                        method_name,
+                                        '{}_b{}'.format(name, i),
+                                        channels[i])
+        else:
+            transforms = [_transform_expr(writer, model.base_models[i],
+                                          '{}_b{}'.format(name, i),
+                                          channels[i])
+                          for i in selected_indices]
+            if None in transforms:
+                return None
+            meta_X = 'np.concatenate([{}], axis=1)'.format(
+                ', '.join(transforms))
+            predictions = _predict_expr(writer, model.meta_model,
+                                        method_name, name + '_meta', meta_X)
+        return _decode_expr(writer, model, method_name, name, predictions)
+
+    return None
+
+
+def _decode_expr(writer, model, method_name, name, predictions):
+    """
+    Decode integer class predictions made by pipes that encode targets.
+    """
+    if predictions is None:
+        return None
+    if (method_name == 'predict' and utils.is_classifier(model) and
+            hasattr(model, 'classes_')):
+        classes = writer.add_weight(name + '_classes', model.classes_)
+        return '{}[{}]'.format(classes, predictions)
+    return predictions
+
+
+def _transform_expr(writer, model, name, X):
+    """
+    Get an expression for a single channel transform or None if the model is
+    not supported.
+    """
+    if type(model) == StandardScaler:
+        mean, scale = 'None', 'None'
+        if model.mean_ is not None and model.with_mean:
+            mean = writer.add_weight(name + '_mean', model.mean_)
+        if model.scale_ is not None:
+            scale = writer.add_weight(name + '_scale', model.scale_)
+        return '_standard_scale({}, {}, {})'.format(X, mean, scale)
+
+    elif type(model) == MinMaxScaler:
+        scale = writer.add_weight(name + '_scale', model.scale_)
+        min_ = writer.add_weight(name + '_min', model.min_)
+        clip_range = (repr(tuple(model.feature_range))
+                      if getattr(model, 'clip', False) else 'None')
+        return '_minmax_scale({}, {}, {}, {})'.format(X, scale, min_,
+                                                      clip_range)
+
+    elif type(model) == MaxAbsScaler:
+        scale = writer.add_weight(name + '_scale', model.scale_)
+        return '({} / {})'.format(X, scale)
+
+    elif isinstance(model, (transform_wrappers.SingleChannel,
+                            transform_wrappers.SingleChannelCV)):
+        if hasattr(model, 'model') is False:
+            return None
+        method_name = _resolve_transform_method(model)
+        predictions = _predict_expr(writer, model.model, method_name, name, X)
+        if predictions is None:
+            return None
+        return '_transform_output({}, {})'.format(
+            predictions, utils.is_classifier(model.model) is True)
+
+    return None
+
+
+def _multichannel_transform_stmt(writer, model, name, channel_indices):
+    """
+    Get a statement assigning multichannel transform outputs or None if the
+    model is not supported.
+    """
+    channels = ['Xs[{}]'.format(i) for i in channel_indices]
+    if type(model) == ChannelConcatenator:
+        outputs = ['_concatenate([{}])'.format(', '.join(channels))]
+    elif isinstance(model, (transform_wrappers.Multichannel,
+                            transform_wrappers.MultichannelCV)):
+        method_name = model.transform_method
+        predictions = _multichannel_predict_expr(writer, model.model,
+                                                 method_name, name, channels)
+        if predictions is None:
+            return None
+        outputs = ['_transform_output(np.array({}), {})'.format(
+            predictions, utils.is_classifier(model.model) is True)]
+    else:
+        return None
+    outputs += ['None' for i in range(len(channels) - 1)]
+    return 'Xs_t[{}:{}] = [{}]'.format(channel_indices[0],
+                                       channel_indices[-1] + 1,
+                                       ', '.join(outputs))
+
+
+def _build_expr(build, writer, *args):
+    """
+    Call an expression builder, returning None if the expression needs
+    weights that can not be exported (e.g. object dtype class labels).
+    """
+    try:
+        return build(writer, *args)
+    except NotImplementedError:
+        return None
+
+
+def _layer_transform_lines(writer, layer, layer_index):
+    lines = ['def _transform_layer_{}(Xs):'.format(layer_index),
+             '    Xs_t = list(Xs)']
+    for model_index, (model, slice_, channel_indices) in enumerate(
+            layer.model_list):
+        name = 'l{}_m{}'.format(layer_index, model_index)
+        if utils.is_multichannel(model):
+            stmt = _build_expr(_multichannel_transform_stmt, writer, model,
+                               name, channel_indices)
+            if stmt is None:
+                writer.unsupported.append((layer_index, model_index, model))
+            else:
+                lines.append('    ' + stmt)
+        else:
+            i = channel_indices[0]
+            X = 'Xs[{}]'.format(i)
+            expr = _build_expr(_transform_expr, writer, model, name, X)
+            if expr is None:
+                writer.unsupported.append((layer_index, model_index, model))
+            else:
+                lines.append('    if {} is not None:'.format(X))
+                lines.append('        Xs_t[{}] = {}'.format(i, expr))
+    lines.append('    return Xs_t')
+    return lines
+
+
+def _predict_lines(writer, pipeline, method_name):
+    layer_index = len(pipeline.layers) - 1
+    layer = pipeline.layers[-1]
+    lines = ['def {}(Xs):'.format(method_name),
+             '    """',
+             '    Pipeline {}() on a list of input matrices.'.format(
+                 method_name),
+             '    """',
+             '    Xs = _check_input(Xs)']
+    lines += ['    Xs = _transform_layer_{}(Xs)'.format(i)
+              for i in range(layer_index)]
+    lines.append('    predictions = [None for X in Xs]')
+    for model_index, (model, slice_, channel_indices) in enumerate(
+            layer.model_list):
+        if hasattr(model, method_name) is False:
+            continue
+        name = 'l{}_m{}'.format(layer_index, model_index)
+        try:
+            if utils.is_multichannel(model):
+                channels = ['Xs[{}]'.format(i) for i in channel_indices]
+                expr = _multichannel_predict_expr(writer, model, method_name,
+                                                  name, channels)
+            else:
+                expr = _predict_expr(writer, model, method_name, name,
+                                     'Xs[{}]'.format(channel_indices[0]))
+        except NotImplementedError:
+            writer.unsupported.append((layer_index, model_index, model))
+            return None
+        if expr is None:
+            return None
+        lines.append('    predictions[{}] = {}'.format(channel_indices[0],
+                                                       expr))
+    classes = 'None'
+    if method_name == 'predict' and utils.is_classifier(pipeline):
+        try:
+            classes = writer.add_weight('classes', pipeline.classes_)
+        except NotImplementedError:
+            writer.unsupported += [(layer_index, model_index, model)
+                                   for model_index, (model, _, _)
+                                   in enumerate(layer.model_list)]
+            return None
+    lines.append('    return _collect(predictions, {})'.format(classes))
+    return lines
+
+
+def _generate_bundle(pipeline, module_name='pipecaster_bundle'):
+    """
+    Generate bundle code and weights for a fitted pipeline.
+
+    Returns
+    -------
+    (code, weights, method_names, unsupported)
+    """
+    if hasattr(pipeline.layers[-1], 'model_list') is False:
+        raise utils.FitError('export attempted before fitting')
+    writer = _BundleWriter()
+    function_lines = []
+    for layer_index, layer in enumerate(pipeline.layers[:-1]):
+        function_lines += _layer_transform_lines(writer, layer, layer_index)
+        function_lines += ['', '']
+
+    method_names = []
+    layer_index = len(pipeline.layers) - 1
+    for method_name in utils.get_predict_methods(pipeline):
+        method_writer = _BundleWriter()
+        method_writer.weights = dict(writer.weights)
+        lines = _predict_lines(method_writer, pipeline, method_name)
+        if lines is not None:
+            writer.weights = method_writer.weights
+            function_lines += lines + ['', '']
+            method_names.append(method_name)
+        for pipe in method_writer.unsupported:
+            if all([pipe[:2] != p[:2] for p in writer.unsupported]):
+                writer.unsupported.append(pipe)
+    if len(method_names) == 0 and len(writer.unsupported) == 0:
+        for model_index, (model, _, _) in enumerate(
+                pipeline.layers[-1].model_list):
+            writer.unsupported.append((layer_index, model_index, model))
+
+    layer_descriptors = []
+    for layer in pipeline.layers:
+        descriptors = [utils.get_descriptor(m, verbose=0)
+                       for m, _, _ in layer.model_list]
+        layer_descriptors.append(', '.join(sorted(set(descriptors))))
+    header = ['"""',
+              'NumPy inference module generated by pipecaster.',
+              '',
+              'Layers: {}'.format(' -> '.join(layer_descriptors)),
+              'Methods: {}'.format(', '.join(method_names)),
+              '"""',
+              '',
+              'import os',
+              'import numpy as np',
+              '',
+              '__all__ = {}'.format(repr(method_names)),
+              '',
+              '_WEIGHTS_DIR = os.path.join(os.path.dirname('
+              'os.path.abspath(__file__)),',
+              '                            {})'.format(
+                  repr(module_name + '_weights')),
+              'W = {name: np.load(os.path.join(_WEIGHTS_DIR, name + '
+              '\'.npy\'))',
+              '     for name in [{}]}}'.format(
+                  ',\n                  '.join(
+                      [repr(name) for name in sorted(writer.weights)]))]
+    code = '\n'.join(header) + '\n\n' + _kernels + '\n\n'
+    code += '\n'.join(function_lines).rstrip() + '\n'
+    return code, writer.weights, method_names, writer.unsupported
+
+
+def get_unsupported_pipes(pipeline):
+    """
+    Get the pipes that prevent a fitted pipeline from being exported.
+
+    Parameters
+    ----------
+    pipeline : MultichannelPipeline
+        Fitted pipeline.
+
+    Returns
+    -------
+    list of tuples
+        List of (layer_index, model_index, model) tuples, with an empty list
+        indicating that the pipeline can be exported.
+    """
+    return _generate_bundle(pipeline)[3]
+
+
+def export_inference_bundle(pipeline, directory,
+                            module_name='pipecaster_bundle'):
+    """
+    Export a fitted pipeline as a NumPy-only inference module.
+
+    Parameters
+    ----------
+    pipeline : MultichannelPipeline
+        Fitted pipeline.
+    directory : str
+        Directory in which to write the bundle (created if missing).
+    module_name : str, default='pipecaster_bundle'
+        Name of the generated module.  The bundle consists of the file
+        <module_name>.py and the weight directory <module_name>_weights/.
+
+    Returns
+    -------
+    list of str
+        Names of the prediction methods defined in the generated module.
+        Prediction methods of the pipeline that can not be generated (e.g.
+        predict_proba for an unsupported linear classifier) are omitted.
+
+    Raises
+    ------
+    NotImplementedError
+        If the pipeline contains pipes that are not supported, in which case
+        nothing is written.
+    """
+    code, weights, method_names, unsupported = _generate_bundle(pipeline,
+                                                                module_name)
+    if len(unsupported) > 0:
+        descriptions = ['layer {} pipe {}: {}'.format(
+                            layer_index, model_index,
+                            utils.get_descriptor(model, verbose=0))
+                        for layer_index, model_index, model in unsupported]
+        raise NotImplementedError(
+            'Inference bundle export does not support the following pipes '
+            '(use the pipeline itself for inference): ' +
+            '; '.join(descriptions))
+    weights_dir = os.path.join(directory, module_name + '_weights')
+    os.makedirs(weights_dir, exist_ok=True)
+    for name, value in weights.items():
+        np.save(os.path.join(weights_dir, name + '.npy'), value,
+                allow_pickle=False)
+    with open(os.path.join(directory, module_name + '.py'), 'w') as f:
+        f.write(code)
+    return method_names
+
+
+def load_inference_bundle(directory, module_name='pipecaster_bundle'):
+    """
+    Import a module written by export_inference_bundle().
+
+    Parameters
+    ----------
+    directory : str
+        Directory containing the bundle.
+    module_name : str, default='pipecaster_bundle'
+        Name of the generated module.
+
+    Returns
+    -------
+    module
+        The generated inference module.
+    """
+    path = os.path.join(directory, module_name + '.py')
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,182 @@
+"""
+Fused inference for groups of fitted linear models.
+
+Wide layers of linear probes (e.g. SingleChannel(LogisticRegression()) mapped
+to hundreds of channels) spend most of their inference time in Python
+dispatch overhead because each channel performs a separate small matrix
+product.  :class:`FusedLinearTransform` collects the coefficients of fitted
+linear models into zero-padded weight tensors so that all of the per-channel
+outputs are computed in one batched matrix product.
+
+Users will not generally use this module directly.  Fusion is activated by
+calling fuse_linear_models() on a fitted MultichannelPipeline, Layer,
+Ensemble, or ChannelEnsemble.
+"""
+
+import numpy as np
+import scipy.sparse as sp
+
+try:
+    from sklearn.linear_model._base import LinearModel, LinearClassifierMixin
+except ImportError:
+    LinearModel, LinearClassifierMixin = None, None
+
+import pipecaster.utils as utils
+import pipecaster.transform_wrappers as transform_wrappers
+
+__all__ = ['get_linear_params', 'FusedLinearTransform', 'fuse_models']
+
+
+def get_linear_params(model):
+    """
+    Get the affine parameters of a fitted linear transform wrapper.
+
+    Parameters
+    ----------
+    model : pipe instance
+        Fitted pipe.
+
+    Returns
+    -------
+    (coef, intercept) or None
+        coef is an ndarray.shape(n_features, n_outputs) and intercept an
+        ndarray.shape(n_outputs,) such that model.transform(X) equals
+        X @ coef + intercept.  None is returned if the model is not a fitted
+        SingleChannel or SingleChannelCV wrapper around a scikit-learn linear
+        classifier transforming with decision_function() or a linear regressor
+        transforming with predict().
+    """
+    if LinearModel is None:
+        return None
+    if type(model) not in [transform_wrappers.SingleChannel,
+                           transform_wrappers.SingleChannelCV]:
+        return None
+    if hasattr(model, 'model') is False:
+        return None
+
+    estimator = model.model
+    if model.transform_method == 'auto':
+        transform_method = transform_wrappers.get_transform_method(estimator)
+    else:
+        transform_method = model.transform_method
+
+    if (isinstance(estimator, LinearClassifierMixin) and
+            transform_method == 'decision_function'):
+        pass
+    elif (isinstance(estimator, LinearModel) and
+            utils.is_regressor(estimator) and
+            transform_method == 'predict'):
+        pass
+    else:
+        return None
+
+    coef = estimator.coef_
+    coef = coef.toarray() if sp.issparse(coef) else np.asarray(coef)
+    coef = np.atleast_2d(coef).T
+    intercept = np.broadcast_to(np.asarray(estimator.intercept_, dtype=float),
+                                (coef.shape[1],))
+    return coef, intercept
+
+
+class FusedLinearTransform:
+    """
+    Batched transform for a group of fitted linear models.
+
+    Parameters
+    ----------
+    params_list : list of tuples
+        List of (coef, intercept) tuples from get_linear_params(), one per
+        model.
+
+    Notes
+    -----
+    Coefficients are stored in a zero-padded tensor of shape
+    (n_models, max_n_features, max_n_outputs), so inputs of different
+    widths can be transformed in one call to np.matmul.  Outputs are equal to
+    the outputs of the individual models within floating point rounding
+    error.
+    """
+
+    def __init__(self, params_list):
+        self.n_features_ = [coef.shape[0] for coef, _ in params_list]
+        self.n_outputs_ = [coef.shape[1] for coef, _ in params_list]
+        n_models = len(params_list)
+        max_features = max(self.n_features_)
+        max_outputs = max(self.n_outputs_)
+        self.coef_ = np.zeros((n_models, max_features, max_outputs))
+        self.intercept_ = np.zeros((n_models, 1, max_outputs))
+        for i, (coef, intercept) in enumerate(params_list):
+            self.coef_[i, :coef.shape[0], :coef.shape[1]] = coef
+            self.intercept_[i, 0, :coef.shape[1]] = intercept
+        # concatenated parameters for models that share an input matrix
+        if len(set(self.n_features_)) == 1:
+            self.shared_coef_ = np.concatenate([c for c, _ in params_list],
+                                               axis=1)
+            self.shared_intercept_ = np.concatenate(
+                [i for _, i in params_list])
+
+    def transform(self, Xs):
+        """
+        Transform one input matrix per model.
+
+        Parameters
+        ----------
+        Xs : list of ndarray.shape(n_samples, n_features)
+            Input matrices in the order of the models.
+
+        Returns
+        -------
+        list of ndarray.shape(n_samples, n_outputs)
+            Transformed outputs, one per model.
+        """
+        n_samples = Xs[0].shape[0]
+        X_batch = np.zeros((len(Xs), n_samples, self.coef_.shape[1]))
+        for i, X in enumerate(Xs):
+            X_batch[i, :, :X.shape[1]] = X
+        outputs = np.matmul(X_batch, self.coef_) + self.intercept_
+        return [outputs[i, :, :k] for i, k in enumerate(self.n_outputs_)]
+
+    def transform_shared(self, X):
+        """
+        Transform a single input matrix with every model.
+
+        Parameters
+        ----------
+        X : ndarray.shape(n_samples, n_features)
+            Input matrix shared by all of the models.
+
+        Returns
+        -------
+        list of ndarray.shape(n_samples, n_outputs)
+            Transformed outputs, one per model.
+        """
+        outputs = X @ self.shared_coef_ + self.shared_intercept_
+        stops = np.cumsum(self.n_outputs_)
+        return [outputs[:, stop - k:stop]
+                for stop, k in zip(stops, self.n_outputs_)]
+
+
+def fuse_models(models):
+    """
+    Build a FusedLinearTransform for the fusable models in a list.
+
+    Parameters
+    ----------
+    models : list
+        List of fitted pipes (or None).
+
+    Returns
+    -------
+    (FusedLinearTransform, list of int) or None
+        The fused transform and the indices of the fused models, or None if
+        fewer than two models can be fused.
+    """
+    params_list, indices = [], []
+    for i, model in enumerate(models):
+        params = get_linear_params(model) if model is not None else None
+        if params is not None:
+            params_list.append(params)
+            indices.append(i)
+    if len(indices) < 2:
+        return None
+    return FusedLinearTransform(params_list), indices
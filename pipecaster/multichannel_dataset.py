@@ -0,0 +1,223 @@
+"""
+Multichannel input container backed by a single contiguous buffer.
+
+Pipecaster pipes accept multichannel inputs as lists of feature matrices
+and None placeholders.  :class:`MultichannelDataset` is a drop-in
+alternative to the list form that stores all of the channels side by side in
+one 2D buffer (optionally memory-mapped) and exposes each channel as a view
+of the buffer.  Concatenating adjacent live channels, which pipecaster does
+when feeding multiple channels to a single predictor, then becomes a zero-copy
+slice of the buffer.
+
+Examples
+--------
+::
+
+    import numpy as np
+    import pipecaster as pc
+    from sklearn.svm import SVC
+    from pipecaster.multichannel_dataset import MultichannelDataset
+
+    Xs, y, _ = pc.make_multi_input_classification(n_informative_Xs=3,
+                                                  n_random_Xs=7)
+    Xs = MultichannelDataset(Xs)
+    clf = pc.MultichannelPipeline(n_channels=10)
+    clf.add_layer(pc.MultichannelPredictor(SVC()))
+    pc.cross_val_score(clf, Xs, y, cv=3)
+"""
+
+import numpy as np
+
+__all__ = ['MultichannelDataset', 'concatenate_channels', 'get_rows']
+
+
+class MultichannelDataset:
+    """
+    List-like multichannel input stored in a contiguous column-block buffer.
+
+    Parameters
+    ----------
+    Xs : list
+        List of 2D feature matrices (ndarray) and None placeholders.  All
+        matrices must have the same number of rows.
+    filename : str or None, default=None
+        - If None : Store the channels in memory.
+        - If str : Store the channels in a memory-mapped file at this path.
+
+    Notes
+    -----
+    MultichannelDataset supports the parts of the list interface that
+    pipecaster uses (len(), iteration, integer and slice indexing, and copy())
+    so it can be passed wherever a list of matrices is accepted.  Integer
+    indexing returns a view of the buffer or None, slicing returns a
+    MultichannelDataset that shares the buffer, and copy() returns a list
+    of channel views that can be modified like the list form.
+
+    All channels are stored with a common dtype (np.result_type of the input
+    matrices), so channel views may be upcast relative to the inputs.
+    """
+
+    def __init__(self, Xs, filename=None):
+        live_Xs = [X for X in Xs if X is not None]
+        for X in live_Xs:
+            if isinstance(X, np.ndarray) is False or len(X.shape) != 2:
+                raise TypeError('MultichannelDataset channels must be 2D '
+                                'ndarrays or None')
+        n_samples = set([X.shape[0] for X in live_Xs])
+        if len(n_samples) > 1:
+            raise ValueError('MultichannelDataset channels must have the '
+                             'same number of rows')
+        n_samples = n_samples.pop() if len(n_samples) == 1 else 0
+
+        widths = [X.shape[1] if X is not None else 0 for X in Xs]
+        stops = np.cumsum(widths)
+        starts = stops - widths
+        dtype = np.result_type(*live_Xs) if len(live_Xs) > 0 else np.float64
+        shape = (n_samples, int(stops[-1]) if len(stops) > 0 else 0)
+
+        if filename is None:
+            self.data = np.empty(shape, dtype=dtype)
+        else:
+            self.data = np.memmap(filename, dtype=dtype, mode='w+',
+                                  shape=shape)
+        for X, start, stop in zip(Xs, starts, stops):
+            if X is not None:
+                self.data[:, start:stop] = X
+
+        self.channel_bounds_ = [(int(start), int(stop))
+                                if X is not None else None
+                                for X, start, stop in zip(Xs, starts, stops)]
+
+    @classmethod
+    def _from_buffer(cls, data, channel_bounds):
+        dataset = cls.__new__(cls)
+        dataset.data = data
+        dataset.channel_bounds_ = channel_bounds
+        return dataset
+
+    def __len__(self):
+        return len(self.channel_bounds_)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MultichannelDataset._from_buffer(
+                        self.data, self.channel_bounds_[index])
+        bounds = self.channel_bounds_[index]
+        if bounds is None:
+            return None
+        else:
+            return self.data[:, bounds[0]:bounds[1]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def copy(self):
+        """
+        Get a list of channel views (and None placeholders).
+        """
+        return list(self)
+
+    def get_rows(self, indices):
+        """
+        Select samples from all channels at once.
+
+        Parameters
+        ----------
+        indices : list/array of ints
+            Indices of the rows to select.
+
+        Returns
+        -------
+        MultichannelDataset
+            Dataset containing the selected rows.  Only the buffer columns
+            spanned by live channels are gathered, and the buffer is shared
+            (not copied) when the indices form a contiguous block.
+        """
+        live_bounds = [b for b in self.channel_bounds_ if b is not None]
+        if len(live_bounds) == 0:
+            return MultichannelDataset._from_buffer(
+                        self.data[:0, :0], list(self.channel_bounds_))
+        low = min([b[0] for b in live_bounds])
+        high = max([b[1] for b in live_bounds])
+        data = get_rows(self.data[:, low:high], indices)
+        channel_bounds = [(b[0] - low, b[1] - low) if b is not None else None
+                          for b in self.channel_bounds_]
+        return MultichannelDataset._from_buffer(data, channel_bounds)
+
+    def concatenate(self):
+        """
+        Concatenate the live channels column-wise.
+
+        Returns
+        -------
+        ndarray or None
+            A view of the buffer if the live channels are adjacent in the
+            buffer, a new matrix otherwise, or None if no channels are live.
+        """
+        live_bounds = [b for b in self.channel_bounds_ if b is not None]
+        if len(live_bounds) == 0:
+            return None
+        is_adjacent = all([b1[1] == b2[0] for b1, b2
+                           in zip(live_bounds[:-1], live_bounds[1:])])
+        if is_adjacent:
+            return self.data[:, live_bounds[0][0]:live_bounds[-1][1]]
+        else:
+            return np.concatenate([self.data[:, b[0]:b[1]]
+                                   for b in live_bounds], axis=1)
+
+
+def concatenate_channels(Xs):
+    """
+    Concatenate the live matrices in a multichannel input.
+
+    Parameters
+    ----------
+    Xs : list or MultichannelDataset
+        List of feature matrices and None placeholders.
+
+    Returns
+    -------
+    ndarray or None
+        Column-wise concatenation of the matrices that are not None (a view
+        when possible), or None if all matrices are None.
+    """
+    if isinstance(Xs, MultichannelDataset):
+        return Xs.concatenate()
+    live_Xs = [X for X in Xs if X is not None]
+    if len(live_Xs) == 0:
+        return None
+    elif len(live_Xs) == 1:
+        return live_Xs[0]
+    else:
+        return np.concatenate(live_Xs, axis=1)
+
+
+def get_rows(X, indices):
+    """
+    Select rows from a feature matrix or multichannel input.
+
+    Parameters
+    ----------
+    X : ndarray, list, MultichannelDataset, or None
+        Single channel feature matrix or multichannel input.
+    indices : list/array of ints
+        Indices of the rows to select.
+
+    Returns
+    -------
+    Selected rows, sharing memory with the input (no copy) when the indices
+    form a contiguous block.
+    """
+    if X is None:
+        return None
+    elif isinstance(X, MultichannelDataset):
+        return X.get_rows(indices)
+    elif isinstance(X, list):
+        return [get_rows(X_, indices) for X_ in X]
+    n_indices = len(indices)
+    if (n_indices > 0 and indices[-1] - indices[0] + 1 == n_indices and
+            np.all(np.diff(indices) == 1)):
+        return X[indices[0]:indices[-1] + 1]
+    else:
+        return X[indices]
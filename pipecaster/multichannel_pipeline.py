@@ -8,7 +8,11 @@ import functools
 
 import pipecaster.utils as utils
 import pipecaster.parallel as parallel
+import pipecaster.linear_fusion as linear_fusion
 from pipecaster.utils import Cloneable, Saveable, FitError
+from pipecaster.multichannel_dataset import MultichannelDataset
+from pipecaster.multichannel_dataset import concatenate_channels
+from pipecaster.prediction_cache import PredictionCache
 
 __all__ = ['Layer', 'MultichannelPipeline', 'ChannelConcatenator']
 
@@ -244,7 +248,7 @@ class Layer(Cloneable, Saveable):
     def _fit_transform_job(pipe, Xs, y, fit_params, slice_, channel_indices):
 
         input_ = Xs[slice_] if utils.is_multichannel(pipe) else Xs[slice_][0]
-        model = utils.get_clone(pipe)
+        model = utils.get_clone(pipe, copy_on_write=True)
 
         if hasattr(model, 'fit_transform'):
             if utils.is_multichannel(model):
@@ -258,7 +262,7 @@ class Layer(Cloneable, Saveable):
                 else:
                     Xs_t = [model.fit_transform(input_, y, **fit_params)]
         elif hasattr(model, 'fit') and hasattr(pipe, 'transform'):
-            if y is not None:
+            if y is None:
                 model.fit(input_, **fit_params)
             else:
                 model.fit(input_, y, **fit_params)
@@ -300,6 +304,9 @@ class Layer(Cloneable, Saveable):
             transformation inactivated the channel (via selection or diversion
             through concatenation), or that the input was None.
         """
+        if getattr(self, 'transform_cache_', None) is not None:
+            self.transform_cache_.clear()
+        self.fused_linear_ = None
         args_list = []
         live_pipes = []
         for i, (pipe, slice_, channel_indices) in enumerate(self.pipe_list):
@@ -366,15 +373,53 @@ class Layer(Cloneable, Saveable):
         -------
         self
         """
+        self._fit_last(Xs, y, fit_params, return_outputs=False)
+        return self
+
+    def fit_last_transform(self, Xs, y=None, **fit_params):
+        """
+        Fit the last layer of a MultichannelPipeline and transform the inputs.
+
+        Equivalent to layer.fit_last(Xs, y).transform(Xs) except that the
+        training data are transformed only once by each model.
+
+        Parameters
+        ----------
+        Xs: list
+            List of feature matrix inputs (or None value placeholders).
+        y: list/array of length n_samples, default=None
+            Optional targets for supervised ML.
+        fit_params: dict, default={}
+            Auxiliary parameters for the fit_transform or fit methods of the
+            pipes. Pipe-specific parameters not yet supported.
+
+        Returns
+        -------
+        Xs_t : list
+            Transformed outputs.  Ordered list of values, one per channel.
+            Value can be either a transformed matrix, a passthrough from the
+            input matrix, or None.
+        """
+        return self._fit_last(Xs, y, fit_params, return_outputs=True)
+
+    def _fit_last(self, Xs, y, fit_params, return_outputs):
+        """
+        Fit models and set output mask, returning training set transforms
+        only when return_outputs is True.
+        """
+        if getattr(self, 'transform_cache_', None) is not None:
+            self.transform_cache_.clear()
+        self.fused_linear_ = None
         self.model_list = []
         prediction_method_names = []
         estimator_types = []
         output_mask = [False for X in Xs]
+        Xs_t = Xs.copy() if return_outputs else None
         for pipe, slice_, channel_indices in self.pipe_list:
             if has_live_channels(Xs, channel_indices):
-                model = utils.get_clone(pipe)
-                input_ = (Xs[slice_] if utils.is_multichannel(model)
-                          else Xs[slice_][0])
+                model = utils.get_clone(pipe, copy_on_write=True)
+                is_multichannel = utils.is_multichannel(model)
+                input_ = Xs[slice_] if is_multichannel else Xs[slice_][0]
                 if y is None:
                     model.fit(input_, **fit_params)
                 else:
@@ -392,14 +437,18 @@ class Layer(Cloneable, Saveable):
                 if utils.is_predictor(model):
                     output_mask[channel_indices[0]] = True
                 if utils.is_transformer(model):
-                    if utils.is_multichannel(model):
-                        outputs = [True if X_t is not None else False
-                                            for X_t in model.transform(input_)]
-                        output_mask[slice_] = outputs
+                    if return_outputs and is_multichannel:
+                        Xs_t[slice_] = model.transform(input_)
+                        output_mask[slice_] = [X_t is not None
+                                               for X_t in Xs_t[slice_]]
+                    elif return_outputs:
+                        Xs_t[channel_indices[0]] = model.transform(input_)
+                        output_mask[channel_indices[0]] = True
+                    elif is_multichannel:
+                        output_mask[slice_] = utils.get_output_mask(model,
+                                                                    input_)
                     else:
-                        output = (True if model.transform(input_) is not None
-                                  else False)
-                        output_mask[slice_] = output
+                        output_mask[channel_indices[0]] = True
 
         prediction_method_names = set(prediction_method_names)
         # expose predictor interface
@@ -415,7 +464,7 @@ class Layer(Cloneable, Saveable):
             self._estimator_type = list(estimator_types)[0]
 
         self.output_mask_ = output_mask
-        return self
+        return Xs_t
 
     def transform(self, Xs):
         """
@@ -438,16 +487,55 @@ class Layer(Cloneable, Saveable):
         if hasattr(self, 'model_list') is False:
             raise utils.FitError('transform attempted before fitting')
         Xs_t = Xs.copy()
-        for model, slice_, channel_indices in self.model_list:
+        transform_cache = getattr(self, 'transform_cache_', None)
+        fused_indices = []
+        if getattr(self, 'fused_linear_', None) is not None:
+            fused_transform, model_indices = self.fused_linear_
+            inputs = [Xs[self.model_list[i][1]][0] for i in model_indices]
+            if all([X is not None for X in inputs]):
+                outputs = fused_transform.transform(inputs)
+                for i, X_t in zip(model_indices, outputs):
+                    Xs_t[self.model_list[i][2][0]] = X_t
+                fused_indices = model_indices
+        for i, (model, slice_, channel_indices) in enumerate(self.model_list):
+            if i in fused_indices:
+                continue
             input_ = (Xs[slice_] if utils.is_multichannel(model)
                       else Xs[slice_][0])
             if utils.is_multichannel(model):
                 Xs_t[slice_] = model.transform(input_)
+            elif transform_cache is not None and input_ is not None:
+                Xs_t[channel_indices[0]] = transform_cache.apply(
+                                model.transform, input_, channel_indices[0])
             else:
                 Xs_t[channel_indices[0]] = model.transform(input_)
 
         return Xs_t
 
+    def fuse_linear_models(self):
+        """
+        Fuse the layer's linear models for faster inference.
+
+        Single channel linear models (SingleChannel or SingleChannelCV
+        wrappers around scikit-learn linear models) are compiled into one
+        batched matrix product that is used by transform().  Models with a
+        fuse_linear_models() method (e.g. ensembles) are fused recursively.
+        Fusion is discarded when the layer is refit.
+
+        Returns
+        -------
+        self
+        """
+        if hasattr(self, 'model_list') is False:
+            raise utils.FitError('fusion attempted before fitting')
+        for model, _, _ in self.model_list:
+            if hasattr(model, 'fuse_linear_models'):
+                model.fuse_linear_models()
+        models = [None if utils.is_multichannel(model) else model
+                  for model, _, _ in self.model_list]
+        self.fused_linear_ = linear_fusion.fuse_models(models)
+        return self
+
     def predict_with_method(self, Xs, method_name):
         """
         Predict with each pipe using methods that match a specified name.
@@ -475,35 +563,66 @@ class Layer(Cloneable, Saveable):
             a matching prediction method, this method returns a list with
             either a prediction array or None value for each input channel.
         """
+        return self.predict_methods(Xs, [method_name])[method_name]
+
+    def predict_methods(self, Xs, method_names):
+        """
+        Predict with several methods, calling each pipe once.
+
+        Parameters
+        ----------
+        Xs: list
+            List of feature matrix inputs (or None value placeholders).
+        method_names: list of str
+            Names of the methods to use for prediction.
+
+        Returns
+        -------
+        dict
+            Predictions indexed by method name, with values as returned by
+            predict_with_method().
+        """
         if hasattr(self, 'model_list') is False:
             raise utils.FitError('prediction attempted before model fitting')
 
-        predictions = [None for X in Xs]
+        for m in method_names:
+            if all([hasattr(model, m) is False
+                    for model, _, _ in self.model_list]):
+                raise AttributeError('prediction method {} not found in '
+                                     'layer'.format(m))
+        predictions = {m: [None for X in Xs] for m in method_names}
 
         for model, slice_, channel_indices in self.model_list:
             input_ = (Xs[slice_] if utils.is_multichannel(model)
                       else Xs[slice_][0])
-            if hasattr(model, method_name):
-                prediction_method = getattr(model, method_name)
-                if utils.is_multichannel(model):
-                    predictions[slice_] = prediction_method(input_)
-                else:
-                    predictions[channel_indices[0]] = prediction_method(input_)
-
-        outputs = [p for p in predictions if p is not None]
-        if len(outputs) == 1:
-            # typical pattern: pipeline has converged to a single y
-            return outputs[0]
-        else:
+            model_methods = [m for m in method_names if hasattr(model, m)]
+            if len(model_methods) > 0:
+                model_predictions = utils.predict_with_methods(
+                                            model, input_, model_methods)
+                for m in model_methods:
+                    predictions[m][channel_indices[0]] = model_predictions[m]
+
+        for m in method_names:
+            outputs = [p for p in predictions[m] if p is not None]
+            if len(outputs) == 1:
+                # typical pattern: pipeline has converged to a single y
+                predictions[m] = outputs[0]
             # atypical pattern: pipeline has not converged and final layer
             # makes multiple predictions
-            return predictions
+        return predictions
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone of the Layer.
+
+        Parameters
+        ----------
+        copy_on_write : bool, default=False
+            - If False: Fitted models are cloned recursively.
+            - If True: Fitted models are shared by reference with the clone
+              until the clone is refit.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, '_all_channels'):
             clone._all_channels = self._all_channels.copy()
         if hasattr(self, '_mapped_channels'):
@@ -512,11 +631,21 @@ class Layer(Cloneable, Saveable):
             clone._estimator_type = self._estimator_type
         if hasattr(self, 'output_mask_'):
             clone.output_mask_ = self.output_mask_.copy()
-        clone.pipe_list = [(utils.get_clone(p), s, i.copy())
-               for p, s, i in self.pipe_list]
+        if hasattr(self, 'fused_linear_'):
+            clone.fused_linear_ = self.fused_linear_
+        clone.pipe_list = [(utils.get_clone(p, copy_on_write=copy_on_write),
+                            s, i.copy())
+                           for p, s, i in self.pipe_list]
         if hasattr(self, 'model_list'):
-            clone.model_list = [(utils.get_clone(p), s, i.copy())
-                                for p, s, i in self.model_list]
+            clone.model_list = [(utils.get_fitted_clone(m, copy_on_write),
+                                 s, i.copy())
+                                for m, s, i in self.model_list]
+            method_names = set([n for m, s, i in clone.model_list
+                                for n in utils.get_predict_methods(m)])
+            for method_name in method_names:
+                prediction_method = functools.partial(
+                    clone.predict_with_method, method_name=method_name)
+                setattr(clone, method_name, prediction_method)
         return clone
 
 
@@ -864,6 +993,101 @@ class MultichannelPipeline(Cloneable, Saveable):
                 layer.pipe_processes = pipe_processes
         return self
 
+    def enable_prediction_cache(self, max_size=10000, ttl=None,
+                                cache_layers=False):
+        """
+        Cache predictions row by row to skip recomputation of repeated rows.
+
+        Parameters
+        ----------
+        max_size : int, default=10000
+            Maximum number of rows stored in each cache.
+        ttl : float or None, default=None
+            Time to live of cached rows in seconds, or None for no expiration.
+        cache_layers : bool, default=False
+            - If False : Cache only the pipeline predictions.
+            - If True : Also cache the transform outputs of the single channel
+              models in each layer, so that repeated feature blocks in a
+              channel are reused even when other channels change.
+
+        Returns
+        -------
+        self
+
+        Notes
+        -----
+        Caches are cleared when the pipeline is refit.
+        """
+        self.prediction_cache_ = PredictionCache(max_size, ttl)
+        for layer in self.layers:
+            layer.transform_cache_ = (PredictionCache(max_size, ttl)
+                                      if cache_layers else None)
+        return self
+
+    def disable_prediction_cache(self):
+        """
+        Remove the prediction caches.
+
+        Returns
+        -------
+        self
+        """
+        self.prediction_cache_ = None
+        for layer in self.layers:
+            layer.transform_cache_ = None
+        return self
+
+    def get_prediction_cache(self):
+        """
+        Get the pipeline's PredictionCache or None if caching is disabled.
+        """
+        return getattr(self, 'prediction_cache_', None)
+
+    def fuse_linear_models(self):
+        """
+        Fuse linear models in each layer for faster inference.
+
+        Groups of fitted single channel linear models within a layer (and
+        within ensembles) are compiled into batched matrix products.  Outputs
+        are unchanged up to floating point rounding error.  Fusion is
+        discarded when the pipeline is refit.
+
+        Returns
+        -------
+        self
+        """
+        for layer in self.layers:
+            layer.fuse_linear_models()
+        return self
+
+    def export_inference_bundle(self, directory,
+                                module_name='pipecaster_bundle'):
+        """
+        Export the fitted pipeline as a NumPy-only inference module.
+
+        See pipecaster.inference_bundle for the supported pipes.
+
+        Parameters
+        ----------
+        directory : str
+            Directory in which to write the bundle (created if missing).
+        module_name : str, default='pipecaster_bundle'
+            Name of the generated module.
+
+        Returns
+        -------
+        list of str
+            Names of the prediction methods defined in the generated module.
+
+        Raises
+        ------
+        NotImplementedError
+            If the pipeline contains pipes that can not be exported.
+        """
+        # avoid circular import
+        from pipecaster.inference_bundle import export_inference_bundle
+        return export_inference_bundle(self, directory, module_name)
+
     def fit(self, Xs, y=None, **fit_params):
         """
         Fit all pipes in the pipeline.
@@ -905,6 +1129,8 @@ class MultichannelPipeline(Cloneable, Saveable):
                 if y is not None:
                     self.classes_, y = np.unique(y, return_inverse=True)
 
+        if self.get_prediction_cache() is not None:
+            self.prediction_cache_.clear()
         for layer in self.layers[:-1]:
             Xs = layer.fit_transform(Xs, y, **fit_params)
         # fit the last layer without transforming:
@@ -957,10 +1183,11 @@ class MultichannelPipeline(Cloneable, Saveable):
             Value can be either a transformed matrix, a passthrough from the
             input matrix, or None.
         """
+        if self.get_prediction_cache() is not None:
+            self.prediction_cache_.clear()
         for layer in self.layers[:-1]:
             Xs = layer.fit_transform(Xs, y,  **fit_params)
-        self.layers[-1].fit_last(Xs, y, **fit_params)
-        return self.layers[-1].transform(Xs)
+        return self.layers[-1].fit_last_transform(Xs, y, **fit_params)
 
     def predict_with_method(self, Xs, method_name):
         """
@@ -989,19 +1216,70 @@ class MultichannelPipeline(Cloneable, Saveable):
             matching prediction method is found, a list with values for each
             input channel (or None placeholders) is returned.
         """
-        Xs = [np.array(X, dtype=float) for X in Xs]
+        Xs = self._convert_inputs(Xs)
+        if self.get_prediction_cache() is not None:
+            predict = functools.partial(self._predict_with_method,
+                                        method_name=method_name)
+            return self.prediction_cache_.apply(predict, Xs, method_name)
+        else:
+            return self._predict_with_method(Xs, method_name)
+
+    def predict_methods(self, Xs, method_names):
+        """
+        Predict with several methods in a single pass through the pipeline.
+
+        The upstream layers transform the inputs once and all of the requested
+        prediction methods of the last layer are evaluated on the shared
+        intermediate outputs.
+
+        Parameters
+        ----------
+        Xs: list
+            List of input feature matrices (or None value placeholders).
+        method_names: list of str
+            Names of the methods to use for prediction, e.g. ['predict',
+            'predict_proba'].
+
+        Returns
+        -------
+        dict
+            Predictions indexed by method name, with values as returned by
+            predict_with_method().
+        """
+        Xs = self._convert_inputs(Xs)
+        if self.get_prediction_cache() is not None:
+            predict = functools.partial(self._predict_methods,
+                                        method_names=method_names)
+            return self.prediction_cache_.apply_multiple(predict, Xs,
+                                                         method_names)
+        else:
+            return self._predict_methods(Xs, method_names)
+
+    @staticmethod
+    def _convert_inputs(Xs):
+        if (isinstance(Xs, MultichannelDataset) is False or
+                Xs.data.dtype != float):
+            Xs = [np.asarray(X, dtype=float) if X is not None else None
+                  for X in Xs]
+        return Xs
+
+    def _predict_with_method(self, Xs, method_name):
+        return self._predict_methods(Xs, [method_name])[method_name]
+
+    def _predict_methods(self, Xs, method_names):
         for layer in self.layers[:-1]:
             Xs = layer.transform(Xs)
-        prediction_method = getattr(self.layers[-1], method_name)
-        predictions = prediction_method(Xs)
+        predictions = self.layers[-1].predict_methods(Xs, method_names)
         # decode class names
-        if utils.is_classifier(self) and method_name == 'predict':
-            predictions = [self.classes_[p] if p is not None else None
-                           for p in predictions]
-        live_predictions = [p for p in predictions if p is not None]
+        if utils.is_classifier(self) and 'predict' in predictions:
+            if isinstance(predictions['predict'], list):
+                predictions['predict'] = [
+                    self.classes_[p] if p is not None else None
+                    for p in predictions['predict']]
+            else:
+                predictions['predict'] = self.classes_[predictions['predict']]
 
-        return (predictions if len(live_predictions) > 1
-                else live_predictions[0])
+        return predictions
 
     def get_pipe(self, layer_index, pipe_index):
         """
@@ -1077,17 +1355,43 @@ class MultichannelPipeline(Cloneable, Saveable):
         """
         return self.layers[layer_index].get_model_from_channel(channel_index)
 
-    def get_clone(self):
+    def get_output_mask(self, Xs):
+        """
+        Get a list of bools indicating which channels output a matrix.
+
+        The mask is taken from the last layer and reflects the channels that
+        were live during fitting.
+        """
+        if hasattr(self.layers[-1], 'output_mask_') is False:
+            raise utils.FitError('output mask requested before fitting')
+        return list(self.layers[-1].output_mask_)
+
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone of the MultichannelPipeline.
 
         Uses methods inherited from utils.Cloneable to copy parameters
         and state variables, and utils.get_clone() to copy pipes and models.
+
+        Parameters
+        ----------
+        copy_on_write : bool, default=False
+            - If False: Fitted models are cloned recursively.
+            - If True: Fitted models are shared by reference with the clone
+              until the clone is refit, so cloning a fitted pipeline costs
+              time proportional to the number of components rather than the
+              size of the models.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'classes_'):
             clone.classes_ = self.classes_.copy()
-        clone.layers = [layer.get_clone() for layer in self.layers]
+        clone.layers = [layer.get_clone(copy_on_write)
+                        for layer in self.layers]
+        if len(clone.layers) > 0 and hasattr(clone.layers[-1], 'model_list'):
+            for method_name in utils.get_predict_methods(clone.layers[-1]):
+                prediction_method = functools.partial(
+                    clone.predict_with_method, method_name=method_name)
+                setattr(clone, method_name, prediction_method)
         return clone
 
     def get_dataframe(self, verbose=0, show_fit=True):
@@ -1244,9 +1548,8 @@ class ChannelConcatenator(Cloneable, Saveable):
             List of values, one per channel,  with the concatenated matrix at
             index 0 and all other channel values set to None.
         """
-        live_Xs = [X for X in Xs if X is not None]
         Xs_t = [None for X in Xs]
-        Xs_t[0] = np.concatenate(live_Xs, axis=1) if len(live_Xs) > 0 else None
+        Xs_t[0] = concatenate_channels(Xs)
         return Xs_t
 
     def fit_transform(self, Xs, y=None, **fit_params):
@@ -1269,3 +1572,10 @@ class ChannelConcatenator(Cloneable, Saveable):
             index 0 and all other channel values set to None.
         """
         return self.transform(Xs)
+
+    def get_output_mask(self, Xs):
+        """
+        Get a list of bools indicating which channels output a matrix.
+        """
+        is_live = any([X is not None for X in Xs])
+        return [i == 0 and is_live for i, X in enumerate(Xs)]
@@ -82,12 +82,15 @@ import pipecaster.utils as utils
 from pipecaster.ray_backend import RayDistributor
 
 __all__ = ['set_distributor', 'starmap_jobs', 'map_jobs', 'count_local_cpus',
-           'count_cpus', 'count_gpus']
+           'count_cpus', 'count_gpus', 'is_in_job']
 
 default_distributor_type = RayDistributor
 distributor_type = default_distributor_type
 distributor = None
 
+# number of parallel jobs running in this process (non-zero in workers)
+job_depth = 0
+
 
 def set_distributor(distributor_):
     """
@@ -173,6 +176,29 @@ def count_gpus():
         return distributor.count_gpus()
 
 
+def is_in_job():
+    """
+    Determine if the caller is running inside a parallel job.
+
+    Nested parallel requests made from inside a job (e.g. internal cv inside
+    an outer cross validation fold) are run serially in the job's process
+    so that only the outermost level distributes work.
+    """
+    return job_depth > 0
+
+
+def _run_job(f, *args):
+    """
+    Run a job, marking the process as a worker for nested requests.
+    """
+    global job_depth
+    job_depth += 1
+    try:
+        return f(*args)
+    finally:
+        job_depth -= 1
+
+
 def starmap_jobs(f, args_list, n_cpus='max', shared_mem_objects=None):
     '''
     Compute a list of jobs in parallel. Call signature similar to the
@@ -220,6 +246,27 @@ def starmap_jobs(f, args_list, n_cpus='max', shared_mem_objects=None):
                     shared_mem_objects=shared_mem_objects)
 
 
+def _starmap_jobs(f, args_list, n_processes, shared_mem_objects):
+    """
+    Run jobs with starmap_jobs(), falling back on a single process when
+    n_processes is 1 or None or when the parallel request fails.
+    """
+    n_jobs = len(args_list)
+    n_processes = 1 if n_processes is None else n_processes
+    n_processes = (n_jobs
+                   if (type(n_processes) == int and n_jobs < n_processes)
+                   else n_processes)
+    if n_processes == 'max' or n_processes > 1:
+        try:
+            return starmap_jobs(f, args_list, n_cpus=n_processes,
+                                shared_mem_objects=shared_mem_objects)
+        except Exception as e:
+            print('parallel processing request failed with message {}'
+                  .format(e))
+            print('defaulting to single processor')
+    return [f(*args) for args in args_list]
+
+
 def map_jobs(f, *arg_lists, n_cpus='max', shared_mem_objects=None):
     '''
     Compute a list of jobs in parallel using a signature like that of the
@@ -260,7 +307,14 @@ def map_jobs(f, *arg_lists, n_cpus='max', shared_mem_objects=None):
     will copy the argument to the plasma store each time the argument is
     passed, whereas shared_mem_objects guarantees that the object will only be
     transferred to the object store one time.
+
+    note: Requests made from inside a running job are computed serially in
+    the job's process (see is_in_job()).
     '''
+    if is_in_job():
+        return [f(*args) for args in zip(*arg_lists)]
     start_if_needed()
-    return distributor.map_jobs(f, *arg_lists, n_cpus=n_cpus,
+    n_jobs = len(arg_lists[0]) if len(arg_lists) > 0 else 0
+    return distributor.map_jobs(_run_job, [f for i in range(n_jobs)],
+                                *arg_lists, n_cpus=n_cpus,
                                 shared_mem_objects=shared_mem_objects)
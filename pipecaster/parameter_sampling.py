@@ -0,0 +1,239 @@
+"""
+Samplers that propose hyperparameter sets for budgeted searches.
+
+(Use with :class:`pipecaster.ensemble_learning.SearchEnsemble`).
+
+Signature:
+    params = sampler(param_distributions, params_list, scores, random_state)
+
+param_distributions is a dict mapping parameter names to lists of values or to
+distributions with an rvs() method (e.g. scipy.stats distributions),
+params_list and scores hold the parameter sets evaluated so far and their
+scores (None or NaN if unavailable), and random_state is a
+np.random.RandomState instance.
+"""
+
+import numpy as np
+import scipy.stats
+
+from pipecaster.utils import Cloneable, Saveable
+
+__all__ = ['RandomSampler', 'TPESampler']
+
+
+def _sample_prior(distribution, random_state):
+    if hasattr(distribution, 'rvs'):
+        return distribution.rvs(random_state=random_state)
+    return distribution[random_state.randint(len(distribution))]
+
+
+def _sample_params(param_distributions, random_state):
+    """
+    Draw one parameter set from the prior distributions.
+    """
+    return {name: _sample_prior(distribution, random_state)
+            for name, distribution in param_distributions.items()}
+
+
+class RandomSampler(Cloneable, Saveable):
+    """
+    Propose parameter sets drawn at random from the prior distributions.
+    """
+
+    def __init__(self):
+        pass
+
+    def __call__(self, param_distributions, params_list, scores,
+                 random_state):
+        """
+        Propose a parameter set.
+
+        Parameters
+        ----------
+        param_distributions : dict
+            Dict of lists of values or distributions with an rvs() method,
+            indexed by parameter name.
+        params_list : list of dicts
+            Parameter sets proposed so far.
+        scores : list
+            Scores of the parameter sets proposed so far.
+        random_state : np.random.RandomState
+            Random number generator.
+
+        Returns
+        -------
+        dict
+            Parameter set.
+        """
+        return _sample_params(param_distributions, random_state)
+
+
+class _CategoricalDensity:
+    """
+    Smoothed frequencies of observed values from a list of choices.
+    """
+
+    def __init__(self, choices, observations):
+        counts = np.ones(len(choices))
+        for value in observations:
+            counts[self._get_index(choices, value)] += 1
+        self.choices = choices
+        self.probs = counts / np.sum(counts)
+
+    @staticmethod
+    def _get_index(choices, value):
+        for i, choice in enumerate(choices):
+            if choice is value or choice == value:
+                return i
+
+    def sample(self, random_state):
+        return self.choices[random_state.choice(len(self.choices),
+                                                p=self.probs)]
+
+    def log_pdf(self, value):
+        return np.log(self.probs[self._get_index(self.choices, value)])
+
+
+class _ParzenDensity:
+    """
+    Gaussian kernel density of observed values mixed with the prior.
+
+    Log-uniform priors are modeled in log space.  Discrete priors are
+    sampled by rounding.
+    """
+
+    def __init__(self, distribution, observations, bandwidth):
+        self.distribution = distribution
+        self.is_log = getattr(distribution.dist, 'name', None) in [
+                                                    'loguniform', 'reciprocal']
+        self.is_discrete = isinstance(distribution.dist,
+                                      scipy.stats.rv_discrete)
+        self.centers = self._to_space(np.asarray(observations, dtype=float))
+        self.bandwidth = bandwidth
+        low, high = distribution.support()
+        self.low, self.high = self._to_space(np.array([low, high],
+                                                      dtype=float))
+
+    def _to_space(self, values):
+        return np.log(values) if self.is_log else values
+
+    def _from_space(self, values):
+        return np.exp(values) if self.is_log else values
+
+    def sample(self, random_state):
+        # the prior is one component of the mixture
+        component = random_state.randint(len(self.centers) + 1)
+        if component == len(self.centers):
+            return self.distribution.rvs(random_state=random_state)
+        value = random_state.normal(self.centers[component], self.bandwidth)
+        value = self._from_space(np.clip(value, self.low, self.high))
+        return int(np.round(value)) if self.is_discrete else value
+
+    def log_pdf(self, value):
+        x = self._to_space(float(value))
+        if self.is_discrete:
+            prior_pdf = self.distribution.pmf(value)
+        else:
+            prior_pdf = self.distribution.pdf(value)
+        # change of variables for densities in log space
+        prior_pdf = prior_pdf * value if self.is_log else prior_pdf
+        kernel_pdfs = scipy.stats.norm.pdf(x, self.centers, self.bandwidth)
+        pdf = (np.sum(kernel_pdfs) + prior_pdf) / (len(self.centers) + 1)
+        return np.log(max(pdf, 1e-300))
+
+
+class TPESampler(Cloneable, Saveable):
+    """
+    Propose parameter sets with a tree-structured Parzen estimator.
+
+    After n_startup random proposals, the evaluated parameter sets are split
+    into the top gamma fraction by score and the rest, a density is fit to
+    each parameter in each group, and the proposal is the candidate drawn
+    from the top group's densities that maximizes the ratio of top group to
+    remaining group density (1).  Continuous and integer parameters must be
+    given as frozen scipy.stats distributions, and categorical parameters as
+    lists of values.
+
+    (1) Bergstra, James, et al. "Algorithms for hyper-parameter
+    optimization." Advances in neural information processing systems 24
+    (2011).
+
+    Parameters
+    ----------
+    n_startup : int, default=10
+        Number of random proposals made before densities are used.
+    gamma : float, default=0.25
+        Fraction of the evaluated parameter sets in the top group.
+    n_candidates : int, default=24
+        Number of candidates drawn from the top group's densities for each
+        proposal.
+    """
+
+    def __init__(self, n_startup=10, gamma=0.25, n_candidates=24):
+        self._params_to_attributes(TPESampler.__init__, locals())
+
+    def _get_density(self, distribution, observations, all_observations):
+        if hasattr(distribution, 'rvs') is False:
+            return _CategoricalDensity(distribution, observations)
+        values = np.asarray(all_observations, dtype=float)
+        if getattr(distribution.dist, 'name', None) in ['loguniform',
+                                                        'reciprocal']:
+            values = np.log(values)
+        # Scott's rule bandwidth computed from all of the observations
+        spread = np.std(values) if len(values) > 1 else 0
+        if spread == 0:
+            low, high = distribution.support()
+            spread = (high - low) if np.isfinite(high - low) else 1.0
+        bandwidth = spread * len(values) ** (-1 / 5)
+        return _ParzenDensity(distribution, observations, bandwidth)
+
+    def __call__(self, param_distributions, params_list, scores,
+                 random_state):
+        """
+        Propose a parameter set.
+
+        Parameters
+        ----------
+        param_distributions : dict
+            Dict of lists of values or distributions with an rvs() method,
+            indexed by parameter name.
+        params_list : list of dicts
+            Parameter sets proposed so far.
+        scores : list
+            Scores of the parameter sets proposed so far.
+        random_state : np.random.RandomState
+            Random number generator.
+
+        Returns
+        -------
+        dict
+            Parameter set.
+        """
+        history = [(s, p) for s, p in zip(scores, params_list)
+                   if s is not None and np.isfinite(s)]
+        if len(history) < max(self.n_startup, 2):
+            return _sample_params(param_distributions, random_state)
+
+        history.sort(key=lambda h: h[0], reverse=True)
+        n_top = max(1, int(np.ceil(self.gamma * len(history))))
+        top = [p for s, p in history[:n_top]]
+        rest = [p for s, p in history[n_top:]]
+
+        top_densities, rest_densities = {}, {}
+        for name, distribution in param_distributions.items():
+            all_values = [p[name] for s, p in history]
+            top_densities[name] = self._get_density(
+                distribution, [p[name] for p in top], all_values)
+            rest_densities[name] = self._get_density(
+                distribution, [p[name] for p in rest], all_values)
+
+        best_params, best_ratio = None, -np.inf
+        for i in range(self.n_candidates):
+            params = {name: density.sample(random_state)
+                      for name, density in top_densities.items()}
+            ratio = sum([top_densities[name].log_pdf(value) -
+                         rest_densities[name].log_pdf(value)
+                         for name, value in params.items()])
+            if ratio > best_ratio:
+                best_params, best_ratio = params, ratio
+        return best_params
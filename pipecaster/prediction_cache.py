@@ -0,0 +1,277 @@
+"""
+Row-level caching of predictions and transform outputs.
+
+Inference services often receive the same samples (or the same feature
+blocks for a subset of channels) many times.  :class:`PredictionCache` stores
+outputs row by row under a fingerprint of the input rows, so that only rows
+that have not been seen before are sent through the pipeline.
+
+Examples
+--------
+::
+
+    import pipecaster as pc
+    from sklearn.svm import SVC
+
+    Xs, y, _ = pc.make_multi_input_classification(n_informative_Xs=3,
+                                                  n_random_Xs=7)
+    clf = pc.MultichannelPipeline(n_channels=10)
+    clf.add_layer(pc.MultichannelPredictor(SVC()))
+    clf.fit(Xs, y)
+    clf.enable_prediction_cache(max_size=100000)
+    clf.predict(Xs)
+    clf.predict(Xs)
+    clf.get_prediction_cache().hit_rate
+    # output: 0.5
+"""
+
+import collections
+import hashlib
+import time
+import numpy as np
+
+from pipecaster.multichannel_dataset import get_rows
+
+__all__ = ['PredictionCache']
+
+
+def _mix64(z):
+    """
+    Apply the splitmix64 finalizer to a uint64 array in place.
+    """
+    z ^= z >> np.uint64(30)
+    z *= np.uint64(0xbf58476d1ce4e5b9)
+    z ^= z >> np.uint64(27)
+    z *= np.uint64(0x94d049bb133111eb)
+    z ^= z >> np.uint64(31)
+    return z
+
+
+def _get_row_words(X):
+    """
+    View the bytes of each row of X as uint64 words, copying only when X is
+    not C-contiguous or its rows are not a whole number of words (zero
+    padded).
+    """
+    width = int(np.prod(X.shape[1:]))
+    row_bytes = np.ascontiguousarray(X).reshape(X.shape[0], width)
+    row_bytes = row_bytes.view(np.uint8)
+    if row_bytes.shape[1] % 8 != 0:
+        padded = np.zeros((X.shape[0], -(-row_bytes.shape[1] // 8) * 8),
+                          dtype=np.uint8)
+        padded[:, :row_bytes.shape[1]] = row_bytes
+        row_bytes = padded
+    return row_bytes.view(np.uint64)
+
+
+def _sum_mixed_words(words, seeds, offset):
+    """
+    Get two independent sums of the mixed words of each row of a
+    (n_rows, n_words) uint64 array.  Each word is xored with a salt that
+    depends on its position (offset + column index), mixed with a
+    multiply-xorshift, and summed with and without a second, odd,
+    position-dependent multiplier.
+    """
+    positions = np.arange(offset, offset + words.shape[1], dtype=np.uint64)
+    salts = _mix64(positions + np.uint64(seeds[0]))
+    multipliers = _mix64(positions + np.uint64(seeds[1])) | np.uint64(1)
+    mixed = words ^ salts
+    mixed *= np.uint64(0x9e3779b97f4a7c15)
+    mixed ^= mixed >> np.uint64(32)
+    return np.column_stack([mixed.sum(axis=1, dtype=np.uint64),
+                            mixed.dot(multipliers)])
+
+
+def get_row_fingerprints(Xs):
+    """
+    Get a fingerprint for each row of a multichannel input.
+
+    Rows are hashed with vectorized numpy operations over whole channels
+    rather than row by row.
+
+    Parameters
+    ----------
+    Xs : list or MultichannelDataset
+        List of feature matrices and None placeholders.
+
+    Returns
+    -------
+    list of bytes
+        One 16 byte fingerprint per row that depends on the row values in
+        every channel as well as the channel positions, widths and dtypes.
+    """
+    live_Xs = [(i, np.asarray(X)) for i, X in enumerate(Xs) if X is not None]
+    if len(live_Xs) == 0:
+        return []
+    header = ';'.join(['{}:{}:{}'.format(i, X.dtype.str, X.shape[1:])
+                       for i, X in live_Xs]).encode()
+    seeds = np.frombuffer(hashlib.blake2b(header, digest_size=16).digest(),
+                          dtype=np.uint64)
+    n_rows = live_Xs[0][1].shape[0]
+    if n_rows == 0:
+        return []
+    sums = np.zeros((n_rows, 2), dtype=np.uint64)
+    offset = 0
+    for i, X in live_Xs:
+        words = _get_row_words(X)
+        sums += _sum_mixed_words(words, seeds, offset)
+        offset += words.shape[1]
+    fingerprints = _mix64(sums)
+    return fingerprints.view(np.dtype((np.void, 16))).ravel().tolist()
+
+
+class PredictionCache:
+    """
+    Least recently used (LRU) cache of row-level outputs.
+
+    Parameters
+    ----------
+    max_size : int, default=10000
+        Maximum number of rows stored.  The least recently used rows are
+        evicted first.
+    ttl : float or None, default=None
+        - If float : Time to live of a cached row in seconds.
+        - If None : Rows do not expire.
+
+    Notes
+    -----
+    Cached values are keyed by a tag (e.g. the prediction method name) and by
+    a fingerprint of each input row, so rows are reused across calls
+    regardless of the batch they appear in.  Outputs that cannot be split by
+    row (e.g. lists of per-channel predictions) are computed without caching.
+    Caches must be cleared when the cached model is refit; pipecaster does
+    this automatically for caches enabled on a MultichannelPipeline.
+    """
+
+    def __init__(self, max_size=10000, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """
+        Fraction of row lookups that were served from the cache.
+        """
+        n_lookups = self.hits + self.misses
+        return self.hits / n_lookups if n_lookups > 0 else 0.0
+
+    def clear(self):
+        """
+        Remove all cached rows and reset the hit and miss counters.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key, now):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, timestamp = entry
+        if self.ttl is not None and now - timestamp > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _set(self, key, value, now):
+        self._entries[key] = (value, now)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def apply(self, f, Xs, tag):
+        """
+        Compute row outputs of a function, reusing cached rows.
+
+        Parameters
+        ----------
+        f : callable
+            Function with signature outputs = f(Xs) returning an ndarray with
+            one row per input sample.
+        Xs : list, MultichannelDataset, or ndarray
+            Multichannel input, or single channel input matrix.
+        tag : hashable
+            Identifier of the computation (e.g. method name) that is combined
+            with the row fingerprints to make cache keys.
+
+        Returns
+        -------
+        ndarray
+            Outputs of f for all rows of Xs.
+        """
+        return self.apply_multiple(lambda Xs: {tag: f(Xs)}, Xs, [tag])[tag]
+
+    def apply_multiple(self, f, Xs, tags):
+        """
+        Compute several row outputs of a function in one call, reusing
+        cached rows.
+
+        Rows missing from the cache under any of the tags are computed with a
+        single call to f and the outputs are cached under every tag.
+
+        Parameters
+        ----------
+        f : callable
+            Function with signature outputs = f(Xs) returning a dict indexed
+            by tag, with values that are ndarrays with one row per input
+            sample.
+        Xs : list, MultichannelDataset, or ndarray
+            Multichannel input, or single channel input matrix.
+        tags : list
+            Identifiers of the computations (e.g. method names) that are
+            combined with the row fingerprints to make cache keys.
+
+        Returns
+        -------
+        dict
+            Outputs of f for all rows of Xs, indexed by tag.
+        """
+        is_multichannel = isinstance(Xs, np.ndarray) is False
+        fingerprints = get_row_fingerprints(Xs if is_multichannel else [Xs])
+        if len(fingerprints) == 0:
+            return f(Xs)
+        keys = {tag: [(tag, fingerprint) for fingerprint in fingerprints]
+                for tag in tags}
+        now = time.monotonic()
+        entries = {tag: [self._get(key, now) for key in keys[tag]]
+                   for tag in tags}
+        is_missing = [any([entries[tag][i] is None for tag in tags])
+                      for i in range(len(fingerprints))]
+        missing_rows = np.flatnonzero(is_missing)
+        n_missing = sum([entry is None for tag in tags
+                         for entry in entries[tag]])
+        self.hits += len(tags) * len(fingerprints) - n_missing
+        self.misses += n_missing
+
+        if len(missing_rows) > 0:
+            outputs = f(get_rows(Xs, missing_rows))
+            is_partial = len(missing_rows) < len(fingerprints)
+            for tag in tags:
+                if (isinstance(outputs[tag], np.ndarray) is False or
+                        outputs[tag].shape[0] != len(missing_rows)):
+                    return f(Xs) if is_partial else outputs
+            for tag in tags:
+                for row_index, output in zip(missing_rows, outputs[tag]):
+                    # copies keep the cache independent of returned arrays
+                    output = output.copy()
+                    entries[tag][row_index] = (output, now)
+                    self._set(keys[tag][row_index], output, now)
+            if is_partial is False:
+                return {tag: outputs[tag] for tag in tags}
+        else:
+            outputs = None
+
+        results = {}
+        for tag in tags:
+            values = np.stack([value for value, _ in entries[tag]])
+            if outputs is not None:
+                values = values.astype(outputs[tag].dtype, copy=False)
+            results[tag] = values
+        return results
@@ -387,6 +387,115 @@ class TestMultichannelClassification(unittest.TestCase):
 
         self.assertTrue(acc > 0.90, 'Accuracy tolerance failure.')
 
+    def test_holdout_blending(self, seed=42):
+        """
+        Determine if ChannelEnsemble can select the informative channel and
+        meta-predict from holdout blending outputs.
+        """
+        Xs, y, types = make_multi_input_classification(n_informative_Xs=1,
+                                n_weak_Xs=0, n_random_Xs=4, weak_noise_sd=None,
+                                seed = seed, n_samples=500, n_features=20,
+                                n_informative=10, class_sep=3)
+        np.random.seed(seed)
+        clf = ChannelEnsemble(LogisticRegression(), blend_holdout=0.2,
+                              score_selector=RankScoreSelector(k=1))
+        clf.fit(Xs, y)
+        self.assertEqual(types[clf.get_support()[0]], 'informative',
+                         'Ensemble failed to pick informative channel')
+
+        clf = ChannelEnsemble(LogisticRegression(), LogisticRegression(),
+                              blend_holdout=0.2, cache_meta_features=True)
+        clf.fit(Xs, y)
+        self.assertEqual(clf.meta_X_.shape, (100, 5))
+        self.assertTrue(np.mean(clf.predict(Xs) == y) > 0.9)
+
+        clf_2 = ChannelEnsemble(LogisticRegression(), LogisticRegression(),
+                                blend_holdout=0.2, cache_meta_features=True,
+                                random_state=7)
+        clf_2.fit(Xs, y)
+        meta_X = clf_2.meta_X_
+        clf_2.fit(Xs, y)
+        self.assertTrue(np.array_equal(clf_2.meta_X_, meta_X))
+
+    def test_cascade(self, seed=42):
+        """
+        Determine if ChannelEnsemble cascade inference matches full soft
+        voting on the calibration samples at zero tolerance and exits early
+        at a looser tolerance.
+        """
+        Xs, y, types = make_multi_input_classification(n_informative_Xs=3,
+                                n_weak_Xs=0, n_random_Xs=2, weak_noise_sd=None,
+                                seed = seed, n_samples=600, n_features=20,
+                                n_informative=10, class_sep=3)
+        train_Xs, cal_Xs = [X[:300] for X in Xs], [X[300:] for X in Xs]
+        clf = ChannelEnsemble(LogisticRegression(), SoftVotingClassifier(),
+                              base_predict_methods='predict_proba')
+        clf.fit(train_Xs, y[:300])
+        full_predictions = clf.predict(cal_Xs)
+
+        clf.fit_cascade(cal_Xs, tolerance=0)
+        self.assertEqual(sorted(clf.cascade_[0]), [0, 1, 2, 3, 4])
+        self.assertTrue(np.array_equal(clf.predict(cal_Xs), full_predictions))
+        clf.fit_cascade(cal_Xs, tolerance=0.05)
+        self.assertLessEqual(
+            np.mean(clf.predict(cal_Xs) != full_predictions), 0.05)
+        self.assertTrue(np.isfinite(clf.cascade_[1]))
+
+        # swapping the meta-predictor discards the cascade
+        clf = ChannelEnsemble(LogisticRegression(), SoftVotingClassifier(),
+                              base_predict_methods='predict_proba',
+                              cache_meta_features=True)
+        clf.fit(train_Xs, y[:300])
+        clf.fit_cascade(cal_Xs)
+        clf.set_meta_predictor(LogisticRegression())
+        self.assertIsNone(clf.cascade_)
+        self.assertEqual(len(clf.predict(cal_Xs)), 300)
+
+    def test_cascade_selection_order(self, seed=45):
+        """
+        Determine if ChannelEnsemble cascade inference pairs each model with
+        its voting weight when the score selector returns channels out of
+        channel order.
+        """
+        Xs, y, types = make_multi_input_classification(n_informative_Xs=3,
+                                n_weak_Xs=0, n_random_Xs=2, weak_noise_sd=None,
+                                seed=seed, n_samples=600, n_features=20,
+                                n_informative=10, class_sep=0.5)
+        train_Xs, cal_Xs = [X[:300] for X in Xs], [X[300:] for X in Xs]
+        clf = ChannelEnsemble(LogisticRegression(),
+                              SoftVotingClassifier(weights=[1, 20]),
+                              base_predict_methods='predict_proba',
+                              internal_cv=3,
+                              score_selector=RankScoreSelector(k=2))
+        clf.fit(train_Xs, y[:300])
+        self.assertNotEqual(list(clf.selected_indices_),
+                            sorted(clf.selected_indices_))
+        full_probs = clf.predict_proba(cal_Xs)
+        clf.fit_cascade(cal_Xs)
+        # disable early exits so the cascade evaluates every model
+        clf.cascade_ = (clf.cascade_[0], np.inf)
+        self.assertTrue(np.allclose(clf.predict_proba(cal_Xs), full_probs))
+
+
+    def test_kernel_cache(self, seed=42):
+        """
+        Determine if ChannelEnsemble with a kernel cache makes the same
+        meta-features and predictions as on-the-fly SVC kernels.
+        """
+        Xs, y, types = make_multi_input_classification(n_informative_Xs=2,
+                                n_random_Xs=2, seed=seed, n_samples=200)
+        kwargs = dict(internal_cv=3, cache_meta_features=True)
+        clf = ChannelEnsemble(SVC(gamma=0.01), SoftVotingClassifier(),
+                              kernel_cache=10, **kwargs)
+        ref_clf = ChannelEnsemble(SVC(gamma=0.01), SoftVotingClassifier(),
+                                  **kwargs)
+        clf.fit(Xs, y)
+        ref_clf.fit(Xs, y)
+        kernel_models = [m.model for m in clf.base_models]
+        self.assertTrue(all([isinstance(m, transform_wrappers.KernelModel)
+                             for m in kernel_models]))
+        self.assertTrue(np.allclose(clf.meta_X_, ref_clf.meta_X_, atol=1e-6))
+        self.assertTrue(np.array_equal(clf.predict(Xs), ref_clf.predict(Xs)))
 
 class TestMultiChannelRegression(unittest.TestCase):
 
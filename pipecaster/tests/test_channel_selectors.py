@@ -10,9 +10,12 @@ from sklearn.feature_selection import f_classif, f_regression
 from sklearn.preprocessing import StandardScaler
 from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
 from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge, RidgeClassifier
+from sklearn.model_selection import LeaveOneOut
 
 from pipecaster.multichannel_pipeline import MultichannelPipeline
 from pipecaster.channel_selection import SelectKBestScores, SelectKBestProbes
+from pipecaster.channel_scoring import CvPerformanceScorer
 from pipecaster.testing_utils import make_multi_input_classification, make_multi_input_regression
 import pipecaster.parallel as parallel
 
@@ -294,5 +297,68 @@ class TestChannelSelectors(unittest.TestCase):
                                                 verbose=verbose, seed=seed, **rgr_params)
         self.assertTrue(passed, 'SelectKBestProbes failed to detect all week regression input matrices')
 
+class TestFastProbes(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings("ignore")
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_fast_cv_scores(self):
+        """
+        Determine if closed-form linear probe scores match the scores of
+        refit probes.
+        """
+        Xs, y, _ = make_multi_input_classification(n_informative_Xs=2,
+                                                   n_random_Xs=2, seed=42)
+        y = np.array(['a', 'b'])[y]
+        for X in Xs:
+            fast_score = CvPerformanceScorer(RidgeClassifier(alpha=2.0))(X, y)
+            score = CvPerformanceScorer(RidgeClassifier(alpha=2.0),
+                                        fast_cv=False)(X, y)
+            self.assertAlmostEqual(fast_score, score)
+
+        Xs, y, _ = make_multi_input_regression(n_informative_Xs=2,
+                                               n_random_Xs=2, seed=42)
+        for probe in [Ridge(alpha=2.0), Ridge(fit_intercept=False)]:
+            for X in Xs:
+                fast_score = CvPerformanceScorer(probe, cv=3)(X, y)
+                score = CvPerformanceScorer(probe, cv=3,
+                                            fast_cv=False)(X, y)
+                self.assertAlmostEqual(fast_score, score)
+
+    def test_loo_ridge(self):
+        """
+        Determine if exact leave-one-out ridge predictions match refit
+        predictions.
+        """
+        from sklearn.model_selection import cross_val_predict
+        from pipecaster.channel_scoring import _linear_cv_predict
+
+        Xs, y, _ = make_multi_input_regression(n_informative_Xs=1, seed=42)
+        X = Xs[0][:50]
+        y = y[:50]
+        splits = list(LeaveOneOut().split(X))
+        predictions = _linear_cv_predict(X, y, splits, 2.0, True)
+        sk_predictions = cross_val_predict(Ridge(alpha=2.0), X, y,
+                                           cv=LeaveOneOut())
+        self.assertTrue(np.allclose(predictions.ravel(), sk_predictions))
+
+    def test_probe_selection(self):
+        """
+        Determine if SelectKBestProbes finds informative channels with a
+        fast ridge probe.
+        """
+        Xs, y, X_types = make_multi_input_classification(
+                            n_informative_Xs=3, n_random_Xs=5, seed=42)
+        channel_selector = SelectKBestProbes(
+                                predictor_probe=RidgeClassifier(), cv=3, k=3)
+        channel_selector.fit(Xs, y)
+        selected_types = [X_types[i]
+                          for i in channel_selector.get_support()]
+        self.assertEqual(selected_types, ['informative'] * 3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,62 @@
+import numpy as np
+import unittest
+
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from sklearn.neighbors import KNeighborsClassifier
+
+import pipecaster.utils as utils
+from pipecaster.multichannel_pipeline import MultichannelPipeline
+from pipecaster.ensemble_learning import SoftVotingClassifier
+from pipecaster.ensemble_learning import ChannelEnsemble
+
+
+class TestCloning(unittest.TestCase):
+
+    def _get_fitted_pipeline(self):
+        X, y = make_classification(n_samples=100, n_features=20,
+                                   n_informative=10, class_sep=5,
+                                   random_state=42)
+        clf = MultichannelPipeline(n_channels=1)
+        clf.add_layer(StandardScaler())
+        clf.add_layer(ChannelEnsemble(KNeighborsClassifier(),
+                                      SoftVotingClassifier()))
+        clf.fit([X], y)
+        return clf, X, y
+
+    def test_deep_clone(self):
+        """
+        Determine if a default stateful clone copies fitted sub-models and
+        reproduces the predictions of the original pipeline.
+        """
+        clf, X, y = self._get_fitted_pipeline()
+        clone = clf.get_clone()
+        self.assertTrue(np.array_equal(clf.predict([X]), clone.predict([X])),
+                        'stateful clone did not reproduce predictions')
+        self.assertIsNot(clf.layers[1].model_list[0][0],
+                         clone.layers[1].model_list[0][0],
+                         'stateful clone shared a fitted model')
+
+    def test_copy_on_write_clone(self):
+        """
+        Determine if a copy-on-write clone shares fitted sub-models,
+        reproduces predictions, and leaves the original intact when refit.
+        """
+        clf, X, y = self._get_fitted_pipeline()
+        predictions = clf.predict([X])
+        clone = utils.get_clone(clf, copy_on_write=True)
+        self.assertIs(clf.layers[1].model_list[0][0],
+                      clone.layers[1].model_list[0][0],
+                      'copy-on-write clone did not share fitted models')
+        self.assertTrue(np.array_equal(predictions, clone.predict([X])),
+                        'copy-on-write clone did not reproduce predictions')
+        clone.fit([X[:50]], y[:50])
+        self.assertIsNot(clf.layers[1].model_list[0][0],
+                         clone.layers[1].model_list[0][0],
+                         'refit replaced a shared model in place')
+        self.assertTrue(np.array_equal(predictions, clf.predict([X])),
+                        'refitting a copy-on-write clone altered the original')
+
+
+if __name__ == '__main__':
+    unittest.main()
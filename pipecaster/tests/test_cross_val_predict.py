@@ -7,10 +7,11 @@ import timeit
 
 from sklearn.datasets import make_classification, make_regression
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-from sklearn.model_selection import KFold
+from sklearn.model_selection import KFold, RepeatedKFold
 
 import sklearn.model_selection as sk_model_selection
 import pipecaster.cross_validation as pc_cross_validation
+from pipecaster.multichannel_dataset import get_rows
 from pipecaster.multichannel_pipeline import MultichannelPipeline
 import pipecaster.parallel as parallel
 from pipecaster.testing_utils import DummyClassifier
@@ -77,6 +78,77 @@ class TestCrossValPredict(unittest.TestCase):
         pc_predictions = pc_cross_validation.cross_val_predict(mrgr, [self.X_rgr], self.y_rgr, cv=self.cv, n_processes=1) 
         self.assertTrue(np.array_equal(self.rgr_predictions, pc_predictions), 'regressor predictions from pipecaster.cross_validation.cross_val_predict did not match sklearn control (multi input predictor)')
         
+    def test_split_views(self):
+        X = np.arange(20).reshape(10, 2)
+        X_block = get_rows(X, np.arange(2, 6))
+        self.assertTrue(np.shares_memory(X, X_block), 'contiguous row selection was copied')
+        self.assertTrue(np.array_equal(X_block, X[2:6]))
+        X_gathered = get_rows(X, np.array([1, 4, 5]))
+        self.assertFalse(np.shares_memory(X, X_gathered))
+        self.assertTrue(np.array_equal(X_gathered, X[[1, 4, 5]]))
+        self.assertIsNone(get_rows(None, np.arange(2)))
+
+    def test_shuffled_splits(self):
+        """
+        Determine if out-of-fold predictions from shuffled splits are
+        assembled in sample order.
+        """
+        cv = KFold(n_splits=5, shuffle=True, random_state=test_seed)
+        sk_predictions = sk_model_selection.cross_val_predict(
+                            self.clf, self.X_cls, self.y_cls, cv=cv,
+                            method='predict_proba')
+        predictions = pc_cross_validation.cross_val_predict(
+                            self.clf, self.X_cls, self.y_cls, cv=cv,
+                            predict_methods=['predict', 'predict_proba'])
+        self.assertTrue(np.allclose(predictions['predict_proba'],
+                                    sk_predictions))
+        self.assertTrue(np.array_equal(
+            predictions['predict'], np.argmax(sk_predictions, axis=1)))
+
+    def test_repeated_splits(self):
+        """
+        Determine if a splitter whose test splits are not a partition of the
+        samples raises an error when splits are combined, and still returns
+        the separate splits when they are not.
+        """
+        cv = RepeatedKFold(n_splits=2, n_repeats=2, random_state=test_seed)
+        with self.assertRaises(ValueError):
+            pc_cross_validation.cross_val_predict(
+                self.rgr, self.X_rgr, self.y_rgr, cv=cv)
+        split_results = pc_cross_validation.cross_val_predict(
+                            self.rgr, self.X_rgr, self.y_rgr, cv=cv,
+                            combine_splits=False)
+        self.assertEqual(len(split_results['predict']), 4)
+        self.assertEqual(sum([len(p) for p in split_results['predict']]),
+                         2 * len(self.y_rgr))
+
+    def test_split_cache(self):
+        """
+        Determine if identical splitters, y, and groups reuse one set of
+        read-only split index arrays, and unseeded shuffles are not cached.
+        """
+        pc_cross_validation.clear_split_cache()
+        X = np.zeros((30, 2))
+        y = np.array([0, 1, 2] * 10)
+        splits = pc_cross_validation._get_splits(self.clf, X, y, None, 3)
+        splits_2 = pc_cross_validation._get_splits(self.clf, X[:, :1], y,
+                                                   None, 3)
+        self.assertTrue(all([s[0] is s2[0] and s[1] is s2[1]
+                             for s, s2 in zip(splits, splits_2)]))
+        self.assertFalse(splits[0][1].flags.writeable)
+        sk_splits = sk_model_selection.StratifiedKFold(3).split(X, y)
+        for (train, test), (sk_train, sk_test) in zip(splits, sk_splits):
+            self.assertTrue(np.array_equal(train, sk_train))
+            self.assertTrue(np.array_equal(test, sk_test))
+        other_splits = pc_cross_validation._get_splits(self.clf, X, y[::-1],
+                                                       None, 3)
+        self.assertFalse(other_splits[0][1] is splits[0][1])
+        cv = KFold(n_splits=3, shuffle=True)
+        shuffled = pc_cross_validation._get_splits(self.clf, X, y, None, cv)
+        shuffled_2 = pc_cross_validation._get_splits(self.clf, X, y, None, cv)
+        self.assertFalse(shuffled[0][1] is shuffled_2[0][1])
+        pc_cross_validation.clear_split_cache()
+
     def test_multi_input_regression_parallel_get(self):
         if n_cpus > 1:
             warnings.filterwarnings("ignore")
@@ -0,0 +1,68 @@
+import numpy as np
+import unittest
+
+from sklearn.linear_model import LogisticRegression, LinearRegression
+from sklearn.neighbors import KNeighborsClassifier, KNeighborsRegressor
+
+import pipecaster.utils as utils
+from pipecaster.multichannel_pipeline import MultichannelPipeline
+from pipecaster.ensemble_learning import ChannelEnsemble
+from pipecaster.ensemble_learning import SoftVotingClassifier
+from pipecaster.ensemble_learning import AggregatingRegressor
+from pipecaster.testing_utils import make_multi_input_classification
+from pipecaster.testing_utils import make_multi_input_regression
+from pipecaster.distillation import distill
+
+
+class TestDistillation(unittest.TestCase):
+
+    def test_classifier(self):
+        """
+        Determine if a distilled classifier is a drop-in replacement that
+        agrees with its teacher on most samples.
+        """
+        Xs, y, _ = make_multi_input_classification(n_informative_Xs=3,
+                                                   n_random_Xs=2, seed=42)
+        Xs[1] = None
+        teacher = MultichannelPipeline(n_channels=5)
+        teacher.add_layer(ChannelEnsemble(KNeighborsClassifier(),
+                                          SoftVotingClassifier()))
+        teacher.fit(Xs, y)
+        student, fidelity = distill(teacher, Xs, LogisticRegression(),
+                                    n_perturbations=2, random_state=0)
+        self.assertTrue(utils.is_classifier(student))
+        self.assertEqual(student.predict(Xs).shape, y.shape)
+        self.assertTrue(set(student.predict(Xs)) <= set(teacher.classes_))
+        self.assertGreater(fidelity['agreement'], 0.8)
+        self.assertIn('proba_mae', fidelity)
+
+    def test_regressor(self):
+        """
+        Determine if a distilled regressor reports regression fidelity
+        metrics.
+        """
+        Xs, y, _ = make_multi_input_regression(n_informative_Xs=3,
+                                               n_random_Xs=2, seed=42)
+        teacher = MultichannelPipeline(n_channels=5)
+        teacher.add_layer(ChannelEnsemble(KNeighborsRegressor(),
+                                          AggregatingRegressor(np.mean)))
+        teacher.fit(Xs, y)
+        student, fidelity = distill(teacher, Xs, LinearRegression())
+        self.assertEqual(set(fidelity), {'explained_variance', 'mae'})
+        self.assertGreater(fidelity['explained_variance'], 0.5)
+        with self.assertRaises(TypeError):
+            distill(teacher, Xs, LogisticRegression())
+
+        # seeded perturbations are reproducible and leave the global RNG alone
+        np.random.seed(7)
+        expected_draw = np.random.rand()
+        np.random.seed(7)
+        students = [distill(teacher, Xs, LinearRegression(),
+                            random_state=0)[0] for i in range(2)]
+        self.assertEqual(np.random.rand(), expected_draw)
+        self.assertTrue(np.array_equal(students[0].predict(Xs),
+                                       students[1].predict(Xs)))
+
+
+if __name__ == '__main__':
+    unittest.main()
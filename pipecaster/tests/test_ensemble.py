@@ -2,7 +2,10 @@ import numpy as np
 import unittest
 import random
 import warnings
-from scipy.stats import pearsonr
+import weakref
+import gc
+import time
+from scipy.stats import pearsonr, loguniform
 
 from sklearn.datasets import make_classification, make_regression
 from sklearn.model_selection import KFold, StratifiedKFold
@@ -15,10 +18,15 @@ from sklearn.svm import SVC, SVR
 from sklearn.metrics import roc_auc_score, explained_variance_score
 
 import pipecaster.utils as utils
+import pipecaster.parallel as parallel
 import pipecaster.transform_wrappers as transform_wrappers
 from pipecaster.score_selection import RankScoreSelector
 from pipecaster.multichannel_pipeline import MultichannelPipeline
-from pipecaster.ensemble_learning import Ensemble
+from pipecaster.ensemble_learning import Ensemble, GridSearchEnsemble
+from pipecaster.ensemble_learning import SearchEnsemble
+from pipecaster.parameter_sampling import TPESampler
+from pipecaster.ensemble_learning import SoftVotingClassifier
+from pipecaster.ensemble_learning import HardVotingClassifier
 from pipecaster.cross_validation import cross_val_score
 
 class TestEnsembleMetaprediction(unittest.TestCase):
@@ -253,5 +261,494 @@ class TestEnsembleSelection(unittest.TestCase):
         self.assertTrue(acc > 0.9, 'Accuracy tolerance failure.')
 
 
+class FitCountingClassifier(LogisticRegression):
+    """
+    LogisticRegression that records the number of samples in each fit.
+    """
+    fit_sizes = []
+
+    def fit(self, X, y, **fit_params):
+        FitCountingClassifier.fit_sizes.append(len(X))
+        return super().fit(X, y, **fit_params)
+
+
+def nested_job(x):
+    return sum(parallel.map_jobs(abs, [-x, -x], n_cpus=2))
+
+
+class SerialDistributor:
+    """
+    Distributor that computes jobs serially and records the size of each
+    submission.
+    """
+
+    def __init__(self):
+        self.submissions = []
+
+    def is_started(self):
+        return True
+
+    def count_cpus(self):
+        return 4
+
+    def map_jobs(self, f, *arg_lists, n_cpus='max', shared_mem_objects=None):
+        self.submissions.append(len(arg_lists[0]))
+        return [f(*args) for args in zip(*arg_lists)]
+
+
+class TestEnsembleFitting(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings('ignore')
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_single_full_fit(self):
+        """
+        Determine if Ensemble with internal cv fits each base predictor only
+        once on the full training set.
+        """
+        X, y = make_classification(n_samples=100, n_features=10,
+                                   random_state=42)
+        FitCountingClassifier.fit_sizes = []
+        clf = Ensemble([FitCountingClassifier(), FitCountingClassifier()],
+                       LogisticRegression(), internal_cv=5)
+        clf.fit(X, y)
+        n_full_fits = FitCountingClassifier.fit_sizes.count(len(X))
+        self.assertEqual(n_full_fits, 2, 'base predictors were fit {} times '
+                         'on the full training set instead of 2'
+                         .format(n_full_fits))
+        self.assertEqual(len(FitCountingClassifier.fit_sizes), 12)
+        self.assertEqual(len(clf.get_model_scores()), 2)
+        self.assertEqual(len(clf.predict(X)), len(X))
+
+    def test_preallocated_meta_features(self):
+        """
+        Determine if meta-features written into a preallocated matrix match
+        the concatenated base model outputs.
+        """
+        X, y = make_classification(n_samples=100, n_features=10, n_classes=3,
+                                   n_informative=5, random_state=42)
+        clf = Ensemble([LogisticRegression(), KNeighborsClassifier()],
+                       LogisticRegression(), internal_cv=None)
+        clf.fit(X, y)
+        self.assertEqual(clf.meta_widths_, [3, 3])
+        meta_X = np.concatenate([m.transform(X) for m in clf.base_models],
+                                axis=1)
+        self.assertTrue(np.array_equal(clf.predict_proba(X),
+                                       clf.meta_model.predict_proba(meta_X)))
+
+    def test_meta_predictor_search(self):
+        """
+        Determine if meta-predictors can be scored and swapped on cached
+        meta-features without refitting the base predictors.
+        """
+        X, y = make_classification(n_samples=100, n_features=10,
+                                   random_state=42)
+        FitCountingClassifier.fit_sizes = []
+        clf = Ensemble([FitCountingClassifier(), KNeighborsClassifier()],
+                       SoftVotingClassifier(), internal_cv=3,
+                       cache_meta_features=True)
+        clf.fit(X, y)
+        n_fits = len(FitCountingClassifier.fit_sizes)
+        candidates = [SoftVotingClassifier(), LogisticRegression(), SVC()]
+        scores = clf.score_meta_predictors(candidates, cv=3)
+        self.assertEqual([len(s) for s in scores], [3, 3, 3])
+        self.assertEqual(scores[1], cross_val_score(LogisticRegression(),
+                                                    clf.meta_X_, clf.meta_y_,
+                                                    scorers=clf.scorer, cv=3))
+
+        clf.set_meta_predictor(SVC())
+        self.assertEqual(len(FitCountingClassifier.fit_sizes), n_fits,
+                         'base predictors were refit')
+        self.assertFalse(hasattr(clf, 'predict_proba'))
+        self.assertTrue(hasattr(clf, 'decision_function'))
+        meta_X = np.concatenate([m.transform(X) for m in clf.base_models],
+                                axis=1)
+        self.assertTrue(np.array_equal(clf.predict(X),
+                                       clf.meta_model.predict(meta_X)))
+
+        clf = Ensemble([LogisticRegression(), KNeighborsClassifier()],
+                       SoftVotingClassifier())
+        clf.fit(X, y)
+        with self.assertRaises(utils.FitError):
+            clf.set_meta_predictor(LogisticRegression())
+
+    def test_flat_cv_jobs(self):
+        """
+        Determine if parallel internal cv fits of all base predictors are
+        submitted to the distributor once, with nested requests run in the
+        jobs, and match the results of serial fitting.
+        """
+        X, y = make_classification(n_samples=90, n_features=10,
+                                   random_state=42)
+        predictors = [LogisticRegression(), KNeighborsClassifier(),
+                      LogisticRegression(C=0.1)]
+        serial_clf = Ensemble(predictors, LogisticRegression(), internal_cv=3)
+        serial_clf.fit(X, y)
+
+        distributor = SerialDistributor()
+        previous_distributor = parallel.distributor
+        parallel.set_distributor(distributor)
+        try:
+            clf = Ensemble(predictors, LogisticRegression(), internal_cv=3,
+                           base_processes=2, cv_processes=2)
+            clf.fit(X, y)
+            nested_results = parallel.map_jobs(nested_job, [1, 2], n_cpus=2)
+        finally:
+            parallel.set_distributor(previous_distributor)
+        self.assertEqual(distributor.submissions, [12, 2])
+        self.assertEqual(nested_results, [2, 4])
+        self.assertEqual(clf.get_model_scores(),
+                         serial_clf.get_model_scores())
+        self.assertTrue(np.array_equal(clf.predict_proba(X),
+                                       serial_clf.predict_proba(X)))
+
+    def test_holdout_blending(self):
+        """
+        Determine if holdout blending fits each base predictor once on the
+        blend training samples (plus an optional refit), and scores and
+        meta-predicts from the holdout samples.
+        """
+        X, y = make_classification(n_samples=100, n_features=10,
+                                   random_state=42)
+        np.random.seed(42)
+        FitCountingClassifier.fit_sizes = []
+        clf = Ensemble([FitCountingClassifier(), FitCountingClassifier()],
+                       LogisticRegression(), blend_holdout=0.25,
+                       cache_meta_features=True)
+        clf.fit(X, y)
+        self.assertEqual(FitCountingClassifier.fit_sizes, [75, 100, 75, 100])
+        self.assertEqual(clf.meta_X_.shape, (25, 2))
+        self.assertEqual(len(clf.get_model_scores()), 2)
+        self.assertEqual(len(clf.predict(X)), len(X))
+
+        FitCountingClassifier.fit_sizes = []
+        clf = Ensemble([FitCountingClassifier(), KNeighborsClassifier()],
+                       blend_holdout=0.25, blend_refit=False,
+                       score_selector=RankScoreSelector(k=1))
+        clf.fit(X, y)
+        self.assertEqual(FitCountingClassifier.fit_sizes, [75])
+        self.assertEqual(len(clf.get_support()), 1)
+        self.assertEqual(len(clf.predict(X)), len(X))
+
+        # seeded holdout splits are reproducible
+        meta_Xs = []
+        for i in range(2):
+            np.random.seed(i)
+            clf = Ensemble([LogisticRegression(), KNeighborsClassifier()],
+                           LogisticRegression(), blend_holdout=0.25,
+                           cache_meta_features=True, random_state=7)
+            clf.fit(X, y)
+            meta_Xs.append(clf.meta_X_)
+        self.assertTrue(np.array_equal(meta_Xs[0], meta_Xs[1]))
+
+
+class LiveCountingClassifier(LogisticRegression):
+    """
+    LogisticRegression that records the most fitted instances alive at once.
+    """
+    fitted = weakref.WeakSet()
+    max_live = 0
+
+    def fit(self, X, y, **fit_params):
+        gc.collect()
+        LiveCountingClassifier.fitted.add(self)
+        LiveCountingClassifier.max_live = max(
+            LiveCountingClassifier.max_live, len(LiveCountingClassifier.fitted))
+        return super().fit(X, y, **fit_params)
+
+
+class TestGridSearchEnsemble(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings('ignore')
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_successive_halving(self):
+        """
+        Determine if successive halving screens candidates on growing
+        subsamples and fully evaluates only the survivors.
+        """
+        X, y = make_classification(n_samples=300, n_features=10,
+                                   random_state=42)
+        np.random.seed(42)
+        clf = GridSearchEnsemble(
+                    param_dict={'C': list(np.logspace(-4, 4, 27))},
+                    base_predictor_cls=LogisticRegression,
+                    score_selector=RankScoreSelector(k=1),
+                    halving_factor=3)
+        self.assertIs(clf.fit(X, y), clf)
+        rungs = clf.halving_results_
+        self.assertEqual([r['n_samples'] for r in rungs], [33, 99])
+        self.assertEqual([len(r['candidates']) for r in rungs], [27, 9])
+        selections, params_list, scores = clf.get_results()
+        self.assertEqual(np.sum(np.isfinite(scores)), 3)
+        selected = clf.get_support()[0]
+        self.assertTrue(selections[selected])
+        self.assertEqual(scores[selected], np.nanmax(scores))
+        self.assertEqual(len(clf.predict(X)), len(X))
+
+        # seeded subsamples give reproducible rungs
+        rung_scores = []
+        for i in range(2):
+            np.random.seed(i)
+            clf = GridSearchEnsemble(
+                        param_dict={'C': list(np.logspace(-4, 4, 27))},
+                        base_predictor_cls=LogisticRegression,
+                        score_selector=RankScoreSelector(k=1),
+                        halving_factor=3, random_state=7)
+            clf.fit(X, y)
+            rung_scores.append([r['scores'] for r in clf.halving_results_])
+        for scores, scores_2 in zip(*rung_scores):
+            self.assertTrue(np.array_equal(scores, scores_2))
+
+    def test_streaming_screen(self):
+        """
+        Determine if the grid screen keeps only the top models while
+        streaming and matches an Ensemble of the materialized grid.
+        """
+        X, y = make_classification(n_samples=300, n_features=10,
+                                   random_state=42)
+        param_dict = {'C': list(np.logspace(-4, 1, 12))}
+        LiveCountingClassifier.max_live = 0
+        clf = GridSearchEnsemble(
+                    param_dict=param_dict,
+                    base_predictor_cls=LiveCountingClassifier,
+                    meta_predictor=SoftVotingClassifier(), internal_cv=3,
+                    score_selector=RankScoreSelector(k=3))
+        clf.fit(X, y)
+        self.assertLessEqual(LiveCountingClassifier.max_live, 6)
+        self.assertEqual(len(clf.get_base_models()), 3)
+
+        ensemble = Ensemble([LogisticRegression(C=C)
+                             for C in param_dict['C']],
+                            SoftVotingClassifier(), internal_cv=3,
+                            score_selector=RankScoreSelector(k=3))
+        ensemble.fit(X, y)
+        self.assertEqual(list(clf.get_support()),
+                         sorted(ensemble.get_support()))
+        self.assertTrue(np.allclose(clf.get_model_scores(),
+                                    ensemble.get_model_scores()))
+        self.assertTrue(np.allclose(clf.predict_proba(X),
+                                    ensemble.predict_proba(X)))
+        selections, params_list, scores = clf.get_results()
+        self.assertEqual(sum(selections), 3)
+        self.assertEqual(len(params_list), 12)
+
+    def test_warm_start_path(self):
+        """
+        Determine if walking an n_estimators axis with warm starts gives the
+        same screen as fitting every parameter set from scratch.
+        """
+        X, y = make_classification(n_samples=150, n_features=10,
+                                   random_state=42)
+        param_dict = {'n_estimators': [20, 5, 10], 'max_depth': [2, 4],
+                      'random_state': [0]}
+        screens = []
+        for warm_start_param in [None, 'auto']:
+            clf = GridSearchEnsemble(
+                        param_dict=param_dict,
+                        base_predictor_cls=RandomForestClassifier,
+                        meta_predictor=SoftVotingClassifier(),
+                        internal_cv=KFold(n_splits=3),
+                        score_selector=RankScoreSelector(k=6),
+                        warm_start_param=warm_start_param)
+            clf.fit(X, y)
+            screens.append(clf)
+        cold, warm = screens
+        self.assertEqual(warm._get_path_groups(range(6), ['auto'] * 6)[1],
+                         'n_estimators')
+        self.assertTrue(np.allclose(warm.get_model_scores(),
+                                    cold.get_model_scores()))
+        self.assertTrue(np.allclose(warm.predict_proba(X),
+                                    cold.predict_proba(X)))
+        for warm_model, cold_model in zip(warm.get_base_models(),
+                                          cold.get_base_models()):
+            self.assertEqual(len(warm_model.model.estimators_),
+                             cold_model.model.n_estimators)
+            self.assertFalse(warm_model.model.warm_start)
+
+
+class TestSearchEnsemble(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings('ignore')
+        self.X, self.y = make_classification(n_samples=150, n_features=10,
+                                             random_state=42)
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def _get_search(self, **params):
+        return SearchEnsemble(
+                    param_distributions={'C': loguniform(1e-4, 1e2),
+                                         'fit_intercept': [True, False]},
+                    base_predictor_cls=LogisticRegression,
+                    meta_predictor=SoftVotingClassifier(), internal_cv=3,
+                    score_selector=RankScoreSelector(k=2),
+                    sampler=TPESampler(n_startup=4), random_state=0,
+                    **params)
+
+    def test_budgeted_search(self):
+        """
+        Determine if SearchEnsemble fits n_iter reproducible parameter sets
+        and stacks the top scoring models.
+        """
+        clf = self._get_search(n_iter=10).fit(self.X, self.y)
+        selections, params_list, scores = clf.get_results()
+        self.assertEqual(len(params_list), 10)
+        self.assertEqual(len(scores), 10)
+        self.assertEqual(sorted([scores[i] for i in clf.get_support()]),
+                         sorted(scores)[-2:])
+        self.assertEqual(len(clf.get_base_models()), 2)
+        self.assertEqual(clf.predict_proba(self.X).shape, (150, 2))
+        repeat = self._get_search(n_iter=10).fit(self.X, self.y)
+        self.assertEqual(repeat.params_list_, clf.params_list_)
+
+    def test_time_budget(self):
+        """
+        Determine if the time budget stops the search after the first batch.
+        """
+        clf = self._get_search(n_iter=10, time_budget=0)
+        clf.fit(self.X, self.y)
+        self.assertEqual(len(clf.params_list_), 1)
+        self.assertEqual(len(clf.predict(self.X)), 150)
+
+
+class SlowClassifier(LogisticRegression):
+    """
+    LogisticRegression with slow probability predictions that records the
+    number of samples predicted.
+    """
+    n_predicted = 0
+
+    def predict_proba(self, X):
+        time.sleep(0.01)
+        SlowClassifier.n_predicted += len(X)
+        return super().predict_proba(X)
+
+
+class TestCascade(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings('ignore')
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_cascade(self):
+        """
+        Determine if cascade inference sends only the ambiguous samples to
+        expensive models while staying within tolerance of the full
+        ensemble's predictions on the calibration samples.
+        """
+        X, y = make_classification(n_samples=600, n_features=20,
+                                   n_informative=5, class_sep=2,
+                                   random_state=42)
+        X_train, y_train, X_cal, y_cal = X[:300], y[:300], X[300:], y[300:]
+        clf = Ensemble([SlowClassifier(C=0.1), LogisticRegression(),
+                        KNeighborsClassifier()], SoftVotingClassifier(),
+                       base_predict_methods='predict_proba')
+        clf.fit(X_train, y_train)
+        full_predictions = clf.predict(X_cal)
+        full_probs = clf.predict_proba(X_cal)
+
+        clf.fit_cascade(X_cal, tolerance=0.01)
+        self.assertEqual(clf.cascade_[0][-1], 0)
+        SlowClassifier.n_predicted = 0
+        cascade_predictions = clf.predict(X_cal)
+        self.assertLess(SlowClassifier.n_predicted, 150)
+        self.assertLessEqual(np.mean(cascade_predictions != full_predictions),
+                             0.01)
+
+        clf.fit_cascade(X_cal, tolerance=0)
+        self.assertTrue(np.array_equal(clf.predict(X_cal), full_predictions))
+        clf.cascade_ = (clf.cascade_[0], np.inf)
+        self.assertTrue(np.allclose(clf.predict_proba(X_cal), full_probs))
+
+        clf = Ensemble([LogisticRegression(), KNeighborsClassifier()],
+                       LogisticRegression())
+        clf.fit(X_train, y_train)
+        with self.assertRaises(ValueError):
+            clf.fit_cascade(X_cal)
+
+    def test_swapped_meta_predictor(self):
+        """
+        Determine if swapping the meta-predictor discards the cascade.
+        """
+        X, y = make_classification(n_samples=300, n_features=20,
+                                   n_informative=5, random_state=42)
+        clf = Ensemble([LogisticRegression(), KNeighborsClassifier()],
+                       SoftVotingClassifier(),
+                       base_predict_methods='predict_proba',
+                       cache_meta_features=True)
+        clf.fit(X, y)
+        clf.fit_cascade(X)
+        clf.set_meta_predictor(LogisticRegression())
+        self.assertIsNone(clf.cascade_)
+        self.assertFalse(hasattr(clf, 'cascade_costs_'))
+        self.assertTrue(np.mean(clf.predict(X) == y) > 0.8)
+
+
+class TestVoting(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        probs = rng.random((200, 5, 3))
+        self.probs = probs / probs.sum(axis=2, keepdims=True)
+        self.meta_X = self.probs.reshape(200, 15)
+        self.y = np.array(['a', 'b', 'c'])
+
+    def test_soft_voting(self):
+        """
+        Determine if soft voting averages (or weighted averages) the base
+        classifier probabilities, in chunks and in float32.
+        """
+        clf = SoftVotingClassifier().fit(None, self.y)
+        self.assertTrue(np.allclose(clf.predict_proba(self.meta_X),
+                                    self.probs.mean(axis=1)))
+        weights = [1, 2, 3, 4, 5]
+        clf = SoftVotingClassifier(weights=weights, chunk_size=7)
+        clf.fit(None, self.y)
+        expected = np.average(self.probs, axis=1, weights=weights)
+        self.assertTrue(np.allclose(clf.predict_proba(self.meta_X), expected))
+        self.assertTrue(np.array_equal(clf.predict(self.meta_X),
+                                       self.y[expected.argmax(axis=1)]))
+        probs = clf.predict_proba(self.meta_X.astype(np.float32))
+        self.assertEqual(probs.dtype, np.float32)
+
+        clf = SoftVotingClassifier().fit(None, self.y[:2])
+        probs = clf.predict_proba(self.meta_X[:, :4])
+        self.assertTrue(np.allclose(probs[:, 1],
+                                    self.meta_X[:, :4].mean(axis=1)))
+        self.assertTrue(np.allclose(probs.sum(axis=1), 1))
+
+    def test_hard_voting(self):
+        """
+        Determine if hard voting returns the (weighted) modal class with ties
+        going to the first class.
+        """
+        decisions = self.probs.argmax(axis=2)
+        counts = np.stack([np.sum(decisions == c, axis=1) for c in range(3)],
+                          axis=1)
+        clf = HardVotingClassifier(chunk_size=13).fit(None, self.y)
+        self.assertTrue(np.array_equal(clf.predict(self.meta_X),
+                                       self.y[counts.argmax(axis=1)]))
+
+        weights = [10, 1, 1, 1, 1]
+        clf = HardVotingClassifier(weights=weights).fit(None, self.y)
+        self.assertTrue(np.array_equal(clf.predict(self.meta_X),
+                                       self.y[decisions[:, 0]]))
+
+        clf = HardVotingClassifier().fit(None, self.y[:2])
+        meta_X = np.array([[0.9, 0.8, 0.1], [0.1, 0.2, 0.9], [0.5, 0.5, 0.5]])
+        self.assertTrue(np.array_equal(clf.predict(meta_X),
+                                       ['b', 'a', 'a']))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,142 @@
+import numpy as np
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from sklearn.datasets import make_classification, make_regression
+from sklearn.preprocessing import StandardScaler, MinMaxScaler
+from sklearn.linear_model import LogisticRegression, Ridge
+from sklearn.svm import LinearSVC
+from sklearn.neighbors import KNeighborsClassifier
+
+import pipecaster.transform_wrappers as transform_wrappers
+from pipecaster.multichannel_pipeline import MultichannelPipeline
+from pipecaster.multichannel_pipeline import ChannelConcatenator
+from pipecaster.ensemble_learning import SoftVotingClassifier
+from pipecaster.ensemble_learning import AggregatingRegressor
+from pipecaster.ensemble_learning import ChannelEnsemble
+from pipecaster.ensemble_learning import MultichannelPredictor
+from pipecaster.inference_bundle import load_inference_bundle
+from pipecaster.inference_bundle import get_unsupported_pipes
+
+
+class TestInferenceBundle(unittest.TestCase):
+
+    def setUp(self):
+        X, y = make_classification(n_samples=100, n_features=20,
+                                   n_informative=10, n_classes=3,
+                                   random_state=42)
+        self.Xs = [X[:, :5], X[:, 5:9], None, X[:, 9:]]
+        self.y = np.array(['a', 'b', 'c'])[y]
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _assert_same_outputs(self, clf, Xs, method_names):
+        exported = clf.export_inference_bundle(self.tmp_dir.name, 'bundle')
+        self.assertEqual(set(exported), set(method_names))
+        bundle = load_inference_bundle(self.tmp_dir.name, 'bundle')
+        for method_name in method_names:
+            predictions = getattr(clf, method_name)(Xs)
+            bundle_predictions = getattr(bundle, method_name)(Xs)
+            if method_name == 'predict':
+                self.assertTrue(np.array_equal(bundle_predictions,
+                                               predictions))
+            else:
+                self.assertTrue(np.allclose(bundle_predictions,
+                                            predictions))
+
+    def test_channel_ensemble(self):
+        """
+        Determine if a bundled scaler + ChannelEnsemble pipeline reproduces
+        the pipeline predictions.
+        """
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(StandardScaler())
+        clf.add_layer(ChannelEnsemble(LogisticRegression(),
+                                      SoftVotingClassifier()))
+        clf.fit(self.Xs, self.y)
+        self._assert_same_outputs(clf, self.Xs, ['predict', 'predict_proba'])
+
+    def test_stacked_linear(self):
+        """
+        Determine if a bundle of linear probes, concatenation, and a linear
+        meta-classifier reproduces the pipeline predictions.
+        """
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(MinMaxScaler())
+        clf.add_layer(transform_wrappers.SingleChannel(LinearSVC()))
+        clf.add_layer(ChannelConcatenator())
+        clf.add_layer(1, LogisticRegression())
+        clf.fit(self.Xs, self.y)
+        self._assert_same_outputs(clf, self.Xs,
+                                  ['predict', 'predict_proba',
+                                   'predict_log_proba', 'decision_function'])
+
+    def test_regression(self):
+        """
+        Determine if a bundled regression ensemble reproduces the pipeline
+        predictions.
+        """
+        X, y = make_regression(n_samples=100, n_features=12, random_state=7)
+        Xs = [X[:, :6], X[:, 6:]]
+        clf = MultichannelPipeline(n_channels=2)
+        clf.add_layer(transform_wrappers.SingleChannel(Ridge()))
+        clf.add_layer(MultichannelPredictor(AggregatingRegressor(np.mean)))
+        clf.fit(Xs, y)
+        self._assert_same_outputs(clf, Xs, ['predict'])
+
+    def test_numpy_only(self):
+        """
+        Determine if the generated module imports without scikit-learn.
+        """
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(StandardScaler())
+        clf.add_layer(ChannelEnsemble(LogisticRegression(),
+                                      SoftVotingClassifier()))
+        clf.fit(self.Xs, self.y)
+        clf.export_inference_bundle(self.tmp_dir.name, 'bundle')
+        code = ('import sys; sys.path.insert(0, {}); import bundle; '
+                'assert "sklearn" not in sys.modules; '
+                'assert "pipecaster" not in sys.modules'
+                .format(repr(self.tmp_dir.name)))
+        result = subprocess.run([sys.executable, '-c', code],
+                                cwd=self.tmp_dir.name)
+        self.assertEqual(result.returncode, 0)
+
+    def test_unsupported(self):
+        """
+        Determine if export fails clearly and writes nothing when the
+        pipeline contains unsupported pipes.
+        """
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(StandardScaler())
+        clf.add_layer(ChannelEnsemble(KNeighborsClassifier(),
+                                      SoftVotingClassifier()))
+        clf.fit(self.Xs, self.y)
+        unsupported = get_unsupported_pipes(clf)
+        self.assertEqual([(i, j) for i, j, _ in unsupported], [(1, 0)])
+        with self.assertRaises(NotImplementedError):
+            clf.export_inference_bundle(self.tmp_dir.name, 'bundle')
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_object_labels(self):
+        """
+        Determine if pipes with object dtype class labels are reported as
+        unsupported instead of failing the support check.
+        """
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(MultichannelPredictor(LogisticRegression()))
+        clf.fit(self.Xs, self.y.astype(object))
+        unsupported = get_unsupported_pipes(clf)
+        self.assertEqual([(i, j) for i, j, _ in unsupported], [(0, 0)])
+        with self.assertRaises(NotImplementedError):
+            clf.export_inference_bundle(self.tmp_dir.name, 'bundle')
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
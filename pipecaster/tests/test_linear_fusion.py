@@ -0,0 +1,97 @@
+import numpy as np
+import unittest
+
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from sklearn.linear_model import LogisticRegression, Ridge
+from sklearn.svm import LinearSVC
+from sklearn.neighbors import KNeighborsClassifier
+
+import pipecaster.transform_wrappers as transform_wrappers
+from pipecaster.linear_fusion import get_linear_params
+from pipecaster.multichannel_pipeline import MultichannelPipeline
+from pipecaster.ensemble_learning import Ensemble, ChannelEnsemble
+from pipecaster.ensemble_learning import SoftVotingClassifier
+from pipecaster.ensemble_learning import MultichannelPredictor
+
+
+class TestLinearFusion(unittest.TestCase):
+
+    def setUp(self):
+        X, self.y = make_classification(n_samples=100, n_features=20,
+                                        n_informative=10, n_classes=3,
+                                        random_state=42)
+        self.X = X
+        self.Xs = [X[:, :5], X[:, 5:9], None, X[:, 9:]]
+
+    def test_layer_fusion(self):
+        """
+        Determine if a fused layer of linear probes reproduces the unfused
+        outputs and skips channels without input.
+        """
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(StandardScaler())
+        clf.add_layer(transform_wrappers.SingleChannel(LogisticRegression()))
+        clf.add_layer(MultichannelPredictor(KNeighborsClassifier()))
+        clf.fit(self.Xs, self.y)
+        Xs_scaled = clf.layers[0].transform(self.Xs)
+        Xs_ref = clf.layers[1].transform(Xs_scaled)
+        predictions = clf.predict(self.Xs)
+        clf.fuse_linear_models()
+        self.assertIsNotNone(clf.layers[1].fused_linear_)
+        for X_t, X_ref in zip(clf.layers[1].transform(Xs_scaled), Xs_ref):
+            if X_ref is None:
+                self.assertIsNone(X_t)
+            else:
+                self.assertTrue(np.allclose(X_t, X_ref))
+        self.assertTrue(np.array_equal(clf.predict(self.Xs), predictions))
+
+        Xs = [self.Xs[0], None, None, self.Xs[3]]
+        clf.fit(Xs, self.y)
+        self.assertIsNone(clf.layers[1].fused_linear_,
+                          'fusion was not discarded after refit')
+
+    def test_channel_ensemble_fusion(self):
+        """
+        Determine if a ChannelEnsemble with fused linear base models makes
+        the same predictions as the unfused ensemble.
+        """
+        clf = ChannelEnsemble(LinearSVC(), SoftVotingClassifier(),
+                              base_predict_methods='decision_function')
+        clf.fit(self.Xs, self.y)
+        probs = clf.predict_proba(self.Xs)
+        clf.fuse_linear_models()
+        self.assertEqual(clf.fused_linear_[1], [0, 1, 3])
+        self.assertTrue(np.allclose(clf.predict_proba(self.Xs), probs))
+
+    def test_ensemble_fusion(self):
+        """
+        Determine if a single channel Ensemble of linear regressors makes the
+        same predictions after fusion.
+        """
+        y = self.X @ np.arange(20) + 1.0
+        base_predictors = [Ridge(alpha=a) for a in [0.1, 1.0, 10.0]]
+        clf = Ensemble(base_predictors, Ridge())
+        clf.fit(self.X, y)
+        predictions = clf.predict(self.X)
+        clf.fuse_linear_models()
+        self.assertIsNotNone(clf.fused_linear_)
+        self.assertTrue(np.allclose(clf.predict(self.X), predictions))
+
+    def test_linear_params(self):
+        """
+        Determine if extracted parameters reproduce the wrapper transform and
+        if non-linear models are rejected.
+        """
+        model = transform_wrappers.SingleChannel(LogisticRegression())
+        model.fit(self.X, self.y)
+        coef, intercept = get_linear_params(model)
+        self.assertTrue(np.allclose(self.X @ coef + intercept,
+                                    model.transform(self.X)))
+        model = transform_wrappers.SingleChannel(KNeighborsClassifier())
+        model.fit(self.X, self.y)
+        self.assertIsNone(get_linear_params(model))
+
+
+if __name__ == '__main__':
+    unittest.main()
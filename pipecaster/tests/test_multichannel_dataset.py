@@ -0,0 +1,105 @@
+import os
+import tempfile
+import numpy as np
+import unittest
+
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import KFold
+
+from pipecaster.multichannel_dataset import MultichannelDataset
+from pipecaster.multichannel_pipeline import MultichannelPipeline
+from pipecaster.multichannel_pipeline import ChannelConcatenator
+from pipecaster.ensemble_learning import MultichannelPredictor
+from pipecaster.cross_validation import cross_val_predict
+
+
+class TestMultichannelDataset(unittest.TestCase):
+
+    def setUp(self):
+        X, self.y = make_classification(n_samples=100, n_features=20,
+                                        n_informative=10, random_state=42)
+        self.Xs = [X[:, :5], None, X[:, 5:12], X[:, 12:]]
+
+    def test_channel_views(self):
+        """
+        Determine if channels are views of a single buffer that match the
+        input matrices.
+        """
+        Xs = MultichannelDataset(self.Xs)
+        self.assertEqual(len(Xs), len(self.Xs))
+        for X, X_ref in zip(Xs, self.Xs):
+            if X_ref is None:
+                self.assertIsNone(X)
+            else:
+                self.assertTrue(np.array_equal(X, X_ref))
+                self.assertTrue(np.shares_memory(X, Xs.data))
+        self.assertTrue(isinstance(Xs[1:], MultichannelDataset))
+        self.assertTrue(np.array_equal(Xs[1:][1], self.Xs[2]))
+        self.assertTrue(isinstance(Xs.copy(), list))
+
+    def test_concatenate(self):
+        """
+        Determine if concatenation of adjacent channels is a zero-copy slice
+        and concatenation of non-adjacent channels is correct.
+        """
+        Xs = MultichannelDataset(self.Xs)
+        X_ref = np.concatenate([X for X in self.Xs if X is not None], axis=1)
+        X = Xs.concatenate()
+        self.assertTrue(np.array_equal(X, X_ref))
+        self.assertTrue(np.shares_memory(X, Xs.data))
+
+        X = Xs[::2].concatenate()
+        X_ref = np.concatenate([self.Xs[0], self.Xs[2]], axis=1)
+        self.assertTrue(np.array_equal(X, X_ref))
+
+    def test_get_rows(self):
+        """
+        Determine if row selection is correct and shares memory for
+        contiguous indices.
+        """
+        Xs = MultichannelDataset(self.Xs)
+        Xs_rows = Xs.get_rows(np.arange(10, 20))
+        self.assertTrue(np.shares_memory(Xs_rows.data, Xs.data))
+        indices = np.array([3, 7, 50])
+        Xs_rows = Xs.get_rows(indices)
+        for X, X_ref in zip(Xs_rows, self.Xs):
+            if X_ref is None:
+                self.assertIsNone(X)
+            else:
+                self.assertTrue(np.array_equal(X, X_ref[indices]))
+
+    def test_memory_map(self):
+        """
+        Determine if a memory-mapped dataset reproduces the input matrices.
+        """
+        with tempfile.TemporaryDirectory() as dirname:
+            filename = os.path.join(dirname, 'Xs.dat')
+            Xs = MultichannelDataset(self.Xs, filename=filename)
+            self.assertTrue(isinstance(Xs.data, np.memmap))
+            self.assertTrue(np.array_equal(Xs[2], self.Xs[2]))
+            del Xs
+
+    def test_pipeline_predictions(self):
+        """
+        Determine if pipelines make identical predictions for the list and
+        MultichannelDataset input forms.
+        """
+        cv = KFold(n_splits=3, shuffle=True, random_state=42)
+        predictions = []
+        for Xs in [self.Xs, MultichannelDataset(self.Xs)]:
+            clf = MultichannelPipeline(n_channels=4)
+            clf.add_layer(StandardScaler())
+            clf.add_layer(ChannelConcatenator())
+            clf.add_layer(1, MultichannelPredictor(LogisticRegression()))
+            predictions.append(cross_val_predict(clf, Xs, self.y, cv=cv))
+            clf = MultichannelPipeline(n_channels=4)
+            clf.add_layer(MultichannelPredictor(LogisticRegression()))
+            predictions.append(cross_val_predict(clf, Xs, self.y, cv=cv))
+        self.assertTrue(np.array_equal(predictions[0], predictions[2]))
+        self.assertTrue(np.array_equal(predictions[1], predictions[3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import numpy as np
+import unittest
+
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from sklearn.feature_selection import f_classif
+
+from pipecaster.multichannel_pipeline import MultichannelPipeline
+from pipecaster.multichannel_pipeline import ChannelConcatenator
+from pipecaster.channel_selection import SelectKBestScores
+from pipecaster.ensemble_learning import ChannelEnsemble
+from pipecaster.ensemble_learning import SoftVotingClassifier
+from sklearn.linear_model import LogisticRegression
+
+
+class TransformCountingScaler(StandardScaler):
+    """
+    StandardScaler that records the number of calls to transform().
+    """
+    n_transforms = 0
+
+    def transform(self, X, copy=None):
+        TransformCountingScaler.n_transforms += 1
+        return super().transform(X, copy)
+
+
+class TestFitOutputs(unittest.TestCase):
+
+    def setUp(self):
+        X, self.y = make_classification(n_samples=100, n_features=20,
+                                        n_informative=10, random_state=42)
+        self.Xs = [X[:, :5], X[:, 5:10], None, X[:, 10:]]
+
+    def test_output_mask_from_metadata(self):
+        """
+        Determine if the last layer output mask matches the outputs of
+        transform() for selectors and concatenators.
+        """
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(StandardScaler())
+        clf.add_layer(SelectKBestScores(feature_scorer=f_classif,
+                                        aggregator=np.mean, k=2))
+        clf.fit(self.Xs, self.y)
+        Xs_t = clf.transform(self.Xs)
+        self.assertEqual(clf.layers[-1].output_mask_,
+                         [X is not None for X in Xs_t])
+
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(StandardScaler())
+        clf.add_layer(ChannelConcatenator())
+        clf.fit(self.Xs, self.y)
+        self.assertEqual(clf.layers[-1].output_mask_,
+                         [True, False, False, False])
+
+    def test_single_transform(self):
+        """
+        Determine if pipeline fit_transform() transforms the training data
+        once per model and gives the same outputs as fit().transform().
+        """
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(TransformCountingScaler())
+        TransformCountingScaler.n_transforms = 0
+        Xs_t = clf.fit_transform(self.Xs, self.y)
+        self.assertEqual(TransformCountingScaler.n_transforms, 3)
+        for X_t, X_ref in zip(Xs_t, clf.transform(self.Xs)):
+            if X_ref is None:
+                self.assertIsNone(X_t)
+            else:
+                self.assertTrue(np.array_equal(X_t, X_ref))
+
+        TransformCountingScaler.n_transforms = 0
+        clf.fit(self.Xs, self.y)
+        self.assertEqual(TransformCountingScaler.n_transforms, 0)
+        self.assertEqual(clf.layers[-1].output_mask_,
+                         [True, True, False, True])
+
+
+class TestPredictMethods(unittest.TestCase):
+
+    def test_single_pass(self):
+        """
+        Determine if predict_methods() transforms the inputs once and matches
+        the outputs of the individual prediction methods.
+        """
+        X, y = make_classification(n_samples=100, n_features=20,
+                                   n_informative=10, random_state=42)
+        Xs = [X[:, :5], X[:, 5:10], None, X[:, 10:]]
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(TransformCountingScaler())
+        clf.add_layer(ChannelEnsemble(LogisticRegression(),
+                                      SoftVotingClassifier()))
+        clf.fit(Xs, y)
+        method_names = ['predict', 'predict_proba']
+        TransformCountingScaler.n_transforms = 0
+        predictions = clf.predict_methods(Xs, method_names)
+        self.assertEqual(TransformCountingScaler.n_transforms, 3)
+        self.assertTrue(np.array_equal(predictions['predict'],
+                                       clf.predict(Xs)))
+        self.assertTrue(np.array_equal(predictions['predict_proba'],
+                                       clf.predict_proba(Xs)))
+
+
+if __name__ == '__main__':
+    unittest.main()
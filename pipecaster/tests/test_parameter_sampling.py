@@ -0,0 +1,56 @@
+import numpy as np
+import unittest
+
+from scipy.stats import loguniform, randint, uniform
+
+from pipecaster.parameter_sampling import RandomSampler, TPESampler
+
+
+class TestParameterSampling(unittest.TestCase):
+
+    def setUp(self):
+        self.param_distributions = {'C': loguniform(1e-4, 1e4),
+                                    'n': randint(1, 50),
+                                    'x': uniform(-1, 2),
+                                    'kernel': ['linear', 'rbf', 'poly']}
+
+    def _get_score(self, params):
+        return (-np.abs(np.log10(params['C']) - 2) -
+                np.abs(params['n'] - 10) / 10 - np.abs(params['x']) +
+                (params['kernel'] == 'rbf'))
+
+    def _search(self, sampler, n_iter):
+        random_state = np.random.RandomState(0)
+        params_list, scores = [], []
+        for i in range(n_iter):
+            params = sampler(self.param_distributions, params_list, scores,
+                             random_state)
+            params_list.append(params)
+            scores.append(self._get_score(params))
+        return params_list, scores
+
+    def test_proposals_in_support(self):
+        """
+        Determine if TPE proposals are valid values of the distributions.
+        """
+        params_list, scores = self._search(TPESampler(n_startup=5), 40)
+        for params in params_list:
+            self.assertTrue(1e-4 <= params['C'] <= 1e4)
+            self.assertTrue(1 <= params['n'] < 50)
+            self.assertTrue(isinstance(params['n'], (int, np.integer)))
+            self.assertTrue(-1 <= params['x'] <= 1)
+            self.assertIn(params['kernel'], ['linear', 'rbf', 'poly'])
+
+    def test_tpe_beats_random(self):
+        """
+        Determine if TPE proposals concentrate on high scoring regions.
+        """
+        _, tpe_scores = self._search(TPESampler(n_startup=10), 60)
+        _, random_scores = self._search(RandomSampler(), 60)
+        self.assertGreater(np.mean(tpe_scores[30:]),
+                           np.mean(random_scores[30:]))
+        self.assertGreater(np.max(tpe_scores), np.max(random_scores))
+
+
+if __name__ == '__main__':
+    unittest.main()
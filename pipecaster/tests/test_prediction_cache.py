@@ -0,0 +1,170 @@
+import time
+import numpy as np
+import unittest
+
+from sklearn.datasets import make_classification
+from sklearn.preprocessing import StandardScaler
+from sklearn.linear_model import LogisticRegression
+from sklearn.svm import SVC
+
+from pipecaster.multichannel_pipeline import MultichannelPipeline
+from pipecaster.ensemble_learning import MultichannelPredictor
+from pipecaster.prediction_cache import PredictionCache
+from pipecaster.prediction_cache import get_row_fingerprints
+
+
+class TestPredictionCache(unittest.TestCase):
+
+    def setUp(self):
+        X, self.y = make_classification(n_samples=100, n_features=20,
+                                        n_informative=10, random_state=42)
+        self.Xs = [X[:, :5], None, X[:, 5:12], X[:, 12:]]
+
+    def _get_fitted_pipeline(self):
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(StandardScaler())
+        clf.add_layer(MultichannelPredictor(LogisticRegression()))
+        clf.fit(self.Xs, self.y)
+        return clf
+
+    def test_cached_predictions(self):
+        """
+        Determine if cached predictions match uncached predictions and if
+        repeated rows are served from the cache.
+        """
+        clf = self._get_fitted_pipeline()
+        predictions = clf.predict(self.Xs)
+        probs = clf.predict_proba(self.Xs)
+        clf.enable_prediction_cache(cache_layers=True)
+        self.assertTrue(np.array_equal(predictions, clf.predict(self.Xs)))
+        cache = clf.get_prediction_cache()
+        self.assertEqual(cache.hits, 0)
+
+        # mix of new and repeated rows
+        Xs = [X[40:60] if X is not None else None for X in self.Xs]
+        self.assertTrue(np.array_equal(predictions[40:60], clf.predict(Xs)))
+        self.assertEqual(cache.hits, 20)
+        self.assertTrue(np.allclose(probs, clf.predict_proba(self.Xs)))
+
+        # repeated feature block in one channel reuses the layer cache
+        Xs = [X.copy() if X is not None else None for X in self.Xs]
+        Xs[0] = Xs[0] + 1
+        layer_cache = clf.layers[0].transform_cache_
+        n_hits = layer_cache.hits
+        clf.predict(Xs)
+        self.assertEqual(layer_cache.hits - n_hits, 200)
+
+        clf.fit(self.Xs, self.y)
+        self.assertEqual(len(cache), 0)
+
+    def test_predict_methods(self):
+        """
+        Determine if cached predict_methods() makes a single pipeline pass
+        for all methods and serves repeated rows from the cache.
+        """
+        clf = self._get_fitted_pipeline()
+        ref_predictions = clf.predict_methods(self.Xs,
+                                              ['predict', 'predict_proba'])
+        clf.enable_prediction_cache()
+        n_passes = []
+        predict_methods = clf._predict_methods
+
+        def counting_predict_methods(Xs, method_names):
+            n_passes.append(len(method_names))
+            return predict_methods(Xs, method_names)
+
+        clf._predict_methods = counting_predict_methods
+        predictions = clf.predict_methods(self.Xs,
+                                          ['predict', 'predict_proba'])
+        self.assertEqual(n_passes, [2])
+        for method in ['predict', 'predict_proba']:
+            self.assertTrue(np.array_equal(predictions[method],
+                                           ref_predictions[method]))
+        Xs = [X[40:60] if X is not None else None for X in self.Xs]
+        predictions = clf.predict_methods(Xs, ['predict', 'predict_proba'])
+        self.assertEqual(n_passes, [2])
+        ref_probs = ref_predictions['predict_proba'][40:60]
+        self.assertTrue(np.array_equal(predictions['predict_proba'],
+                                       ref_probs))
+
+    def test_returned_predictions_are_copies(self):
+        """
+        Determine if changing returned predictions leaves the cache intact.
+        """
+        X = np.arange(20, dtype=float).reshape(10, 2)
+        cache = PredictionCache()
+        outputs = cache.apply(lambda X: X * 2, X, 'double')
+        outputs[:] = 0
+        self.assertTrue(np.array_equal(cache.apply(lambda X: X * 2, X,
+                                                   'double'), X * 2))
+        self.assertEqual(cache.hits, 10)
+        entry = cache.apply(lambda X: X * 2, X[:1], 'double')
+        entry[:] = 0
+        self.assertTrue(np.array_equal(cache.apply(lambda X: X * 2, X[:1],
+                                                   'double'), X[:1] * 2))
+
+    def test_eviction(self):
+        """
+        Determine if the cache evicts least recently used rows and expired
+        rows.
+        """
+        X = np.arange(20, dtype=float).reshape(10, 2)
+        cache = PredictionCache(max_size=5)
+        outputs = cache.apply(lambda X: X.sum(axis=1), X, 'sum')
+        self.assertTrue(np.array_equal(outputs, X.sum(axis=1)))
+        self.assertEqual(len(cache), 5)
+        cache.apply(lambda X: X.sum(axis=1), X[5:], 'sum')
+        self.assertEqual(cache.hits, 5)
+        cache.apply(lambda X: X.sum(axis=1), X[:5], 'sum')
+        self.assertEqual(cache.hits, 5)
+
+        cache = PredictionCache(ttl=0.01)
+        cache.apply(lambda X: X.sum(axis=1), X, 'sum')
+        time.sleep(0.02)
+        cache.apply(lambda X: X.sum(axis=1), X, 'sum')
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.hit_rate, 0.0)
+
+    def test_fingerprints(self):
+        """
+        Determine if row fingerprints identify rows across channel layouts
+        and if fingerprinting and fully cached predictions of a large batch
+        are faster than uncached predictions.
+        """
+        X, y = make_classification(n_samples=20000, n_features=20,
+                                   random_state=42)
+        Xs = [X[:, :5], None, X[:, 5:12], X[:, 12:]]
+        fingerprints = get_row_fingerprints(Xs)
+        self.assertEqual(len(set(fingerprints)), len(X))
+        self.assertEqual(get_row_fingerprints([X[10:20, :5], None,
+                                               X[10:20, 5:12], X[10:20, 12:]]),
+                         fingerprints[10:20])
+        self.assertNotEqual(get_row_fingerprints([X[:, :5], X[:, 5:]])[:10],
+                            fingerprints[:10])
+        self.assertNotEqual(get_row_fingerprints([X[:, :5], None, X[:, 5:12],
+                                                  X[:, 12:].astype(np.float32)
+                                                  ])[:10],
+                            fingerprints[:10])
+
+        def get_time(f):
+            times = []
+            for i in range(3):
+                start = time.perf_counter()
+                f()
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        clf = MultichannelPipeline(n_channels=4)
+        clf.add_layer(MultichannelPredictor(SVC()))
+        clf.fit([X[:1000] if X is not None else None for X in Xs], y[:1000])
+        t_uncached = get_time(lambda: clf.predict(Xs))
+        t_fingerprints = get_time(lambda: get_row_fingerprints(Xs))
+        clf.enable_prediction_cache(max_size=len(X))
+        clf.predict(Xs)
+        t_cached = get_time(lambda: clf.predict(Xs))
+        self.assertLess(t_fingerprints, t_uncached / 5)
+        self.assertLess(t_cached, t_uncached)
+
+
+if __name__ == '__main__':
+    unittest.main()
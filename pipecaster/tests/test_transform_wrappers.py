@@ -0,0 +1,191 @@
+import numpy as np
+import unittest
+import warnings
+
+from sklearn.datasets import make_classification, make_regression
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.svm import SVC, SVR
+
+from pipecaster.testing_utils import make_multi_input_classification
+from pipecaster.ensemble_learning import MultichannelPredictor
+import pipecaster.transform_wrappers as transform_wrappers
+
+
+class FitCountingClassifier(LogisticRegression):
+    """
+    LogisticRegression that records the number of samples in each fit.
+    """
+    fit_sizes = []
+
+    def fit(self, X, y, **fit_params):
+        FitCountingClassifier.fit_sizes.append(len(X))
+        return super().fit(X, y, **fit_params)
+
+
+class TestFoldBagging(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings('ignore')
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_single_channel_cls(self):
+        """
+        Determine if SingleChannelCV with bag_folds=True skips the full
+        training set fit, makes the same cv outputs, and averages the fold
+        models at inference.
+        """
+        X, y = make_classification(n_samples=90, n_features=10,
+                                   random_state=42)
+        y = np.array(['a', 'b'])[y]
+        FitCountingClassifier.fit_sizes = []
+        clf = transform_wrappers.SingleChannelCV(FitCountingClassifier(),
+                                                 internal_cv=3,
+                                                 bag_folds=True)
+        X_t = clf.fit_transform(X, y)
+        self.assertEqual(FitCountingClassifier.fit_sizes, [60, 60, 60])
+        self.assertTrue(isinstance(clf.model, transform_wrappers.FoldBag))
+
+        ref_clf = transform_wrappers.SingleChannelCV(LogisticRegression(),
+                                                     internal_cv=3)
+        self.assertTrue(np.allclose(X_t, ref_clf.fit_transform(X, y)))
+        self.assertEqual(clf.score_, ref_clf.score_)
+
+        outputs = [m.decision_function(X) for m in clf.model.models]
+        self.assertTrue(np.allclose(clf.transform(X).ravel(),
+                                    np.mean(outputs, axis=0)))
+        probs = np.mean([m.predict_proba(X) for m in clf.model.models],
+                        axis=0)
+        self.assertTrue(np.allclose(clf.predict_proba(X), probs))
+        self.assertTrue(np.array_equal(clf.predict(X),
+                                       clf.classes_[np.argmax(probs, axis=1)]))
+        self.assertTrue(np.array_equal(clf.get_clone().predict(X),
+                                       clf.predict(X)))
+
+    def test_missing_fold_classes(self):
+        """
+        Determine if bagged decision functions and probabilities align the
+        columns of fold models that did not see every class.
+        """
+        X, y = make_classification(n_samples=90, n_features=10,
+                                   n_informative=5, n_classes=4,
+                                   random_state=42)
+        models = [LogisticRegression().fit(X[y != 3], y[y != 3]),
+                  LogisticRegression().fit(X, y)]
+        bag = transform_wrappers.FoldBag(models,
+                                         np.array(['a', 'b', 'c', 'd']))
+        decisions, probs = np.zeros((90, 4)), np.zeros((90, 4))
+        for m in models:
+            decisions[:, m.classes_] += m.decision_function(X)
+            probs[:, m.classes_] += m.predict_proba(X)
+        decisions /= np.array([2, 2, 2, 1])
+        self.assertTrue(np.allclose(bag.decision_function(X), decisions))
+        self.assertTrue(np.allclose(bag.predict_proba(X), probs / 2))
+
+    def test_single_channel_rgr(self):
+        """
+        Determine if bagged SingleChannelCV regressors predict the mean fold
+        model prediction.
+        """
+        X, y = make_regression(n_samples=90, n_features=10, random_state=42)
+        rgr = transform_wrappers.SingleChannelCV(LinearRegression(),
+                                                 internal_cv=3,
+                                                 bag_folds=True)
+        rgr.fit_transform(X, y)
+        predictions = np.mean([m.predict(X) for m in rgr.model.models],
+                              axis=0)
+        self.assertTrue(np.allclose(rgr.predict(X), predictions))
+
+    def test_multichannel(self):
+        """
+        Determine if MultichannelCV with bag_folds=True keeps the fold models
+        and averages their outputs.
+        """
+        Xs, y, _ = make_multi_input_classification(n_informative_Xs=2,
+                                                   n_random_Xs=1,
+                                                   n_samples=90)
+        clf = transform_wrappers.MultichannelCV(
+                    MultichannelPredictor(LogisticRegression()),
+                    internal_cv=3, bag_folds=True)
+        Xs_t = clf.fit_transform(Xs, y)
+        self.assertEqual(Xs_t[0].shape, (90, 1))
+        self.assertEqual(len(clf.model.models), 3)
+        self.assertEqual(clf.transform_method, 'decision_function')
+        outputs = np.mean([m.decision_function(Xs)
+                           for m in clf.model.models], axis=0)
+        self.assertTrue(np.allclose(clf.transform(Xs)[0].ravel(), outputs))
+
+
+class TestKernelCache(unittest.TestCase):
+
+    def setUp(self):
+        warnings.filterwarnings('ignore')
+
+    def tearDown(self):
+        warnings.resetwarnings()
+
+    def test_single_channel_cls(self):
+        """
+        Determine if SingleChannelCV with a kernel cache matches on-the-fly
+        kernels for cv outputs, scores, and inference.
+        """
+        X, y = make_classification(n_samples=90, n_features=10,
+                                   random_state=42)
+        y = np.array(['a', 'b'])[y]
+        for params in [{'gamma': 0.05},
+                       {'kernel': 'poly', 'degree': 2, 'gamma': 0.1,
+                        'coef0': 1.0},
+                       {'kernel': 'linear'}]:
+            clf = transform_wrappers.SingleChannelCV(SVC(**params),
+                                                     internal_cv=3,
+                                                     kernel_cache=10)
+            ref_clf = transform_wrappers.SingleChannelCV(SVC(**params),
+                                                         internal_cv=3)
+            X_t = clf.fit_transform(X, y)
+            self.assertTrue(isinstance(clf.model,
+                                       transform_wrappers.KernelModel))
+            self.assertTrue(np.allclose(X_t, ref_clf.fit_transform(X, y),
+                                        atol=1e-6))
+            self.assertAlmostEqual(clf.score_, ref_clf.score_)
+            self.assertTrue(np.array_equal(clf.predict(X),
+                                           ref_clf.predict(X)))
+            self.assertTrue(np.array_equal(clf.get_clone().predict(X),
+                                           clf.predict(X)))
+            # only the support vectors are kept for inference
+            support = clf.model.model.support_
+            self.assertLess(len(support), X.shape[0])
+            self.assertTrue(np.array_equal(clf.model.X_fit, X[support]))
+
+    def test_memory_budget(self):
+        """
+        Determine if kernels are computed on the fly when the Gram matrix
+        exceeds the memory budget.
+        """
+        X, y = make_regression(n_samples=90, n_features=10, random_state=42)
+        rgr = transform_wrappers.SingleChannelCV(SVR(), internal_cv=3,
+                                                 kernel_cache=0.01)
+        rgr.fit_transform(X, y)
+        self.assertTrue(isinstance(rgr.model, SVR))
+
+    def test_bagged_folds(self):
+        """
+        Determine if bagged fold models compute kernels against their own
+        training samples.
+        """
+        X, y = make_regression(n_samples=90, n_features=10, random_state=42)
+        rgr = transform_wrappers.SingleChannelCV(SVR(gamma=0.1, C=10),
+                                                 internal_cv=3,
+                                                 bag_folds=True,
+                                                 kernel_cache=10)
+        ref_rgr = transform_wrappers.SingleChannelCV(SVR(gamma=0.1, C=10),
+                                                     internal_cv=3,
+                                                     bag_folds=True)
+        self.assertTrue(np.allclose(rgr.fit_transform(X, y),
+                                    ref_rgr.fit_transform(X, y)))
+        self.assertTrue(np.allclose(rgr.predict(X), ref_rgr.predict(X)))
+        for model in rgr.model.models:
+            self.assertEqual(model.X_fit.shape[0], len(model.model.support_))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,13 +23,21 @@ metapredictor accuracy if the number of training samples is limiting.
     (1992): 241-259.
 """
 
+import copy
 import functools
 import numpy as np
+import scipy.sparse as sp
 from sklearn.metrics import log_loss
+from sklearn.metrics import balanced_accuracy_score, explained_variance_score
+from sklearn.metrics import roc_auc_score
+from sklearn.metrics.pairwise import pairwise_kernels
 
 import pipecaster.utils as utils
 from pipecaster.utils import Cloneable, Saveable
+import pipecaster.parallel as parallel
+import pipecaster.cross_validation as cross_validation
 from pipecaster.cross_validation import cross_val_predict
+from pipecaster.multichannel_dataset import get_rows
 
 # choose methods in this order when generating transform outputs from predictor
 transform_method_precedence = ['decision_function', 'predict_proba',
@@ -145,7 +153,7 @@ class SingleChannel(Cloneable, Saveable):
         return self
 
     def fit(self, X, y=None, **fit_params):
-        self.model = utils.get_clone(self.predictor)
+        self.model = utils.get_clone(self.predictor, copy_on_write=True)
         if y is None:
             self.model.fit(X, **fit_params)
         else:
@@ -167,11 +175,19 @@ class SingleChannel(Cloneable, Saveable):
             raise NameError('prediction method {} not found in {} attributes'
                             .format(method_name, self.model))
 
+    def predict_methods(self, X, method_names):
+        """
+        Predict with several methods of the wrapped model.
+        """
+        if hasattr(self, 'model') is False:
+            raise utils.FitError('prediction attempted before model fitting')
+        return utils.predict_with_methods(self.model, X, method_names)
+
     def transform(self, X):
         if hasattr(self, 'model'):
             if self.transform_method == 'auto':
                 transform_method = get_transform_method(self.model)
-                if transform_methodis None:
+                if transform_method is None:
                     raise NameError('model lacks a recognized method for \
                                     conversion to transformer')
             else:
@@ -196,15 +212,15 @@ class SingleChannel(Cloneable, Saveable):
     def _more_tags(self):
         return {'multichannel': False}
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'classes_'):
             clone.classes_ = self.classes_.copy()
         if hasattr(self, 'model'):
-            clone.model = utils.get_clone(self.model)
+            clone.model = utils.get_fitted_clone(self.model, copy_on_write)
         return clone
 
     def get_descriptor(self, verbose=1):
@@ -212,6 +228,214 @@ class SingleChannel(Cloneable, Saveable):
                                           self.get_params()) + '}tr'
 
 
+class FoldBag:
+    """
+    Average the predictions of the models fit on internal cv splits.
+
+    Used as the final model of SingleChannelCV and MultichannelCV wrappers
+    when bag_folds=True.
+
+    Parameters
+    ----------
+    models : list
+        Models fit on the cv training splits.  Classifiers must have been fit
+        on integer encoded targets.
+    classes : ndarray or None
+        Class labels indexed by the integer encoded targets (classifiers), or
+        None (regressors).
+
+    Notes
+    -----
+    Probabilities are averaged after aligning the columns of models that did
+    not see every class during fitting.  Classifiers predict the class with
+    the highest average probability when probabilities are available, and
+    the most frequent class prediction otherwise.  Regressors predict the
+    mean prediction.
+    """
+
+    def __init__(self, models, classes=None):
+        self.models = models
+        self._estimator_type = utils.detect_predictor_type(models[0])
+        if classes is not None:
+            self.classes_ = classes
+        method_names = set.intersection(
+            *[set(utils.get_predict_methods(m)) for m in models])
+        for method_name in method_names:
+            setattr(self, method_name,
+                    functools.partial(self.predict_with_method,
+                                      method_name=method_name))
+
+    def _predict_proba(self, X):
+        return self._mean_class_outputs(X, 'predict_proba')
+
+    def _mean_class_outputs(self, X, method_name):
+        """
+        Average per-class outputs after scattering the columns of each model
+        into the slots of the classes it saw during fitting.  Classes missing
+        from a model get zero probability, and decision function columns are
+        averaged over the models that saw the class.
+        """
+        all_outputs = [getattr(m, method_name)(X) for m in self.models]
+        if all([o.ndim == 1 for o in all_outputs]):
+            # binary decision functions, which have no per-class columns
+            return np.mean(all_outputs, axis=0)
+        outputs = np.zeros((len(all_outputs[0]), len(self.classes_)))
+        counts = np.zeros(len(self.classes_))
+        for model, model_outputs in zip(self.models, all_outputs):
+            if model_outputs.ndim == 1:
+                raise ValueError('fold models with binary and multiclass '
+                                 '{} outputs can not be averaged'
+                                 .format(method_name))
+            outputs[:, model.classes_] += model_outputs
+            counts[model.classes_] += 1
+        if method_name == 'predict_proba':
+            return outputs / len(self.models)
+        return outputs / np.maximum(counts, 1)
+
+    def predict_with_method(self, X, method_name):
+        if method_name == 'predict_proba':
+            return self._predict_proba(X)
+        elif method_name == 'predict_log_proba':
+            if hasattr(self, 'predict_proba'):
+                return np.log(self._predict_proba(X))
+        elif method_name == 'predict' and utils.is_classifier(self):
+            if hasattr(self, 'predict_proba'):
+                return self.classes_[np.argmax(self._predict_proba(X),
+                                               axis=1)]
+            votes = np.stack([m.predict(X) for m in self.models], axis=1)
+            votes = np.apply_along_axis(np.bincount, 1, votes.astype(int),
+                                        minlength=len(self.classes_))
+            return self.classes_[np.argmax(votes, axis=1)]
+        if utils.is_classifier(self) is False:
+            outputs = [getattr(m, method_name)(X) for m in self.models]
+            return np.mean(outputs, axis=0)
+        return self._mean_class_outputs(X, method_name)
+
+    def get_clone(self, copy_on_write=False):
+        """
+        Get a stateful clone.
+        """
+        classes = getattr(self, 'classes_', None)
+        return FoldBag([utils.get_fitted_clone(m, copy_on_write)
+                        for m in self.models],
+                       classes.copy() if classes is not None else None)
+
+
+def _get_kernel_params(predictor, X):
+    """
+    Get the pairwise_kernels() parameters that compute a predictor's kernel
+    on X, or None if the predictor's kernel can't be precomputed.
+    """
+    if hasattr(predictor, 'get_params') is False:
+        return None
+    params = predictor.get_params()
+    kernel = params.get('kernel', None)
+    if (kernel not in ['linear', 'poly', 'rbf', 'sigmoid'] or
+            params.get('kernel_params', None) is not None):
+        return None
+
+    kernel_params = {'metric': kernel}
+    if kernel != 'linear':
+        gamma = params.get('gamma', None)
+        if gamma == 'scale':
+            if sp.issparse(X):
+                X_var = X.multiply(X).mean() - X.mean() ** 2
+            else:
+                X_var = X.var()
+            gamma = 1.0 / (X.shape[1] * X_var) if X_var != 0 else 1.0
+        elif gamma == 'auto':
+            gamma = 1.0 / X.shape[1]
+        if gamma is not None:
+            kernel_params['gamma'] = gamma
+    if kernel in ['poly', 'sigmoid'] and 'coef0' in params:
+        kernel_params['coef0'] = params['coef0']
+    if kernel == 'poly' and 'degree' in params:
+        kernel_params['degree'] = params['degree']
+    return kernel_params
+
+
+def _fit_predict_kernel_split(predictor, gram, y, train_indices,
+                              test_indices, predict_method_names, fit_params,
+                              return_model=False):
+    """
+    Clone, fit, and predict a kernel predictor with kernel='precomputed' on
+    the rows and columns of a Gram matrix selected by a cv split.
+    """
+    model = utils.get_clone(predictor, copy_on_write=True)
+    fit_params = {} if fit_params is None else fit_params
+    y_train = y[train_indices] if y is not None else None
+    model.fit(gram[np.ix_(train_indices, train_indices)], y_train,
+              **fit_params)
+    split_results = utils.predict_with_methods(
+                        model, gram[np.ix_(test_indices, train_indices)],
+                        predict_method_names)
+    split_results['indices'] = test_indices
+    if return_model is True:
+        split_results['model'] = model
+    return split_results
+
+
+class KernelModel:
+    """
+    Kernel predictor fit on a precomputed Gram matrix.
+
+    Used as the final model of SingleChannelCV wrappers that cache their
+    kernel.  At inference the kernel between the new samples and the
+    training samples is computed, so the wrapped model gets the same kind of
+    input it was fit on.  Models with support vectors (e.g. SVC, SVR) keep
+    only the support vector rows of the training samples and evaluate the
+    kernel against them, as a native kernel model does.  Other models (e.g.
+    KernelRidge) keep all of the training samples.
+
+    Parameters
+    ----------
+    model : predictor
+        Model with kernel='precomputed', fit on the Gram matrix of X_fit.
+    X_fit : ndarray or sparse matrix
+        Training samples.
+    kernel_params : dict
+        Keyword arguments of pairwise_kernels() that compute the kernel.
+    """
+
+    def __init__(self, model, X_fit, kernel_params):
+        self.model = model
+        self.kernel_params = kernel_params
+        self.n_fit_ = X_fit.shape[0]
+        self.support_ = getattr(model, 'support_', None)
+        if self.support_ is None:
+            self.X_fit = X_fit
+        else:
+            self.X_fit = get_rows(X_fit, self.support_)
+        self._estimator_type = utils.detect_predictor_type(model)
+        if hasattr(model, 'classes_'):
+            self.classes_ = model.classes_
+        self._set_predictor_interface()
+
+    def _set_predictor_interface(self):
+        for method_name in utils.get_predict_methods(self.model):
+            setattr(self, method_name,
+                    functools.partial(self.predict_with_method,
+                                      method_name=method_name))
+
+    def predict_with_method(self, X, method_name):
+        gram = pairwise_kernels(X, self.X_fit, **self.kernel_params)
+        if self.support_ is not None:
+            # columns of non-support samples are ignored by the model
+            support_gram = gram
+            gram = np.zeros((support_gram.shape[0], self.n_fit_))
+            gram[:, self.support_] = support_gram
+        return getattr(self.model, method_name)(gram)
+
+    def get_clone(self, copy_on_write=False):
+        """
+        Get a stateful clone.
+        """
+        clone = copy.copy(self)
+        clone.model = utils.get_fitted_clone(self.model, copy_on_write)
+        clone._set_predictor_interface()
+        return clone
+
+
 class SingleChannelCV(SingleChannel):
     """
     Add transformer interface and internal cross validation training to
@@ -255,6 +479,28 @@ class SingleChannelCV(SingleChannel):
             - roc_auc_score for classifiers with {predict_proba,
               predict_log_proba, decision_function}
         - If callable: A scorer with signature: score = scorer(y_true, y_pred).
+    bag_folds : bool, default=False
+        - If True : The models fit on the internal cv training splits are kept
+          and their averaged outputs (see :class:`FoldBag`) are used for
+          inference, so fit_transform() does not fit a model on the entire
+          training set.
+        - If False : A model fit on the entire training set is used for
+          inference.
+    kernel_cache : float or None, default=None
+        - Memory budget in MB for a precomputed kernel (Gram) matrix.  Used
+          with kernel predictors that accept kernel='precomputed' (e.g. SVC,
+          SVR, KernelRidge) and a 'linear', 'poly', 'rbf', or 'sigmoid'
+          kernel.
+        - If float : The n_samples x n_samples Gram matrix of the training
+          samples is computed once by fit_transform() and sliced for the
+          internal cv fold models and the full training set model (shared
+          memory is used when cv_processes > 1).  gamma='scale' is resolved
+          from the full training set rather than from each fold.  If the
+          matrix exceeds the budget, kernels are computed by the predictor.
+          Inference models (see :class:`KernelModel`) keep the support
+          vectors of SVC/SVR-style predictors and all of the training
+          samples of other kernel predictors.
+        - If None : The kernel cache is disabled.
 
     Examples
     --------
@@ -283,6 +529,8 @@ class SingleChannelCV(SingleChannel):
     set and cv splits of the training set. The model fit on the entire dataset
     is stored for futer inference.  The models fit on cv splits are used
     to make the outputs of fit_transform() but are not stored for future use.
+    When bag_folds=True, the model fit on the entire training set is skipped
+    and the models fit on cv splits are stored for future inference instead.
 
     This class uses reflection to expose the predictor methods found in the
     object that it wraps, so the method attributes in a SingleChannelCV
@@ -291,67 +539,125 @@ class SingleChannelCV(SingleChannel):
     """
 
     def __init__(self, predictor, transform_method='auto', internal_cv=5,
-                 cv_processes=1, score_method='auto', scorer='auto'):
+                 cv_processes=1, score_method='auto', scorer='auto',
+                 bag_folds=False, kernel_cache=None):
         self._params_to_attributes(SingleChannelCV.__init__, locals())
         super().__init__(predictor, transform_method)
 
-    def fit_transform(self, X, y=None, groups=None, **fit_params):
-        self.fit(X, y, **fit_params)
+    def _get_gram(self, X):
+        """
+        Get the Gram matrix of X and the kernel parameters, or (None, None) if
+        the kernel cache is disabled, unsupported, or over budget.
+        """
+        if self.kernel_cache is None:
+            return None, None
+        kernel_params = _get_kernel_params(self.predictor, X)
+        if kernel_params is None:
+            return None, None
+        if X.shape[0] ** 2 * 8 > self.kernel_cache * 2 ** 20:
+            return None, None
+        return pairwise_kernels(X, **kernel_params), kernel_params
+
+    def _kernel_cv_predict(self, X, y, groups, gram, kernel_params,
+                           predict_methods, fit_params, return_models):
+        """
+        Get internal cv predictions like cross_val_predict() using slices
+        of a precomputed Gram matrix.
+        """
+        predictor = utils.get_clone(self.predictor).set_params(
+                                                        kernel='precomputed')
+        classes_ = None
+        if self._estimator_type == 'classifier' and y is not None:
+            classes_, y = np.unique(y, return_inverse=True)
+        splits = cross_validation._get_splits(self.predictor, X, y, groups,
+                                              self.internal_cv)
+        args_list = [(predictor, gram, y, train_indices, test_indices,
+                      predict_methods, fit_params, return_models)
+                     for train_indices, test_indices in splits]
+
+        n_processes = 1 if self.cv_processes is None else self.cv_processes
+        if type(n_processes) == int and len(args_list) < n_processes:
+            n_processes = len(args_list)
+        if n_processes == 'max' or n_processes > 1:
+            try:
+                shared_mem_objects = [gram, y, fit_params]
+                shared_mem_objects += [a for split in splits for a in split]
+                split_results = parallel.starmap_jobs(
+                                    _fit_predict_kernel_split, args_list,
+                                    n_cpus=n_processes,
+                                    shared_mem_objects=shared_mem_objects)
+            except Exception as e:
+                print('parallel processing request failed with message {}'
+                      .format(e))
+                print('defaulting to single processor')
+                n_processes = 1
+        if n_processes == 1:
+            split_results = (_fit_predict_kernel_split(*args)
+                             for args in args_list)
+
+        results = cross_validation._combine_split_results(
+                            split_results, predict_methods, classes_,
+                            True, return_models, X.shape[0])
+        if return_models is True:
+            predictions, models = results
+            models = [KernelModel(m, get_rows(X, train_indices),
+                                  kernel_params)
+                      for m, (train_indices, _) in zip(models, splits)]
+            return predictions, models
+        return results
+
+    def _get_cv_methods(self, reference):
+        """
+        Get the prediction methods for internal cv (transform method first,
+        then the score method if it differs) and the scorer.
+        """
+        if self.score_method == 'auto':
+            score_method = get_score_method(reference)
+            if score_method is None:
+                raise NameError('model lacks a recognized method for '
+                                'making scorable predictions.')
+        else:
+            score_method = self.score_method
+
+        if self.scorer == 'auto':
+            if utils.is_regressor(reference):
+                scorer = explained_variance_score
+            elif score_method == 'predict':
+                scorer = balanced_accuracy_score
+            elif score_method in ['predict_proba', 'decision_function',
+                                  'predict_log_proba']:
+                scorer = roc_auc_score
+        else:
+            scorer = self.scorer
 
-        # internal cv training is disabled
-        if (self.internal_cv is None or
-                (type(self.internal_cv) == int and self.internal_cv < 2)):
-            X_t = self.transform(X)
-        # internal cv training is enabled
+        if self.transform_method == 'auto':
+            transform_method = get_transform_method(reference)
+            if transform_method is None:
+                raise NameError('model lacks a recognized method for \
+                                conversion to transformer')
         else:
-            if self.score_method == 'auto':
-                score_method = get_score_method(self.model)
-                if score_method is None:
-                    raise NameError('model lacks a recognized method for '
-                                    'making scorable predictions.')
-            else:
-                score_method = self.score_method
-
-            if self.scorer == 'auto':
-                if utils.is_regressor(self.model):
-                    scorer = explained_variance_score
-                else if score_method is 'predict':
-                    scorer = balanced_accuracy_score
-                elif score_method in ['predict_proba', 'decision_function'
-                                           'predict_log_proba']:
-                    scorer = roc_auc_score
-            else:
-                scorer = self.scorer
+            transform_method = self.transform_method
 
-            if self.transform_method == 'auto':
-                transform_method = get_transform_method(self.model)
-                if transform_methodis None:
-                    raise NameError('model lacks a recognized method for \
-                                    conversion to transformer')
-            else:
-                transform_method = self.transform_method
+        predict_methods = [transform_method]
+        if score_method != transform_method:
+            predict_methods.append(score_method)
+        return predict_methods, scorer
 
-            predict_methods = [transform_method]
-            if score_method != transform_method:
-                predict_methods.append(score_method)
-
-            preds = cross_val_predict(self.predictor, X, y, groups=groups,
-                                    predict_methods=predict_methods,
-                                    cv=self.internal_cv, combine_splits=True,
-                                    n_processes=self.cv_processes,
-                                    fit_params=fit_params)
-
-            if self.transform_method in ['predict_proba',
-                                              'predict_log_proba']:
-                y_pred = [utils.classify_sample(p) for p in X_t]
-                if self.scorer is None:
-                    self.score_ = -log_loss(y, X_t)
-                else:
-                    self.score_ = self.scorer(y, y_pred)
-            if self.transform_method == 'decision_function':
-                self.score_ = self.scorer(y, utils.classify_samples(X_t))
-            else:
-                self.score_ = self.scorer(y, X_t)
+    def _set_cv_outputs(self, y, predictions, predict_methods, scorer):
+        """
+        Score the internal cv predictions and get the transform outputs.
+        """
+        if len(predict_methods) == 1:
+            predictions = {predict_methods[0]: predictions}
+        score_method = predict_methods[-1]
+
+        X_t = predictions[predict_methods[0]]
+        y_pred = predictions[score_method]
+        # drop redundant prob output from binary classifiers:
+        if (score_method in ['predict_proba', 'predict_log_proba'] and
+                len(y_pred.shape) == 2 and y_pred.shape[1] == 2):
+            y_pred = y_pred[:, 1]
+        self.score_ = scorer(y, y_pred)
 
         # convert output array to output matrix:
         if len(X_t.shape) == 1:
@@ -359,11 +665,63 @@ class SingleChannelCV(SingleChannel):
 
         # drop the redundant prob output from binary classifiers:
         elif (len(X_t.shape) == 2 and X_t.shape[1] == 2 and
-              utils.is_classifier(self.model)):
+              self._estimator_type == 'classifier'):
             X_t = X_t[:, 1].reshape(-1, 1)
 
         return X_t
 
+    def fit_transform(self, X, y=None, groups=None, **fit_params):
+        use_cv = (self.internal_cv is not None and
+                  (type(self.internal_cv) != int or self.internal_cv >= 2))
+        bag_folds = use_cv and self.bag_folds is True
+        gram, kernel_params = self._get_gram(X) if use_cv else (None, None)
+        if bag_folds is False and gram is None:
+            self.fit(X, y, **fit_params)
+        elif bag_folds is False:
+            # the full training set model reuses the cached kernel
+            model = utils.get_clone(self.predictor).set_params(
+                                                        kernel='precomputed')
+            model.fit(gram, y, **fit_params)
+            self.model = KernelModel(model, X, kernel_params)
+            if self._estimator_type == 'classifier':
+                self.classes_ = self.model.classes_
+            self._set_predictor_interface(
+                utils.get_predict_methods(self.model))
+
+        # internal cv training is disabled
+        if use_cv is False:
+            return self.transform(X)
+
+        # internal cv training is enabled
+        # prediction methods are picked before fitting if there is no full
+        # training set model
+        reference = self.predictor if bag_folds else self.model
+        predict_methods, scorer = self._get_cv_methods(reference)
+        if gram is None:
+            predictions = cross_val_predict(
+                                self.predictor, X, y, groups=groups,
+                                predict_methods=predict_methods,
+                                cv=self.internal_cv, combine_splits=True,
+                                n_processes=self.cv_processes,
+                                fit_params=fit_params,
+                                return_models=bag_folds)
+        else:
+            predictions = self._kernel_cv_predict(
+                                X, y, groups, gram, kernel_params,
+                                predict_methods, fit_params, bag_folds)
+        del gram
+        if bag_folds is True:
+            predictions, models = predictions
+            classes = (np.unique(y) if self._estimator_type == 'classifier'
+                       else None)
+            self.model = FoldBag(models, classes)
+            if classes is not None:
+                self.classes_ = classes
+            self._set_predictor_interface(
+                utils.get_predict_methods(self.model))
+
+        return self._set_cv_outputs(y, predictions, predict_methods, scorer)
+
     def _more_tags(self):
         return {'multichannel': False}
 
@@ -371,6 +729,15 @@ class SingleChannelCV(SingleChannel):
         return '{' + utils.get_descriptor(self.predictor, verbose,
                                           self.get_params()) + '}cvtr'
 
+    def get_clone(self, copy_on_write=False):
+        """
+        Get a stateful clone.
+        """
+        clone = super().get_clone(copy_on_write)
+        if hasattr(self, 'score_'):
+            clone.score_ = self.score_
+        return clone
+
 
 class Multichannel(Cloneable, Saveable):
     """
@@ -445,7 +812,8 @@ class Multichannel(Cloneable, Saveable):
                 delattr(self, method_name)
 
     def fit(self, Xs, y=None, **fit_params):
-        self.model = utils.get_clone(self.multichannel_predictor)
+        self.model = utils.get_clone(self.multichannel_predictor,
+                                     copy_on_write=True)
         if y is None:
             self.model.fit(Xs, **fit_params)
         else:
@@ -462,6 +830,14 @@ class Multichannel(Cloneable, Saveable):
         prediction_method = getattr(self.model, method_name)
         return prediction_method(Xs)
 
+    def predict_methods(self, Xs, method_names):
+        """
+        Predict with several methods of the wrapped model.
+        """
+        if hasattr(self, 'model') is False:
+            raise utils.FitError('prediction attempted before call to fit()')
+        return utils.predict_with_methods(self.model, Xs, method_names)
+
     def transform(self, Xs):
         if hasattr(self, 'model') is False:
             raise FitError('transform attempted before call to fit()')
@@ -483,19 +859,25 @@ class Multichannel(Cloneable, Saveable):
         self.fit(Xs, y, **fit_params)
         return self.transform(Xs)
 
+    def get_output_mask(self, Xs):
+        """
+        Get a list of bools indicating which channels output a matrix.
+        """
+        return [i == 0 for i, X in enumerate(Xs)]
+
     def get_descriptor(self, verbose=1):
         return '{' + utils.get_descriptor(self.multichannel_predictor, verbose,
                                           self.get_params()) + '}tr'
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'classes_'):
             clone.classes_ = self.classes_.copy()
         if hasattr(self, 'model'):
-            clone.model = utils.get_clone(self.model)
+            clone.model = utils.get_fitted_clone(self.model, copy_on_write)
         return clone
 
 
@@ -535,6 +917,13 @@ class MultichannelCV(Multichannel):
         Expected pattern: score = scorer(y_true, y_pred). The cross validation
         score is exposed through creation of a score_ attribute during calls to
         fit_transform().
+    bag_folds : bool, default=False
+        - If True : The models fit on the internal cv training splits are kept
+          and their averaged outputs (see :class:`FoldBag`) are used for
+          inference, so fit_transform() does not fit a model on the entire
+          training set.
+        - If False : A model fit on the entire training set is used for
+          inference.
 
     Examples
     --------
@@ -563,6 +952,8 @@ class MultichannelCV(Multichannel):
     set and cv splits of the training set. The model fit on the entire dataset
     is stored for future inferences.  The models fit on cv splits are used
     to make the outputs of fit_transform() but are not stored for future use.
+    When bag_folds=True, the model fit on the entire training set is skipped
+    and the models fit on cv splits are stored for future inference instead.
 
     This class uses reflection to expose the predictor methods found in the
     object that it wraps, so the method attributes in a MultichannelCV
@@ -571,7 +962,8 @@ class MultichannelCV(Multichannel):
     """
 
     def __init__(self, multichannel_predictor, transform_method='auto',
-                 internal_cv=5, cv_processes=1, scorer=None):
+                 internal_cv=5, cv_processes=1, scorer=None,
+                 bag_folds=False):
         internal_cv = 5 if internal_cv is None else internal_cv
         self._params_to_attributes(MultichannelCV.__init__, locals())
         super().__init__(multichannel_predictor, transform_method)
@@ -581,21 +973,34 @@ class MultichannelCV(Multichannel):
         if y is not None and utils.is_classifier(self):
             self.classes_, y = np.unique(y, return_inverse=True)
 
-        self.fit(Xs, y, **fit_params)
+        use_cv = (self.internal_cv is not None and
+                  (type(self.internal_cv) != int or self.internal_cv >= 2))
+        bag_folds = use_cv and self.bag_folds is True
+        if bag_folds is False:
+            self.fit(Xs, y, **fit_params)
 
         # internal cv training is disabled
-        if (self.internal_cv is None or
-                (type(self.internal_cv) == int and self.internal_cv < 2)):
+        if use_cv is False:
             Xs_t = self.transform(Xs)
         # internal cv training is enabled
         else:
             predictions = cross_val_predict(
                                   self.multichannel_predictor, Xs, y,
                                   groups=groups,
-                                  predict_method=self.transform_method,
+                                  predict_methods=self.transform_method,
                                   cv=self.internal_cv, combine_splits=True,
                                   n_processes=self.cv_processes,
-                                  fit_params=fit_params)
+                                  fit_params=fit_params,
+                                  return_models=bag_folds)
+            if bag_folds is True:
+                # targets are already encoded, as for the full training set
+                # model
+                predictions, models = predictions
+                classes = (np.arange(len(self.classes_))
+                           if utils.is_classifier(self) else None)
+                self.model = FoldBag(models, classes)
+                self._set_predictor_interface(
+                    utils.get_predict_methods(self.model))
 
             Xs_t = [None for X in Xs]
 
@@ -604,15 +1009,15 @@ class MultichannelCV(Multichannel):
                 Xs_t[0] = predictions.reshape(-1, 1)
             # drop the redundant prob output from binary classifiers:
             elif (len(predictions.shape) == 2 and predictions.shape[1] == 2
-                  and utils.is_classifier(self.model)):
+                  and utils.is_classifier(self)):
                 Xs_t[0] = predictions[:, 1].reshape(-1, 1)
             else:
                 Xs_t[0] = predictions
 
             if self.scorer is not None:
                 if utils.is_classifier(self) and len(predictions.shape) > 1:
-                    predictions = util.classify_samples(predictions,
-                                                        self.classes_)
+                    # targets are encoded as class indices
+                    predictions = np.argmax(predictions, axis=1)
                 self.score_ = self.scorer(y, predictions)
 
         return Xs_t
@@ -621,11 +1026,11 @@ class MultichannelCV(Multichannel):
         return '{' + utils.get_descriptor(self.multichannel_predictor, verbose,
                                           self.get_params()) + '}cvtr'
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         """
         Get a stateful clone.
         """
-        clone = super().get_clone()
+        clone = super().get_clone(copy_on_write)
         if hasattr(self, 'score_'):
             clone.score_ = self.score_
         return clone
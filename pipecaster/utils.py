@@ -6,6 +6,7 @@ estimator/transformer or estimator/predictor interfaces, or multichannel
 analog of these interfaces.
 """
 
+import copy
 import numpy as np
 from inspect import signature, getfullargspec
 import sklearn.base
@@ -14,8 +15,9 @@ import ray
 
 __all__ = ['is_classifier', 'is_regressor', 'is_predictor', 'is_transformer',
            'detect_predictor_type', 'is_multichannel',
-           'get_clone', 'get_sklearn_clone', 'get_clones',
+           'get_clone', 'get_sklearn_clone', 'get_clones', 'get_fitted_clone',
            'save_pipe', 'load_pipe', 'get_predict_methods',
+           'predict_with_methods', 'get_output_mask',
            'is_predictor', 'FitError', 'PredictError',
            'ParallelBackendError', 'get_descriptor', 'get_param_names',
            'get_param_clone', 'Cloneable', 'Saveable', 'encode_labels',
@@ -26,7 +28,7 @@ recognized_pred_methods = set(['predict', 'predict_proba',
                                'decision_function', 'predict_log_proba'])
 
 
-def get_clone(pipe, stateless=False):
+def get_clone(pipe, stateless=False, copy_on_write=False):
     """
     Get a new copy of a pipe instance.
 
@@ -38,6 +40,11 @@ def get_clone(pipe, stateless=False):
           scikit-learn stateless clone sklearn.base.clone(pipe).
         - If True: Force scikit-learn stateless clone:
           sklearn.base.clone(pipe).
+    copy_on_write : bool, default=False
+        - If False: Fitted sub-models are cloned recursively.
+        - If True: Fitted sub-models are shared by reference between the pipe
+          and its clone.  The cost of cloning a fitted pipe is proportional
+          to the number of components rather than the size of the models.
 
     Returns
     -------
@@ -47,13 +54,51 @@ def get_clone(pipe, stateless=False):
     -----
     Custom cloning with get_clone() class methods has been introduced in
     pipecaster to enable neural net warm starts.
+
+    Copy-on-write clones are safe because pipecaster never modifies a fitted
+    model in place: calls to fit() replace fitted sub-models with new
+    instances, so refitting either the pipe or its clone breaks the sharing
+    without affecting the other copy.  Fitted sub-models obtained from a
+    copy-on-write clone (e.g. with get_model()) should not be refit directly.
     """
     if hasattr(pipe, 'get_clone') and stateless is False:
-        return pipe.get_clone()
+        if (copy_on_write is True and
+                'copy_on_write' in signature(pipe.get_clone).parameters):
+            return pipe.get_clone(copy_on_write=True)
+        else:
+            return pipe.get_clone()
     else:
         return sklearn.base.clone(pipe)
 
 
+def get_fitted_clone(model, copy_on_write=False):
+    """
+    Get a copy of a fitted sub-model for a stateful clone.
+
+    Parameters
+    ----------
+    model : pipe instance or None
+        Fitted model stored as state by a pipecaster component.
+    copy_on_write : bool, default=False
+        - If False: Return a stateful copy of the model made with its
+          get_clone() method or with copy.deepcopy() for models that lack
+          one (e.g. fitted scikit-learn estimators).
+        - If True: Return the model itself (shared by reference).
+
+    Returns
+    -------
+    Copy of the model, the model itself, or None.
+    """
+    if model is None:
+        return None
+    elif copy_on_write is True:
+        return model
+    elif hasattr(model, 'get_clone'):
+        return model.get_clone()
+    else:
+        return copy.deepcopy(model)
+
+
 def get_sklearn_clone(pipe):
     """
     Get a scikit-learn style stateless parameter clone of a pipe.
@@ -189,6 +234,67 @@ def get_predict_methods(pipe):
     return [m for m in recognized_pred_methods if hasattr(pipe, m)]
 
 
+def predict_with_methods(pipe, Xs, method_names):
+    """
+    Make predictions with several prediction methods of a fit pipe.
+
+    Pipes with a predict_methods() method (e.g. MultichannelPipeline and the
+    ensembles) compute their intermediate results once and evaluate all of
+    the requested methods on them.  Other pipes are called once per method.
+
+    Parameters
+    ----------
+    pipe : fit pipe instance
+        Single channel or multichannel predictor.
+    Xs : ndarray or list
+        Feature matrix, or list of feature matrices and None placeholders for
+        multichannel pipes.
+    method_names : list of str
+        Names of the prediction methods to call.
+
+    Returns
+    -------
+    dict
+        Predictions indexed by method name.
+    """
+    if hasattr(pipe, 'predict_methods'):
+        return pipe.predict_methods(Xs, method_names)
+    else:
+        return {m: getattr(pipe, m)(Xs) for m in method_names}
+
+
+def get_output_mask(model, Xs):
+    """
+    Determine which channels receive a transform output from a fit model.
+
+    Parameters
+    ----------
+    model : fit pipe instance
+    Xs : list
+        Multichannel input (or None placeholders) that the model would
+        transform.
+
+    Returns
+    -------
+    List of bools, one per input channel, for multichannel models or a single
+    bool for single channel models.
+
+    Notes
+    -----
+    The mask is taken from the model's get_output_mask() method when
+    available so that the training set does not have to be transformed to
+    inspect the locations of None outputs.  Single channel models always
+    produce an output.  Other multichannel models fall back on calling
+    transform().
+    """
+    if is_multichannel(model) is False:
+        return True
+    elif hasattr(model, 'get_output_mask'):
+        return model.get_output_mask(Xs)
+    else:
+        return [X_t is not None for X_t in model.transform(Xs)]
+
+
 def save_pipe(pipe, filepath):
     """
     Save a pipe to disk.
@@ -309,10 +415,14 @@ class Cloneable:
         get_clone() method in derived classes, e.g.:
         ::
 
-            def get_clone(self):
-                clone = super().get_clone()
+            def get_clone(self, copy_on_write=False):
+                clone = super().get_clone(copy_on_write)
                 clone.my_list = my_list.copy()
+                clone.model = get_fitted_clone(self.model, copy_on_write)
                 return clone
+
+    Fitted sub-models should be copied with get_fitted_clone() so that
+    copy-on-write clones share them by reference.
     """
 
     @property
@@ -334,7 +444,7 @@ class Cloneable:
                 raise AttributeError('invalid parameter name')
         return self
 
-    def get_clone(self):
+    def get_clone(self, copy_on_write=False):
         clone = get_param_clone(self)
         return clone
 